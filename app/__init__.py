@@ -6,17 +6,26 @@ and configures the Flask application instance with all necessary extensions
 and configurations.
 """
 
-from flask import Flask
+import time
+import uuid
+from flask import Flask, Response, g
 from app.extensions import db, migrate, limiter
 from app.api import finance_bp
-from app.api import finance_bp
+from app.services.export_jobs import export_jobs
+from app.services.response_cache import response_cache
+from app.cli import register_commands
 import os
 from flask import request
-from app.utils.logger import logger
+from app.utils.logger import log_request
+from app.utils import metrics
+from app.utils.profiling import request_profiler
+from app.utils.json_provider import FastJSONProvider
+from app.utils.rate_limits import load_limits
 from flask import jsonify
 
 def create_app():
     app = Flask(__name__)
+    app.json = FastJSONProvider(app)
 
     # rate limit exceeded handler
     @app.errorhandler(429)
@@ -27,24 +36,59 @@ def create_app():
             "error": "Too many requests"
         }), 429
 
-    # Logging middleware
+    # Request logging: one structured record per request, written by the
+    # background listener; successful requests can be sampled. The same
+    # timings feed the /metrics histograms.
     @app.before_request
-    def log_request_info():
-        logger.info(f"Incoming request: {request.method} {request.url}")
+    def start_request_timer():
+        g.request_id = request.headers.get('X-Request-ID') or uuid.uuid4().hex
+        g.request_started = time.perf_counter()
+        if app.config['METRICS_ENABLED']:
+            metrics.start_request(request.url_rule.rule if request.url_rule else 'unmatched')
 
-    # Response logging
     @app.after_request
     def log_response_info(response):
-        logger.info(f"Response status: {response.status}")
+        started = g.pop('request_started', None)
+        if started is None:
+            return response
+        elapsed = time.perf_counter() - started
+        route = request.url_rule.rule if request.url_rule else None
+        if app.config['METRICS_ENABLED']:
+            metrics.finish_request(request.method, route or 'unmatched', response.status_code, elapsed)
+        response.headers['X-Request-ID'] = g.request_id
+        log_request(request.method, request.path, route, response.status_code, elapsed * 1000, g.request_id,
+                    app.config['LOG_SAMPLE_RATE'], app.config['LOG_SLOW_MS'])
         return response
 
     # Database Config
     app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///financeai.db')
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config['SUMMARY_USE_ROLLUPS'] = os.getenv('SUMMARY_USE_ROLLUPS', 'True').lower() == 'true'
+    app.config['BULK_CHUNK_SIZE'] = int(os.getenv('BULK_CHUNK_SIZE', 1000))
+    app.config['BULK_MAX_ROWS'] = int(os.getenv('BULK_MAX_ROWS', 100000))
+
+    # Rate limiting: counter storage shared by all workers, algorithm, and per-endpoint limits
+    app.config['RATELIMIT_STORAGE_URI'] = os.getenv('RATELIMIT_STORAGE_URI', 'memory://')
+    app.config['RATELIMIT_STRATEGY'] = os.getenv('RATELIMIT_STRATEGY', 'sliding-window-counter')
+    app.config['RATELIMITS'] = load_limits()
+
+    # Request logging: fraction of successful requests logged; errors and
+    # requests slower than LOG_SLOW_MS are always logged
+    app.config['LOG_SAMPLE_RATE'] = float(os.getenv('LOG_SAMPLE_RATE', 1.0))
+    app.config['LOG_SLOW_MS'] = float(os.getenv('LOG_SLOW_MS', 1000))
+
+    # Metrics: per-route latency, in-flight requests, queries per request and
+    # export sizes, served in Prometheus text format at /metrics
+    app.config['METRICS_ENABLED'] = os.getenv('METRICS_ENABLED', 'True').lower() == 'true'
+    if app.config['METRICS_ENABLED']:
+        metrics.install_query_hooks()
 
     # Init extensions
     db.init_app(app)
     migrate.init_app(app, db)
+    export_jobs.init_app(app)
+    response_cache.init_app(app)
+    request_profiler.init_app(app)
 
     # Conditionally disable limiter in development
     if os.getenv("FLASK_ENV") == "development":
@@ -55,6 +99,9 @@ def create_app():
     # Register blueprints
     app.register_blueprint(finance_bp, url_prefix='/api/v1')
 
+    # Register CLI commands
+    register_commands(app)
+
      # Health check endpoint
     @app.route('/health')
     def health_check():
@@ -65,4 +112,10 @@ def create_app():
             'version': '0.3.0'
         }, 200
 
+    if app.config['METRICS_ENABLED']:
+        @app.route('/metrics')
+        def metrics_endpoint():
+            """Request, database and export metrics in Prometheus text format"""
+            return Response(metrics.registry.render(), content_type=metrics.CONTENT_TYPE)
+
     return app
@@ -0,0 +1,231 @@
+"""
+Async Transaction API Routes
+
+Async versions of the read-heavy endpoints: listing, summary and export.
+They run on an async SQLAlchemy engine, so a request that is waiting on the
+database, or on a slow client draining a long export, does not hold a worker
+thread. Queries and serialization are the same service functions the Flask
+views use, run with AsyncConnection.run_sync.
+
+Requests these views do not handle (the Arrow/Parquet formats) are left to
+the Flask app; the serves_* predicates say which is which, and app.asgi
+combines the two.
+"""
+
+import asyncio
+import time
+from functools import wraps
+from starlette.responses import Response, StreamingResponse
+from app.api.conditional import is_not_modified, ledger_etag, request_cache_key, validator_headers
+from app.services import columnar, ledger
+from app.services.response_cache import CachedResponse, response_cache
+from app.services.exports import (DEFAULT_BATCH_SIZE, ExportTotals, CSVExportWriter, aiter_export_rows,
+                                  render_pdf)
+from app.services.serialization import listing_rows, serialize_rows
+from app.services.summary import compute_summary
+from app.utils import metrics
+from app.utils.logger import logger
+from app.utils.pagination import parse_page_params
+from app.utils.response import json_response
+from app.utils.validators import parse_filter_params, ValidationError
+
+
+def serves_listing(request):
+    """Return True unless the listing asks for a columnar format"""
+    accept = request.headers.get('accept', '')
+    return not (request.query_params.get('format', '').lower() in columnar.COLUMNAR_FORMATS
+                or any(mimetype in accept for mimetype in columnar.COLUMNAR_FORMATS.values()))
+
+
+def serves_export(request):
+    """Return True for csv and pdf exports"""
+    return request.query_params.get('format', 'pdf').lower() in ('csv', 'pdf')
+
+
+def conditional_on_ledger(view):
+    """Async counterpart of app.api.conditional.conditional_on_ledger for view methods"""
+
+    @wraps(view)
+    async def wrapper(views, request):
+        async with views.engine.connect() as conn:
+            state = await conn.run_sync(ledger.current)
+        if state is None:
+            return await view(views, request)
+        tag = request.state.ledger_tag = ledger_etag(state, request.headers.get('accept'))
+        if is_not_modified(tag, state, request.headers):
+            return Response(status_code=304, headers=validator_headers(tag, state))
+        response = await view(views, request)
+        if response.status_code == 200:
+            response.headers.update(validator_headers(tag, state))
+        return response
+
+    return wrapper
+
+
+def cached_response(endpoint, paginated=False):
+    """Async counterpart of app.api.conditional.cached_response; shares its cache entries"""
+
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(views, request):
+            tag = getattr(request.state, 'ledger_tag', None)
+            if tag is None or not response_cache.enabled:
+                return await view(views, request)
+            try:
+                key = request_cache_key(endpoint, tag, request.query_params, paginated)
+            except ValidationError:
+                return await view(views, request)
+            entry = await _cache_call(response_cache.get, endpoint, key)
+            if entry is not None:
+                return Response(entry.body, headers=dict(entry.headers), media_type=entry.content_type)
+            response = await view(views, request)
+            if response.status_code == 200 and not isinstance(response, StreamingResponse):
+                await _cache_call(response_cache.set, key,
+                           CachedResponse(response.headers['content-type'], [], bytes(response.body)))
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+async def _cache_call(func, *args):
+    # The shared tier is a blocking client, so it is used off the event loop
+    if response_cache.shared is not None:
+        return await asyncio.to_thread(func, *args)
+    return func(*args)
+
+
+async def _next_batch(rows, size):
+    batch = []
+    async for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            break
+    return batch
+
+
+def _iter_from_loop(rows, loop, batch_size=DEFAULT_BATCH_SIZE):
+    """Iterate an async iterator from a worker thread, fetching each batch on the event loop"""
+    while True:
+        batch = asyncio.run_coroutine_threadsafe(_next_batch(rows, batch_size), loop).result()
+        yield from batch
+        if len(batch) < batch_size:
+            return
+
+
+class AsyncTransactionViews:
+    """
+    Async listing, summary and export views bound to an AsyncEngine
+
+    Args:
+        engine: SQLAlchemy AsyncEngine for the application database
+        json_provider: The Flask app's JSON provider, so bodies match the sync API
+        use_rollups (bool): Serve summaries from daily rollups when possible
+    """
+
+    def __init__(self, engine, json_provider, use_rollups=True):
+        self.engine = engine
+        self.json = json_provider
+        self.use_rollups = use_rollups
+
+    def respond(self, reply, headers=None):
+        """Render a json_response() tuple the way the Flask app does"""
+        body, status_code = reply
+        return Response(f"{self.json.dumps(body, separators=(',', ':'))}\n", status_code=status_code,
+                        media_type='application/json', headers=headers)
+
+    @conditional_on_ledger
+    @cached_response('listing', paginated=True)
+    async def get_transactions(self, request):
+        """Async GET /transactions (JSON only; same parameters and response)"""
+        try:
+            filters = parse_filter_params(request.query_params)
+            page = parse_page_params(request.query_params)
+
+            async with self.engine.connect() as conn:
+                rows, next_cursor = await conn.run_sync(listing_rows, filters, page)
+                result = await conn.run_sync(serialize_rows, rows)
+
+            meta = {'count': len(result)}
+            if page is not None:
+                meta['next_cursor'] = next_cursor
+            return self.respond(json_response(True, f"Retrieved {len(result)} transactions", data=result,
+                                              status_code=200, meta=meta))
+
+        except ValidationError as e:
+            return self.respond(json_response(False, "Invalid query parameters", error=e.message,
+                                              details=e.errors, status_code=400))
+        except Exception as e:
+            return self.respond(json_response(False, "Failed to retrieve transactions", error=str(e),
+                                              status_code=500))
+
+    @conditional_on_ledger
+    @cached_response('summary')
+    async def get_transactions_summary(self, request):
+        """Async GET /transactions/summary"""
+        try:
+            filters = parse_filter_params(request.query_params)
+
+            async with self.engine.connect() as conn:
+                summary = await conn.run_sync(
+                    lambda sync_conn: compute_summary(filters, connection=sync_conn, use_rollups=self.use_rollups)
+                )
+
+            if not summary['total_transactions']:
+                return self.respond(json_response(True, 'No transactions found', data=summary, status_code=200))
+            return self.respond(json_response(True, 'Financial summary generated successfully', data=summary,
+                                              status_code=200))
+
+        except ValidationError as e:
+            return self.respond(json_response(False, "Invalid query parameters", error=e.message,
+                                              details=e.errors, status_code=400))
+        except Exception as e:
+            return self.respond(json_response(False, 'Failed to generate summary', error=str(e), status_code=500))
+
+    async def export_transactions(self, request):
+        """Async GET /transactions/export for csv (streamed) and pdf"""
+        try:
+            filters = parse_filter_params(request.query_params)
+            export_format = request.query_params.get('format', 'pdf').lower()
+
+            if export_format == 'csv':
+                totals = ExportTotals()
+
+                async def generate():
+                    # The connection is held only while the body is being sent;
+                    # a slow reader stalls this coroutine, not a thread
+                    writer = CSVExportWriter(totals)
+                    async with self.engine.connect() as conn:
+                        async for row in aiter_export_rows(conn, filters):
+                            chunk = writer.write(row)
+                            if chunk:
+                                yield chunk
+                    yield writer.finish()
+                    logger.info("Exported %s transactions. Total Income: %s, Total Expenses: %s, Net Balance: %s", totals.total_transactions, totals.total_income, totals.total_expenses, totals.net_balance)
+
+                return StreamingResponse(metrics.ameasure_export(generate(), 'csv'), media_type='text/csv',
+                                         headers={"Content-Disposition": "attachment;filename=transactions.csv"})
+
+            started = time.perf_counter()
+            totals = ExportTotals()
+            async with self.engine.connect() as conn:
+                rows = aiter_export_rows(conn, filters)
+                try:
+                    # Rendering is CPU-bound, so it runs off the event loop and
+                    # pulls rows from the stream one batch at a time
+                    pdf_bytes = await asyncio.to_thread(
+                        render_pdf, _iter_from_loop(rows, asyncio.get_running_loop()), totals)
+                finally:
+                    await rows.aclose()
+            metrics.observe_export('pdf', len(pdf_bytes), time.perf_counter() - started)
+            logger.info("Exported %s transactions. Total Income: %s, Total Expenses: %s, Net Balance: %s", totals.total_transactions, totals.total_income, totals.total_expenses, totals.net_balance)
+            return Response(pdf_bytes, media_type='application/pdf',
+                            headers={"Content-Disposition": "attachment; filename=transactions.pdf"})
+
+        except ValidationError as e:
+            return self.respond(json_response(False, "Invalid query parameters", error=e.message,
+                                              details=e.errors, status_code=400))
+        except Exception as e:
+            return self.respond(json_response(False, "Failed to export transactions", error=str(e),
+                                              status_code=500))
@@ -0,0 +1,137 @@
+"""
+Conditional Requests and Response Caching for Read Endpoints
+
+Read endpoints are validated against the ledger version (app.services.ledger)
+instead of their bodies: the ETag is the ledger epoch and version, plus a
+hash of the Accept header since the listing negotiates JSON, Arrow or
+Parquet by it. Last-Modified is the time of the latest bump.
+
+A request whose If-None-Match (or, without one, If-Modified-Since) matches
+is answered 304 after reading the ledger_state row only; the view, and the
+transactions table, are not touched. HTTP dates have one-second resolution,
+so If-Modified-Since only matches once the last bump is a full second older
+than the date sent; a write in the same second as the client's copy always
+gets a full response. Clients should prefer the ETag.
+
+The version is read before the view runs. A mutation committing in between
+leaves a body newer than its ETag, which costs the client one extra full
+response later but never serves stale data as current.
+
+Views under conditional_on_ledger can also be wrapped in cached_response,
+which serves repeated requests for the same ledger version and normalized
+parameters from app.services.response_cache.
+"""
+
+import zlib
+from functools import wraps
+from datetime import timedelta, timezone
+from flask import Response, current_app, g, request
+from werkzeug.http import http_date, parse_date, parse_etags, quote_etag
+from app.services import columnar, ledger
+from app.services.response_cache import CachedResponse, cache_key, response_cache
+from app.utils.pagination import parse_page_params
+from app.utils.validators import ValidationError, parse_filter_params
+
+# Response headers stored with cached bodies (besides Content-Type)
+CACHED_HEADERS = frozenset({'x-next-cursor'})
+
+
+def ledger_etag(state, accept=None):
+    """Return the (unquoted) strong ETag for a ledger version and Accept header"""
+    tag = f"{state.epoch[:12]}-{state.version}"
+    if accept:
+        tag += f"-{zlib.crc32(accept.encode('latin-1', 'replace')):08x}"
+    return tag
+
+
+def is_not_modified(tag, state, headers):
+    """Return True if the request's validators match, per RFC 9110 section 13.2.2"""
+    if_none_match = headers.get('If-None-Match')
+    if if_none_match:
+        return parse_etags(if_none_match).contains_weak(tag)
+    since = parse_date(headers.get('If-Modified-Since'))
+    if since is None:
+        return False
+    # `since` is truncated to the second; a bump later in that second must not match
+    return state.updated_at.replace(tzinfo=timezone.utc) + timedelta(seconds=1) <= since
+
+
+def validator_headers(tag, state):
+    """Headers sent with both full and 304 responses"""
+    return {
+        'ETag': quote_etag(tag),
+        'Last-Modified': http_date(state.updated_at.replace(tzinfo=timezone.utc)),
+        'Vary': 'Accept',
+        # Caches may store the response but must revalidate before reusing it
+        'Cache-Control': 'no-cache',
+    }
+
+
+def conditional_on_ledger(view):
+    """Add ledger validators to a Flask view's 200 responses and answer matching requests with 304"""
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        state = ledger.current()
+        if state is None:
+            return view(*args, **kwargs)
+        tag = g.ledger_tag = ledger_etag(state, request.headers.get('Accept'))
+        if is_not_modified(tag, state, request.headers):
+            return Response(status=304, headers=validator_headers(tag, state))
+        response = current_app.make_response(view(*args, **kwargs))
+        if response.status_code == 200:
+            response.headers.update(validator_headers(tag, state))
+        return response
+
+    return wrapper
+
+
+
+def request_cache_key(endpoint, ledger_tag, params, paginated=False, options=None):
+    """
+    Return the response cache key for a request's query parameters
+
+    Args:
+        options (callable, optional): Parses the endpoint's own parameters
+            into a JSON-serializable value, which becomes part of the key
+
+    Raises:
+        ValidationError: If the parameters are invalid (the view reports it)
+    """
+    page = parse_page_params(params) if paginated else None
+    export_format = (params.get('format') or '').lower()
+    return cache_key(endpoint, ledger_tag, parse_filter_params(params), page,
+                     export_format if export_format in columnar.COLUMNAR_FORMATS else None,
+                     options(params) if options else None)
+
+
+def cached_response(endpoint, paginated=False, options=None):
+    """
+    Serve a view's 200 responses from the response cache; apply below conditional_on_ledger
+
+    Views whose response depends on parameters besides the listing filters
+    and pagination pass a parser for them as options (see request_cache_key).
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            tag = g.get('ledger_tag')
+            if tag is None or not response_cache.enabled:
+                return view(*args, **kwargs)
+            try:
+                key = request_cache_key(endpoint, tag, request.args, paginated, options)
+            except ValidationError:
+                return view(*args, **kwargs)
+            entry = response_cache.get(endpoint, key)
+            if entry is not None:
+                return Response(entry.body, content_type=entry.content_type, headers=entry.headers)
+            response = current_app.make_response(view(*args, **kwargs))
+            if response.status_code == 200 and not response.is_streamed:
+                headers = [(name, value) for name, value in response.headers if name.lower() in CACHED_HEADERS]
+                response_cache.set(key, CachedResponse(response.content_type, headers, response.get_data()))
+            return response
+
+        return wrapper
+
+    return decorator
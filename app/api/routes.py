@@ -5,27 +5,46 @@ This module contains all the REST API endpoints for managing financial transacti
 budgets, and generating financial insights.
 """
 
-from flask import Response, request
+from flask import Response, current_app, request, stream_with_context, url_for
 from app.api import finance_bp
+from app.api.conditional import cached_response, conditional_on_ledger
 from app.models.transaction import Transaction
-from app.utils.validators import validate_transaction_data, ValidationError
+from app.utils.validators import validate_transaction_data, validate_transactions_batch, parse_filter_params, ValidationError
 from app.utils.exceptions import NotFoundError
 from datetime import datetime
 from app.extensions import db
 from app.utils.response import json_response
+from app.utils.pagination import parse_change_params, parse_limit, parse_offset, parse_page_params
+from app.services.exports import ExportTotals, iter_export_rows, stream_csv, render_pdf
+from app.services.export_jobs import export_jobs, SUPPORTED_FORMATS
+from app.services.summary import compute_summary
+from app.services.timeseries import compute_timeseries, parse_timeseries_params
+from app.services.serialization import listing_rows, listing_statement, serialize_rows
+from app.services import changes
+from app.services import columnar
+from app.services import ledger
+from app.services import rollups
+from app.services.response_cache import response_cache
+from app.services.ingest import insert_rows, transaction_row
+from app.services.lookup import DEFAULT_LOOKUP_LIMIT, MAX_LOOKUP_LIMIT, lookup_transactions
+from app.services.search import DEFAULT_SEARCH_LIMIT, MAX_SEARCH_LIMIT, search_transactions
+from app.services.importer import import_statement
 from app.utils.logger import logger
-import traceback
+from app.utils import metrics
+import json
+import time
 from app.extensions import limiter
-import csv
+from app.utils.rate_limits import endpoint_limit
 import io
-from fpdf import FPDF
 from flask import send_file
 
 # Database storage added via SQLAlchemy
 
 #Get all transactions with optional filtering
 @finance_bp.route('/transactions', methods=['GET'])
-@limiter.limit("10 per minute") # Rate limit: 10 requests per minute per IP
+@limiter.limit(endpoint_limit('listing'))
+@conditional_on_ledger
+@cached_response('listing', paginated=True)
 def get_transactions():
     """
     Get all transactions with optional filtering
@@ -35,180 +54,291 @@ def get_transactions():
         transaction_type (str, optional): Filter by transaction type
         start_date (str, optional): Filter by start date (ISO format)
         end_date (str, optional): Filter by end date (ISO format)
+        tag (str, optional): Only transactions carrying this tag (exact match)
+        limit (int, optional): Page size; enables cursor pagination
+        cursor (str, optional): Opaque cursor from a previous page's next_cursor
+        format (str, optional): 'arrow' or 'parquet' for a columnar response
+            (also selected by Accept: application/vnd.apache.arrow.stream)
     
     Returns:
-        JSON: List of transactions matching filters
+        JSON: List of transactions matching filters, newest first. Paginated
+        responses also carry next_cursor (null on the last page). Columnar
+        responses carry the same rows, with next_cursor in X-Next-Cursor.
     """
     try:
         # Get query parameters
-        category = request.args.get('category')
-        transaction_type = request.args.get('transaction_type')
-        start_date = request.args.get('start_date')
-        end_date = request.args.get('end_date')
-        
-        filtered_transactions = Transaction.query.all()     #query all transactions from the database
-        
-        # Apply filters
-        if category:
-            filtered_transactions = [
-                t for t in filtered_transactions 
-                if t.category.lower() == category.lower()
-            ]
-        
-        if transaction_type:
-            filtered_transactions = [
-                t for t in filtered_transactions 
-                if t.transaction_type.lower() == transaction_type.lower()
-            ]
-        
-        if start_date:
-            start = datetime.fromisoformat(start_date)
-            filtered_transactions = [
-                t for t in filtered_transactions 
-                if t.date >= start
-            ]
-        
-        if end_date:
-            end = datetime.fromisoformat(end_date)
-            filtered_transactions = [
-                t for t in filtered_transactions 
-                if t.date <= end
-            ]
-        
-        # Convert to dictionaries and sort by date (newest first)
-        result = [t.to_dict() for t in filtered_transactions]
-        result.sort(key=lambda x: x['date'], reverse=True)
-        
-        return json_response(True, f"Retrieved {len(result)} transactions", data=result, status_code=200)
-        
+        filters = parse_filter_params(request.args)
+        page = parse_page_params(request.args)
+        columnar_format = columnar.requested_format(request.args.get('format'), request.accept_mimetypes)
+
+        # Filters and ordering are pushed down into SQL so only matching rows are
+        # loaded, as column tuples serialized without building ORM objects
+        if page is None and columnar_format:
+            return Response(
+                stream_with_context(columnar.stream_columnar(
+                    columnar_format, columnar.iter_record_batches(listing_statement(filters)))),
+                mimetype=columnar.COLUMNAR_FORMATS[columnar_format],
+            )
+
+        rows, next_cursor = listing_rows(db.session, filters, page)
+
+        if columnar_format:
+            body = b''.join(columnar.stream_columnar(columnar_format, [columnar.record_batch(db.session, rows)]))
+            headers = {'X-Next-Cursor': next_cursor} if next_cursor else {}
+            return Response(body, mimetype=columnar.COLUMNAR_FORMATS[columnar_format], headers=headers)
+
+        result = serialize_rows(db.session, rows)
+        meta = {'count': len(result)}
+        if page is not None:
+            meta['next_cursor'] = next_cursor
+        return json_response(True, f"Retrieved {len(result)} transactions", data=result, status_code=200, meta=meta)
+
+    except ValidationError as e:
+        return json_response(False, "Invalid query parameters", error=e.message, details=e.errors, status_code=400)
     except Exception as e:
         return json_response(False, "Failed to retrieve transactions", error=str(e), status_code=500)
 
+# Rows inserted, updated and deleted since a ledger version
+@finance_bp.route('/transactions/changes', methods=['GET'])
+@limiter.limit(endpoint_limit('changes'))
+def get_transaction_changes():
+    """
+    Get the transactions changed since a ledger version
+
+    Query Parameters:
+        since (int, optional): Ledger version the client last synced to;
+            omitted for a full snapshot
+        epoch (str, optional): Ledger epoch the client last synced from; a
+            mismatch (e.g. a recreated database) is answered 410 so the
+            client starts over with a full sync
+        limit (int, optional): Upserted rows per page (default 1000, max 5000)
+        cursor (str, optional): Opaque cursor from a previous page's next_cursor
+
+    Returns:
+        JSON: data.upserted (transactions, as in the listing) and
+        data.deleted (ids, first page only), plus version and epoch to sync
+        from next time and next_cursor (null on the last page)
+    """
+    try:
+        params = parse_change_params(request.args)
+        # Read before the rows: anything committed later is resent next sync
+        state = ledger.current()
+        if state is None:
+            return json_response(True, 'No changes', data={'upserted': [], 'deleted': []}, status_code=200,
+                                 meta={'version': 0, 'epoch': None, 'next_cursor': None})
+        if (params['epoch'] and params['epoch'] != state.epoch) or (params['since'] or 0) > state.version:
+            return json_response(False, 'Ledger was replaced; a full sync is required',
+                                 error='Unknown ledger epoch or version', status_code=410)
+
+        upserted, deleted, next_cursor = changes.changes_since(db.session, params['since'], params['limit'],
+                                                               params['after'])
+        return json_response(True, f"Retrieved {len(upserted)} changed and {len(deleted)} deleted transactions",
+                             data={'upserted': upserted, 'deleted': deleted}, status_code=200,
+                             meta={'version': state.version, 'epoch': state.epoch, 'next_cursor': next_cursor})
+
+    except ValidationError as e:
+        return json_response(False, "Invalid query parameters", error=e.message, details=e.errors, status_code=400)
+    except Exception as e:
+        return json_response(False, "Failed to retrieve changes", error=str(e), status_code=500)
+
+# Full-text search over category and description
+@finance_bp.route('/transactions/search', methods=['GET'])
+@limiter.limit(endpoint_limit('search'))
+@conditional_on_ledger
+def search_transaction_text():
+    """
+    Search transactions by the words in their category and description
+
+    Query Parameters:
+        q (str, optional): Search words, each matched as a prefix; empty for
+            the filtered listing, newest first
+        category, transaction_type, start_date, end_date, tag: Same filters as the listing
+        limit (int, optional): Hits per page (default 50, max 200)
+        offset (int, optional): Hits to skip, from a previous page's next_offset
+
+    Returns:
+        JSON: Matching transactions, best match first, with total (all hits)
+        and next_offset (null on the last page)
+    """
+    try:
+        filters = parse_filter_params(request.args)
+        limit = parse_limit(request.args, DEFAULT_SEARCH_LIMIT, MAX_SEARCH_LIMIT)
+        offset = parse_offset(request.args)
+        result, total, next_offset = search_transactions(db.session, request.args.get('q'), filters, limit, offset)
+        return json_response(True, f"Found {total} transactions", data=result, status_code=200,
+                             meta={'count': len(result), 'total': total, 'next_offset': next_offset})
+
+    except ValidationError as e:
+        return json_response(False, "Invalid query parameters", error=e.message, details=e.errors, status_code=400)
+    except Exception as e:
+        return json_response(False, "Failed to search transactions", error=str(e), status_code=500)
+
+# Typeahead for picking a transaction
+@finance_bp.route('/transactions/lookup', methods=['GET'])
+@limiter.limit(endpoint_limit('lookup'))
+@conditional_on_ledger
+def lookup_transaction_matches():
+    """
+    Find transactions by id, category prefix or description prefix
+
+    Query Parameters:
+        q (str, optional): Text typed by the user; empty for the most recent transactions
+        limit (int, optional): Maximum matches (default 10, max 50)
+
+    Returns:
+        JSON: Matching transactions, exact id match first, then newest first
+    """
+    try:
+        limit = parse_limit(request.args, DEFAULT_LOOKUP_LIMIT, MAX_LOOKUP_LIMIT)
+        result = lookup_transactions(db.session, request.args.get('q'), limit)
+        return json_response(True, f"Found {len(result)} transactions", data=result, status_code=200,
+                             meta={'count': len(result)})
+
+    except ValidationError as e:
+        return json_response(False, "Invalid query parameters", error=e.message, details=e.errors, status_code=400)
+    except Exception as e:
+        return json_response(False, "Failed to look up transactions", error=str(e), status_code=500)
+
 #export transactions to CSV
 @finance_bp.route('/transactions/export', methods=['GET'])
-@limiter.limit("5 per minute")  # Rate limit: 5 requests per minute per IP
+@limiter.limit(endpoint_limit('export'))
 def export_transactions():
     """
-    Export all transactions to a CSV file
+    Export transactions to a CSV file, PDF report, or columnar file
+    
+    Query Parameters:
+        format (str, optional): 'csv' (streamed), 'pdf' (default), 'parquet' or 'arrow' (streamed)
+        category, transaction_type, start_date, end_date, tag: Same filters as the listing
     
     Returns:
-        JSON: Success message with CSV data or error message
+        File: CSV, Parquet or Arrow stream or PDF attachment, or JSON error message
     """
     try:
         # Get query parameters
-        category = request.args.get('category')
-        transaction_type = request.args.get('transaction_type')
-        start_date = request.args.get('start_date')
-        end_date = request.args.get('end_date')
+        filters = parse_filter_params(request.args)
         export_format = request.args.get('format', 'pdf').lower()
 
-        filtered_transactions = Transaction.query
-
-        if category:
-            filtered_transactions = filtered_transactions.filter(Transaction.category.ilike(category))
-        if transaction_type:
-            filtered_transactions = filtered_transactions.filter(Transaction.transaction_type.ilike(transaction_type))
-        if start_date:
-            start = datetime.fromisoformat(start_date)
-            filtered_transactions = filtered_transactions.filter(Transaction.date >= start)
-        if end_date:
-            end = datetime.fromisoformat(end_date)
-            filtered_transactions = filtered_transactions.filter(Transaction.date <= end)
-
-        Transactions = filtered_transactions.all()
+        if export_format in columnar.COLUMNAR_FORMATS:
+            # Built column-wise from batched result sets, one record batch
+            # (Parquet row group) per fetch
+            columnar.requested_format(export_format)
+            extension = 'parquet' if export_format == 'parquet' else 'arrows'
+            return Response(
+                stream_with_context(metrics.measure_export(columnar.stream_columnar(
+                    export_format, columnar.iter_record_batches(listing_statement(filters))), export_format)),
+                mimetype=columnar.COLUMNAR_FORMATS[export_format],
+                headers={
+                    "Content-Disposition": f"attachment;filename=transactions.{extension}"
+                }
+            )
 
+        if export_format == 'csv':
+            # Stream the CSV: rows are fetched in batches and flushed in small
+            # chunks, and the totals footer is computed on the fly
+            totals = ExportTotals()
 
-        # Calculate totals
-        total_income = sum(t.amount for t in Transactions if t.transaction_type == 'income')
-        total_expenses = sum(abs(t.amount) for t in Transactions if t.transaction_type == 'expense')
-        net_balance = total_income - total_expenses
-        total_transactions = len(Transactions)
-        logger.info(f"Exporting {total_transactions} transactions. Total Income: {total_income}, Total Expenses: {total_expenses}, Net Balance: {net_balance}")
-        
-        if export_format == 'pdf':
-            col_widths = [10, 20, 30, 60, 28, 31, 45]
-            pdf = FPDF(orientation='L')
-            pdf.add_page()
-            pdf.set_font("Arial", size=10)
-            pdf.cell(0, 10, "Transactions Report - FinanceAI-Advisor", align="L", ln=1)
-
-            headers = ['ID', 'Amount', 'Category', 'Description', 'Transaction Type', 'Date', 'Tags']
-
-            for i, header in enumerate(headers):
-                pdf.cell(col_widths[i], 10, header, 1, 0, 'C')
-            pdf.ln()
-
-            for tx in Transactions:
-                row = [
-                    str(tx.id), str(tx.amount), tx.category, tx.description,
-                    tx.transaction_type, tx.date.strftime('%Y-%m-%d'),
-                    ''.join(tx.tags) if tx.tags else ''
-                ]
-                for i, field in enumerate(row):
-                    # Use multi_cell for long text fields
-                    if i in [3, 6]:
-                        x_pos = pdf.get_x()
-                        y_pos = pdf.get_y()
-                        pdf.multi_cell(col_widths[i], 10, field, border=1)
-                        pdf.set_xy(x_pos + col_widths[i], y_pos)
-                    else:
-                        pdf.cell(col_widths[i], 10, field, border=1)
-                pdf.ln(10)  # Move to next line after each row
-
-            pdf.ln(5)
-            pdf.cell(0, 10, f"Total Income: {total_income}   Total Expenses: {total_expenses}   Net Balance: {net_balance}", 0, 1)
-
-            # add header saying generated by FinanceAI-Advisor with time and date
-            pdf.set_y(0) # Move to top of page
-            pdf.set_font('Arial', 'I', 8)
-            pdf.cell(0, 10, f"Generated by FinanceAI-Advisor on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", 0, 0, 'C')
-
-            # Output PDF to memory
-            pdf_bytes = pdf.output(dest='S').encode('latin-1')
-            output = io.BytesIO(pdf_bytes)
-            output.seek(0)
-            return send_file(output, as_attachment=True, download_name='transactions.pdf', mimetype='application/pdf')
+            def generate():
+                yield from stream_csv(iter_export_rows(filters), totals)
+                logger.info("Exported %s transactions. Total Income: %s, Total Expenses: %s, Net Balance: %s", totals.total_transactions, totals.total_income, totals.total_expenses, totals.net_balance)
 
-        if export_format == 'csv':
-            # Create CSV in memory
-            # Serialize transactions to CSV
-            output = io.StringIO()  
-            writer = csv.writer(output)
-
-            # Write header row
-            writer.writerow(['ID', 'Amount', 'Category', 'Description', 'Transaction Type','Date', 'Tags'])
-            # Write data rows
-            for tx in Transactions:
-                writer.writerow([
-                    tx.id, tx.amount, tx.category, tx.description, 
-                    tx.transaction_type, tx.date.isoformat(), ''.join(tx.tags) if tx.tags else ''
-                ])
-            #adding total expenses, income and balance at the end of the csv file
-            writer.writerow([])
-            writer.writerow(['', '', '', '', '', '','','Total Income', total_income, ])
-            writer.writerow(['', '', '', '', '', '','','Total Expenses', total_expenses ])
-            writer.writerow(['', '', '', '', '', '','','Net Balance',net_balance ])
-            output.seek(0) # Move to the beginning of the StringIO object
-            
-            response = Response(
-                output.getvalue(),
+            return Response(
+                stream_with_context(metrics.measure_export(generate(), 'csv')),
                 mimetype='text/csv',
                 headers={
                     "Content-Disposition": "attachment;filename=transactions.csv"
                 }
             )
-            return response
-        else:
-            return json_response(False, "Unsupported export format", error="Only 'csv' and 'pdf format is supported", status_code=400)
+
+        if export_format != 'pdf':
+            return json_response(False, "Unsupported export format", error="Only 'csv', 'pdf', 'parquet' and 'arrow' formats are supported", status_code=400)
+
+        # Large reports should use the background job API (POST /exports)
+        totals = ExportTotals()
+        started = time.perf_counter()
+        pdf_bytes = render_pdf(iter_export_rows(filters), totals)
+        metrics.observe_export('pdf', len(pdf_bytes), time.perf_counter() - started)
+        logger.info("Exported %s transactions. Total Income: %s, Total Expenses: %s, Net Balance: %s", totals.total_transactions, totals.total_income, totals.total_expenses, totals.net_balance)
+
+        output = io.BytesIO(pdf_bytes)
+        output.seek(0)
+        return send_file(output, as_attachment=True, download_name='transactions.pdf', mimetype='application/pdf')
+    except ValidationError as e:
+        return json_response(False, "Invalid query parameters", error=e.message, details=e.errors, status_code=400)
     except Exception as e:
         return json_response(False, "Failed to export transactions", error=str(e), status_code=500)
         
 
 
 
+# Queue a background export job
+@finance_bp.route('/exports', methods=['POST'])
+@limiter.limit(endpoint_limit('export_jobs'))
+def create_export_job():
+    """
+    Queue a report export to be rendered in the background
+    
+    Request Body (JSON, optional):
+        format (str): Report format, currently 'pdf' (default)
+        category, transaction_type, start_date, end_date, tag: Same filters as the listing
+    
+    Returns:
+        JSON: Job metadata with its id and status URL (202 Accepted)
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        export_format = str(data.get('format', 'pdf')).lower()
+        if export_format not in SUPPORTED_FORMATS:
+            raise ValidationError("Unsupported export format", [f"format must be one of: {', '.join(SUPPORTED_FORMATS)}"])
+
+        filters = parse_filter_params(data)
+        job = export_jobs.submit(db.engine.url.render_as_string(hide_password=False), export_format, filters)
+        job['status_url'] = url_for('finance_api.get_export_job', job_id=job['id'])
+
+        return json_response(True, "Export job queued", data=job, status_code=202)
+
+    except ValidationError as e:
+        return json_response(False, "Input validation failed", error=e.message, details=e.errors, status_code=400)
+    except Exception as e:
+        return json_response(False, "Failed to queue export", error=str(e), status_code=500)
+
+# Get export job status or download its result
+@finance_bp.route('/exports/<job_id>', methods=['GET'])
+def get_export_job(job_id: str):
+    """
+    Get the status of an export job, or download the finished report
+    
+    Args:
+        job_id: Identifier returned by POST /exports
+    
+    Query Parameters:
+        download (bool, optional): Return the report file once the job has completed
+    
+    Returns:
+        JSON: Job metadata, or the report file when download is requested
+    """
+    try:
+        job = export_jobs.get(job_id)
+        if not job:
+            raise NotFoundError(f"No export job found with ID: {job_id}")
+
+        if request.args.get('download', '').lower() in ('1', 'true', 'yes'):
+            if job['status'] != 'completed':
+                return json_response(False, 'Export not ready', error=f"Job is {job['status']}", status_code=409)
+            return send_file(export_jobs.result_path(job), as_attachment=True,
+                             download_name=f"transactions.{job['format']}",
+                             mimetype=SUPPORTED_FORMATS[job['format']])
+
+        return json_response(True, f"Export job is {job['status']}", data=job, status_code=200)
+
+    except NotFoundError as e:
+        return json_response(False, 'Not found', error=e.message, status_code=404)
+    except Exception as e:
+        return json_response(False, 'Failed to retrieve export job', error=str(e), status_code=500)
+
+
 # Create a new transaction
 @finance_bp.route('/transactions', methods=['POST'])
-@limiter.limit("10 per minute")  # Rate limit: 10 requests per minute per IP
+@limiter.limit(endpoint_limit('create'))
 def create_transaction():
     """
     Create a new financial transaction
@@ -233,19 +363,23 @@ def create_transaction():
         # Validate required fields
         validate_transaction_data(data)
 
-        # Create new transaction
+        # Create new transaction, stamped with the ledger version it creates
         transaction = Transaction(
             amount=data['amount'],
             category=data['category'],
             description=data['description'],
             transaction_type=data['transaction_type'],
             date=datetime.fromisoformat(data['date']) if data.get('date') else datetime.utcnow(),
-            tags=','.join(data.get('tags', [])) if data.get('tags') else None
+            tags=data.get('tags'),
+            change_version=ledger.bump()
         )
 
-        # Store transaction in the database
+        # Store transaction in the database, updating the rollups and ledger
+        # version in the same DB transaction
         db.session.add(transaction)
+        rollups.add([rollups.snapshot(transaction)])
         db.session.commit()
+        response_cache.invalidate()
 
         return json_response(True, "Transaction created successfully", transaction.to_dict(), status_code=201)
         
@@ -255,9 +389,142 @@ def create_transaction():
     except Exception as e:
         return json_response(False, "Failed to create transaction", error=str(e), status_code=500)
 
+# Create many transactions in one request
+@finance_bp.route('/transactions/bulk', methods=['POST'])
+@limiter.limit(endpoint_limit('bulk'))
+def bulk_create_transactions():
+    """
+    Create many transactions in one request
+    
+    Request Body:
+        A JSON array of transaction objects (same fields as create_transaction),
+        or NDJSON (one object per line) with Content-Type application/x-ndjson
+    
+    Query Parameters:
+        chunk_size (int, optional): Rows per INSERT batch (default BULK_CHUNK_SIZE)
+        partial (bool, optional): Insert the valid rows even if some rows fail validation
+    
+    Returns:
+        JSON: Insert statistics and per-row validation errors
+    """
+    try:
+        started = time.perf_counter()
+        max_rows = current_app.config['BULK_MAX_ROWS']
+
+        try:
+            chunk_size = int(request.args.get('chunk_size', current_app.config['BULK_CHUNK_SIZE']))
+        except ValueError:
+            raise ValidationError('Invalid chunk_size', ['chunk_size must be an integer'])
+        if chunk_size < 1:
+            raise ValidationError('Invalid chunk_size', ['chunk_size must be positive'])
+        partial = request.args.get('partial', '').lower() in ('1', 'true', 'yes')
+
+        # Parse the payload: NDJSON is read line by line from the request stream
+        if request.mimetype in ('application/x-ndjson', 'application/jsonl'):
+            payloads = []
+            for line in io.BufferedReader(request.stream, buffer_size=64 * 1024):
+                if line.strip():
+                    try:
+                        payloads.append(json.loads(line))
+                    except ValueError:
+                        payloads.append(None)
+        else:
+            payloads = request.get_json(silent=True)
+            if not isinstance(payloads, list):
+                raise ValidationError('No JSON array provided', ['Request must contain a JSON array of transactions'])
+
+        if not payloads:
+            raise ValidationError('No transactions provided', ['Request must contain at least one transaction'])
+        if len(payloads) > max_rows:
+            raise ValidationError('Too many transactions', [f'At most {max_rows} transactions per request'])
+
+        # Validate every row and collect errors per row
+        now = datetime.utcnow()
+        rows, errors = [], []
+        for index, (payload, row_errors) in enumerate(zip(payloads, validate_transactions_batch(payloads))):
+            if row_errors:
+                errors.append({'row': index, 'errors': list(row_errors)})
+                continue
+            try:
+                rows.append(transaction_row(payload, now))
+            except (AttributeError, TypeError, ValueError) as e:
+                errors.append({'row': index, 'errors': [str(e)]})
+
+        if errors and not partial:
+            raise ValidationError(f'{len(errors)} of {len(payloads)} transactions are invalid', errors)
+
+        inserted = insert_rows(rows, chunk_size)
+        db.session.commit()
+        response_cache.invalidate()
+
+        elapsed = time.perf_counter() - started
+        stats = {
+            'received': len(payloads),
+            'inserted': inserted,
+            'failed': len(errors),
+            'errors': errors,
+            'chunk_size': chunk_size,
+            'elapsed_ms': round(elapsed * 1000, 2),
+            'rows_per_second': round(inserted / elapsed) if elapsed else None,
+        }
+        return json_response(True, f'Inserted {inserted} transactions', data=stats, status_code=201)
+
+    except ValidationError as e:
+        return json_response(False, 'Input validation failed', error=e.message, details=e.errors, status_code=400)
+    except Exception as e:
+        db.session.rollback()
+        return json_response(False, 'Failed to create transactions', error=str(e), status_code=500)
+
+# Import a bank statement
+@finance_bp.route('/imports', methods=['POST'])
+@limiter.limit(endpoint_limit('imports'))
+def import_bank_statement():
+    """
+    Import a CSV or OFX bank statement
+    
+    Request Body:
+        multipart/form-data with the statement in a 'file' field, or the raw
+        statement as the request body
+    
+    Query Parameters:
+        format (str, optional): 'csv' or 'ofx' (defaults to the file extension, else csv)
+        encoding (str, optional): Text encoding of the statement (default utf-8)
+        mapping (str, optional): JSON object of field -> CSV column overrides
+        chunk_size (int, optional): Rows per insert batch (default BULK_CHUNK_SIZE)
+    
+    Returns:
+        JSON: Import statistics including rows/sec and per-row errors
+    """
+    try:
+        upload = request.files.get('file')
+        stream = upload.stream if upload else request.stream
+        filename = (upload.filename if upload else '') or ''
+
+        import_format = request.args.get('format') or (filename.rsplit('.', 1)[-1] if '.' in filename else 'csv')
+        try:
+            mapping = json.loads(request.args['mapping']) if request.args.get('mapping') else None
+            chunk_size = int(request.args.get('chunk_size', current_app.config['BULK_CHUNK_SIZE']))
+        except ValueError:
+            raise ValidationError('Invalid import options', ['mapping must be a JSON object and chunk_size an integer'])
+        if mapping is not None and not isinstance(mapping, dict):
+            raise ValidationError('Invalid import options', ['mapping must be a JSON object'])
+
+        stats = import_statement(stream, import_format.lower(), mapping=mapping,
+                                 encoding=request.args.get('encoding', 'utf-8'),
+                                 chunk_size=max(chunk_size, 1))
+        response_cache.invalidate()
+
+        return json_response(True, f'Imported {stats.rows_inserted} transactions', data=stats.to_dict(), status_code=201)
+
+    except ValidationError as e:
+        return json_response(False, 'Input validation failed', error=e.message, details=e.errors, status_code=400)
+    except Exception as e:
+        return json_response(False, 'Failed to import statement', error=str(e), status_code=500)
+
 # Get a specific transaction by ID
 @finance_bp.route('/transactions/<transaction_id>', methods=['GET'])
-@limiter.limit("10 per minute")
+@limiter.limit(endpoint_limit('read'))
+@conditional_on_ledger
 def get_transaction(transaction_id: str):
     """
     Get a specific transaction by ID
@@ -282,7 +549,7 @@ def get_transaction(transaction_id: str):
 
 # Update an existing transaction
 @finance_bp.route('/transactions/<transaction_id>', methods=['PUT'])
-@limiter.limit("10 per minute")
+@limiter.limit(endpoint_limit('update'))
 def update_transaction(transaction_id: str):
     """
     Update an existing transaction
@@ -309,10 +576,12 @@ def update_transaction(transaction_id: str):
             raise ValidationError('No JSON data provided', ['Request must contain valid JSON data'])
         
         validate_transaction_data(data)  # Validate input data
+        previous = rollups.snapshot(transaction)
+        transaction.change_version = ledger.bump()
         
         # Update fields if provided
         if 'amount' in data:
-            transaction.amount = float(data['amount'])
+            transaction.amount = data['amount']
         if 'category' in data:
             transaction.category = data['category'].lower().strip()
         if 'description' in data:
@@ -322,10 +591,13 @@ def update_transaction(transaction_id: str):
         if 'date' in data:
             transaction.date = datetime.fromisoformat(data['date'])
         if 'tags' in data:
-            # Ensure tags are stored as a comma-separated string
-            transaction.tags = ','.join(data['tags']) if isinstance(data['tags'], list) else data['tags']
+            transaction.tags = data['tags']
         
+        # Move the transaction's contribution between rollup buckets
+        rollups.remove([previous])
+        rollups.add([rollups.snapshot(transaction)])
         db.session.commit()
+        response_cache.invalidate()
 
         return json_response(True, 'Transaction updated successfully', transaction.to_dict(), status_code=200)
         
@@ -353,12 +625,18 @@ def delete_transaction(transaction_id: str):
         if not transaction:
             raise NotFoundError(f"No transaction found with ID: {transaction_id}")
         
-        # Delete transaction
+        # Serialize before deleting: the tag rows are deleted with the transaction
+        deleted_transaction = transaction.to_dict()
+        # Lock order for every writer: the ledger row first, then the rows
+        # and rollup buckets it changes (see app.services.ledger)
+        version = ledger.bump()
         db.session.delete(transaction)
+        rollups.remove([rollups.snapshot(transaction)])
+        changes.record_deletions([transaction.id], version)
         db.session.commit()
+        response_cache.invalidate()
 
-        deleted_transaction = transaction
-        return json_response(True, f'Transaction {transaction_id} deleted successfully', deleted_transaction.to_dict(), status_code=200)
+        return json_response(True, f'Transaction {transaction_id} deleted successfully', deleted_transaction, status_code=200)
         
     except NotFoundError as e:
         return json_response(False, 'Not found', error=e.message, status_code=404)
@@ -367,86 +645,79 @@ def delete_transaction(transaction_id: str):
 
 # Get a summary of all transactions
 @finance_bp.route('/transactions/summary', methods=['GET'])
-@limiter.limit("10 per minute")
+@limiter.limit(endpoint_limit('summary'))
+@conditional_on_ledger
+@cached_response('summary')
 def get_transactions_summary():
     """
     Get financial summary and statistics
     
+    Query Parameters:
+        category, transaction_type, start_date, end_date, tag: Same filters as the listing
+    
     Returns:
         JSON: Summary including total income, expenses, balance, and category breakdown
     """
     try:
-        transactions = list(Transaction.query.all())
-        
-        if not transactions:
-            return json_response(True, 'No transactions found', data={
-                'total_transactions': 0,
-                'total_income': 0,
-                'total_expenses': 0,
-                'net_balance': 0,
-                'categories': {},
-                'transaction_types': {}, 
-            }, status_code=200)
-
-        # Calculate totals
-        total_income = sum(t.amount for t in transactions if t.transaction_type == 'income')
-        total_expenses = sum(abs(t.amount) for t in transactions if t.transaction_type == 'expense')
-        
-        # Category breakdown
-        categories = {}
-        transaction_types = {}
-        
-        for transaction in transactions:
-            # Category summary
-            if transaction.category not in categories:
-                categories[transaction.category] = {
-                    'total_amount': 0,
-                    'transaction_count': 0
-                }
-            categories[transaction.category]['total_amount'] += transaction.amount
-            categories[transaction.category]['transaction_count'] += 1
-            
-            # Transaction type summary
-            if transaction.transaction_type not in transaction_types:
-                transaction_types[transaction.transaction_type] = {
-                    'total_amount': 0,
-                    'transaction_count': 0
-                }
-            transaction_types[transaction.transaction_type]['total_amount'] += abs(transaction.amount)
-            transaction_types[transaction.transaction_type]['transaction_count'] += 1
-        
-        summary = {
-            'total_transactions': len(transactions),
-            'total_income': round(total_income, 2),
-            'total_expenses': round(total_expenses, 2),
-            'net_balance': round(total_income - total_expenses, 2),
-            'categories': categories,
-            'transaction_types': transaction_types,
-            'latest_transaction_date': max(t.date.isoformat() for t in transactions),
-            'earliest_transaction_date': min(t.date.isoformat() for t in transactions)
-        }
-        
+        filters = parse_filter_params(request.args)
+
+        # Totals and breakdowns are aggregated in SQL in a single round trip
+        summary = compute_summary(filters)
+
+        if not summary['total_transactions']:
+            return json_response(True, 'No transactions found', data=summary, status_code=200)
+
         return json_response(True, 'Financial summary generated successfully', data=summary, status_code=200)
-        
+
+    except ValidationError as e:
+        return json_response(False, "Invalid query parameters", error=e.message, details=e.errors, status_code=400)
     except Exception as e:
         return json_response(False, 'Failed to generate summary', error=str(e), status_code=500)
 
+# Bucketed totals over time for charts
+@finance_bp.route('/analytics/timeseries', methods=['GET'])
+@limiter.limit(endpoint_limit('analytics'))
+@conditional_on_ledger
+@cached_response('timeseries', options=parse_timeseries_params)
+def get_transactions_timeseries():
+    """
+    Get transaction totals per time bucket and group
+
+    Query Parameters:
+        bucket (str, optional): 'day', 'week' (ISO, from Monday) or 'month' (default)
+        group_by (str, optional): 'transaction_type' (default) or 'category'
+        category, transaction_type, start_date, end_date, tag: Same filters as the listing
+
+    Returns:
+        JSON: Columnar series: periods (bucket start dates) and, per group,
+        amount and count lists aligned with them
+    """
+    try:
+        filters = parse_filter_params(request.args)
+        bucket, group_by = parse_timeseries_params(request.args)
+        data = compute_timeseries(filters, bucket, group_by)
+        return json_response(True, f"Generated {len(data['periods'])} {bucket} buckets", data=data, status_code=200)
+
+    except ValidationError as e:
+        return json_response(False, "Invalid query parameters", error=e.message, details=e.errors, status_code=400)
+    except Exception as e:
+        return json_response(False, 'Failed to generate time series', error=str(e), status_code=500)
+
 # Global error handler for ValidationError
 @finance_bp.errorhandler(ValidationError) # decorator to catch ValidationError exceptions
 def handle_validation_error(error):
-    logger.warning(f"Validation Error: {error.message} Details: {error.errors}") # Log the validation error details
+    logger.warning("Validation Error: %s Details: %s", error.message, error.errors) # Log the validation error details
     return json_response(False, "Input validation failed", error=error.message, details=error.errors, status_code=400)
 
 # Global error handler for NotFoundError
 @finance_bp.errorhandler(NotFoundError) # decorator to catch NotFoundError exceptions
 def handle_not_found_error(error):
-    logger.warning(f"Not Found: {error.message}") # Log the not found error message
+    logger.warning("Not Found: %s", error.message) # Log the not found error message
     return json_response(False, "Resource not found", error=error.message, status_code=404)
 
 # Global error handler for generic exceptions
 @finance_bp.errorhandler(Exception) # decorator to catch all other exceptions
 def handle_generic_error(error):
-    logger.error(f"Unhandled Exception: {str(error)}") # Log the error message
-    logger.error(traceback.format_exc()) # Log the full stack trace
+    logger.error("Unhandled Exception: %s", error, exc_info=error) # Log the error with its stack trace
     return json_response(False, "Internal server error", error=str(error), status_code=500)
 
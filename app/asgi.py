@@ -0,0 +1,178 @@
+"""
+FinanceAI-Advisor ASGI Application Factory
+
+This module builds an ASGI application that serves the listing, summary and
+export endpoints from async views (app.api.async_routes) on an async
+SQLAlchemy engine, and hands every other request to the regular Flask app
+through a WSGI bridge. Clients see one API with the same paths, parameters
+and response bodies either way.
+
+The async engine is derived from the Flask app's database URL by swapping in
+an async driver (aiosqlite for SQLite, asyncpg for PostgreSQL), or can be
+given explicitly with ASYNC_DATABASE_URL. Async routes apply the same
+per-IP limits (app.config['RATELIMITS']), strategy and counter storage as
+their Flask counterparts. Requests selected for profiling
+(app.utils.profiling) are served by the Flask views, which profile them.
+
+    uvicorn asgi:app --workers 4
+"""
+
+import asyncio
+import os
+import time
+import uuid
+from contextlib import asynccontextmanager
+from a2wsgi import WSGIMiddleware
+from limits import parse
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Mount, Route
+from app import create_app
+from app.api.async_routes import AsyncTransactionViews, serves_export, serves_listing
+from app.extensions import db, limiter
+from app.utils.profiling import wants_profile
+from app.utils import metrics
+from app.utils.logger import log_request
+
+# Async drivers substituted for the sync URL's driver, by backend
+ASYNC_DRIVERS = {
+    'sqlite': 'sqlite+aiosqlite',
+    'postgresql': 'postgresql+asyncpg',
+    'mysql': 'mysql+aiomysql',
+}
+
+
+def async_database_url(url):
+    """
+    Return the async-driver equivalent of a SQLAlchemy database URL
+
+    Raises:
+        ValueError: If there is no known async driver for the backend
+    """
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend!r}; set ASYNC_DATABASE_URL")
+    return url.set(drivername=ASYNC_DRIVERS[backend])
+
+
+class _AsyncRoute:
+    """ASGI endpoint that runs an async view, or the Flask app for requests the view does not serve"""
+
+    def __init__(self, path, view, fallback, serves=None, rate_limit=None, config=None):
+        self.path = path
+        self.view = view
+        self.fallback = fallback
+        self.serves = serves
+        self.rate_limit = rate_limit
+        self.config = config or {}
+
+    async def __call__(self, scope, receive, send):
+        request = Request(scope, receive)
+        if self.serves is not None and not self.serves(request):
+            # Flask-Limiter counts (and Flask logs) these requests itself
+            await self.fallback(scope, receive, send)
+            return
+        started = time.perf_counter()
+        request_id = request.headers.get('x-request-id') or uuid.uuid4().hex
+        measured = self.config.get('METRICS_ENABLED', False)
+        if measured:
+            metrics.start_request(self.path)
+        status = 500
+        try:
+            response = None
+            if self.rate_limit is not None:
+                response = await self.rate_limit(request)
+            if response is None:
+                response = await self.view(request)
+            status = response.status_code
+            response.headers['X-Request-ID'] = request_id
+            await response(scope, receive, send)
+        finally:
+            elapsed = time.perf_counter() - started
+            if measured:
+                metrics.finish_request(request.method, self.path, status, elapsed)
+        log_request(request.method, request.url.path, self.path, status, elapsed * 1000, request_id,
+                    self.config.get('LOG_SAMPLE_RATE', 1.0), self.config.get('LOG_SLOW_MS', float('inf')))
+
+
+class _RateLimit:
+    """Per-IP limit checked with the Flask limiter's strategy and storage"""
+
+    def __init__(self, strategy, limit, scope):
+        self.strategy = strategy
+        self.limit = parse(limit)
+        self.scope = scope
+
+    async def __call__(self, request):
+        client = request.client.host if request.client else '127.0.0.1'
+        # Storage backends are synchronous (and may be remote), so hit off the event loop
+        if await asyncio.to_thread(self.strategy.hit, self.limit, 'asgi', self.scope, client):
+            return None
+        # Same body as the Flask app's 429 handler
+        return JSONResponse({
+            "success": False,
+            "message": "Rate limit exceeded",
+            "error": "Too many requests"
+        }, status_code=429)
+
+
+def create_asgi_app(flask_app=None):
+    """
+    Create the ASGI application
+
+    Args:
+        flask_app (optional): Flask app to serve the remaining routes
+            (defaults to a new create_app())
+
+    Returns:
+        Starlette: The combined application
+    """
+    flask_app = flask_app or create_app()
+
+    database_url = os.getenv('ASYNC_DATABASE_URL')
+    if database_url is None:
+        with flask_app.app_context():
+            # Use the engine's URL: Flask-SQLAlchemy resolves relative SQLite paths
+            database_url = async_database_url(db.engine.url)
+    engine = create_async_engine(database_url)
+
+    views = AsyncTransactionViews(engine, flask_app.json,
+                                  use_rollups=flask_app.config.get('SUMMARY_USE_ROLLUPS', True))
+    fallback = WSGIMiddleware(flask_app)
+
+    rate_limits = limiter.enabled and flask_app.config.get('RATELIMIT_ENABLED', True)
+
+    def route(path, view, limit_name, serves=None):
+        def serves_unprofiled(request):
+            # Profiled requests are left to the Flask app, which profiles them
+            if wants_profile(flask_app.config, path, request.headers):
+                return False
+            return serves is None or serves(request)
+
+        rate_limit = None
+        if rate_limits:
+            rate_limit = _RateLimit(limiter.limiter, flask_app.config['RATELIMITS'][limit_name], path)
+        return Route(path, _AsyncRoute(path, view, fallback, serves_unprofiled, rate_limit, flask_app.config),
+                     methods=['GET'])
+
+    @asynccontextmanager
+    async def lifespan(app):
+        yield
+        await engine.dispose()
+
+    app = Starlette(
+        routes=[
+            route('/api/v1/transactions', views.get_transactions, 'listing', serves_listing),
+            route('/api/v1/transactions/export', views.export_transactions, 'export', serves_export),
+            route('/api/v1/transactions/summary', views.get_transactions_summary, 'summary'),
+            Mount('/', app=fallback),
+        ],
+        lifespan=lifespan,
+    )
+    app.state.flask_app = flask_app
+    app.state.engine = engine
+    return app
@@ -0,0 +1,60 @@
+"""
+CLI Commands for FinanceAI-Advisor
+
+This module registers maintenance commands with the Flask CLI, e.g.:
+
+    flask rebuild-rollups
+    flask check-rollups
+    flask import-statement statement.csv
+"""
+
+import json
+import click
+from app.extensions import db
+from app.services import rollups
+from app.services.importer import SUPPORTED_FORMATS, import_statement
+from app.services.ingest import DEFAULT_CHUNK_SIZE
+
+
+def register_commands(app):
+    """Attach the maintenance commands to the application's CLI"""
+
+    @app.cli.command('rebuild-rollups')
+    def rebuild_rollups_command():
+        """Recompute the daily summary rollups from the transactions table."""
+        count = rollups.rebuild()
+        db.session.commit()
+        click.echo(f"Rebuilt {count} rollup rows")
+
+    @app.cli.command('check-rollups')
+    def check_rollups_command():
+        """Verify the daily summary rollups against the transactions table."""
+        problems = rollups.check()
+        for problem in problems:
+            click.echo(problem, err=True)
+        if problems:
+            raise click.ClickException(f"{len(problems)} inconsistent rollup buckets; run `flask rebuild-rollups`")
+        click.echo("Rollups are consistent")
+
+    @app.cli.command('import-statement')
+    @click.argument('path', type=click.Path(exists=True, dir_okay=False))
+    @click.option('--format', 'file_format', type=click.Choice(SUPPORTED_FORMATS),
+                  help='Statement format (defaults to the file extension).')
+    @click.option('--encoding', default='utf-8', show_default=True)
+    @click.option('--mapping', help='JSON object of field -> CSV column overrides.')
+    @click.option('--chunk-size', default=DEFAULT_CHUNK_SIZE, show_default=True, type=click.IntRange(min=1))
+    def import_statement_command(path, file_format, encoding, mapping, chunk_size):
+        """Stream-import a CSV or OFX bank statement."""
+        file_format = file_format or path.rsplit('.', 1)[-1].lower()
+        if file_format not in SUPPORTED_FORMATS:
+            raise click.BadParameter(f"cannot infer format from {path!r}; pass --format", param_hint='--format')
+
+        def progress(stats):
+            click.echo(f"{stats.rows_read:>12,} rows read  {stats.rows_inserted:>12,} inserted  "
+                       f"{stats.rows_failed:>8,} failed  {stats.rows_per_second or 0:>8,} rows/sec")
+
+        with open(path, 'rb') as fh:
+            stats = import_statement(fh, file_format, mapping=json.loads(mapping) if mapping else None,
+                                     encoding=encoding, chunk_size=chunk_size, progress=progress)
+        for error in stats.errors:
+            click.echo(f"row {error['row']}: {'; '.join(error['errors'])}", err=True)
@@ -0,0 +1,29 @@
+"""
+Ledger State Model
+
+This module defines the single-row table holding the ledger version. Every
+committed change to transactions (or their tags) bumps the version in the
+same DB transaction, so readers can tell whether anything changed without
+looking at the transactions table. See app.services.ledger.
+"""
+
+from app.extensions import db
+
+class LedgerState(db.Model):
+
+    """
+    Version counter for the transactions ledger
+
+    Attributes:
+        id (int): Always 1
+        epoch (str): Random id chosen when the row is created, so versions
+            of a recreated database never repeat those of an earlier one
+        version (int): Incremented by every mutation of the ledger
+        updated_at (datetime): When the version was last incremented (UTC)
+    """
+    __tablename__ = "ledger_state"
+
+    id = db.Column(db.Integer, primary_key=True)
+    epoch = db.Column(db.String(32), nullable=False)
+    version = db.Column(db.BigInteger, nullable=False, default=1)
+    updated_at = db.Column(db.DateTime, nullable=False)
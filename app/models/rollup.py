@@ -0,0 +1,37 @@
+"""
+Transaction Rollup Model
+
+This module defines the materialized per-day summary table. Each row holds
+the totals for one (day, category, transaction_type) bucket and is kept in
+step with the transactions table by app.services.rollups.
+"""
+
+from app.extensions import db
+
+class TransactionRollup(db.Model):
+
+    """
+    Daily rollup of transactions for one category and transaction type
+
+    Attributes:
+        day (date): Calendar day of the bucketed transactions
+        category (str): Transaction category as stored on the transactions
+        category_key (str): Case-folded category used for filtering
+        transaction_type (str): Transaction type
+        total_amount_minor (int): Sum of amounts in minor units
+        total_abs_amount_minor (int): Sum of absolute amounts in minor units
+        transaction_count (int): Number of transactions in the bucket
+        first_date (datetime): Earliest transaction date in the bucket
+        last_date (datetime): Latest transaction date in the bucket
+    """
+    __tablename__ = "transaction_rollups"
+
+    day = db.Column(db.Date, primary_key=True)
+    category = db.Column(db.String(64), primary_key=True)
+    transaction_type = db.Column(db.String(32), primary_key=True)
+    category_key = db.Column(db.String(64), nullable=False, index=True)
+    total_amount_minor = db.Column(db.BigInteger, nullable=False, default=0)
+    total_abs_amount_minor = db.Column(db.BigInteger, nullable=False, default=0)
+    transaction_count = db.Column(db.Integer, nullable=False, default=0)
+    first_date = db.Column(db.DateTime, nullable=False)
+    last_date = db.Column(db.DateTime, nullable=False)
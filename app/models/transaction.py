@@ -6,33 +6,117 @@ including income, expenses, investments, and other financial activities.
 """
 
 from app.extensions import db
+from app.utils.money import from_minor, to_minor
 from datetime import datetime
+from sqlalchemy import DDL, event, select
+from sqlalchemy.orm import validates
 
 class Transaction(db.Model):
-        
+
     """
     Transaction model representing a financial transaction
-    
+
     Attributes:
         id (str): Unique transaction identifier
-        amount (float): Transaction amount (positive for income, negative for expense)
+        amount_minor (int): Transaction amount in minor units (paise)
+        amount (float): Transaction amount in rupees, backed by amount_minor
         category (str): Transaction category (e.g., 'groceries', 'salary', 'rent')
+        category_key (str): Case-folded copy of category used for indexed filtering
         description (str): Human readable transaction description
         transaction_type (str): Type of transaction ('income', 'expense', 'investment', 'transfer')
         date (datetime): When the transaction occurred
         created_at (datetime): When the record was created
-        tags (List[str]): Optional tags for additional categorization
+        change_version (int): Ledger version of the last insert or update, for
+            the change feed (app.services.changes); 0 for rows older than it
+        tags (List[str]): Optional tags for additional categorization, backed by tag_rows
+        tag_rows (List[TransactionTag]): Rows of the transaction_tags table, in order
     """
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Composite indexes backing the listing/export filters (equality + date range)
+        db.Index('ix_transactions_type_date', 'transaction_type', 'date'),
+        db.Index('ix_transactions_category_key_date', 'category_key', 'date'),
+        # Keyset pagination order: (date DESC, id DESC)
+        db.Index('ix_transactions_date_id', 'date', 'id'),
+        # Change feed order: (change_version, id)
+        db.Index('ix_transactions_change_version_id', 'change_version', 'id'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
-    amount = db.Column(db.Float, nullable=False)
+    amount_minor = db.Column(db.BigInteger, nullable=False)
     category = db.Column(db.String(64), nullable=False)
+    category_key = db.Column(db.String(64), nullable=False)
     description = db.Column(db.Text, nullable=True)
     transaction_type = db.Column(db.String(32), nullable=False)
     date = db.Column(db.DateTime, default=datetime.utcnow)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    tags = db.Column(db.Text, nullable=True)  # Store JSON string for simplicity
+    change_version = db.Column(db.BigInteger, nullable=False, default=0, server_default='0')
+    # Loaded for a whole result set with one extra IN query (no per-row lazy loads)
+    tag_rows = db.relationship('TransactionTag', order_by='TransactionTag.position', lazy='selectin',
+                               cascade='all, delete-orphan')
+
+    @property
+    def amount(self):
+        return from_minor(self.amount_minor)
+
+    @amount.setter
+    def amount(self, value):
+        self.amount_minor = to_minor(value)
+
+    @property
+    def tags(self):
+        return [row.tag for row in self.tag_rows]
+
+    @tags.setter
+    def tags(self, value):
+        self.tag_rows = [TransactionTag(position=i, tag=tag) for i, tag in enumerate(value or [])]
+
+    @validates('category')
+    def _sync_category_key(self, key, value):
+        # Keep the case-folded lookup column in step with the display value
+        self.category_key = value.casefold() if value is not None else None
+        return value
+
+    @validates('transaction_type')
+    def _normalize_transaction_type(self, key, value):
+        # Types are matched with plain equality so the composite index can be used
+        return value.lower() if value is not None else None
+
+    @classmethod
+    def filter_conditions(cls, category=None, transaction_type=None, start_date=None, end_date=None, tag=None):
+        """
+        Build SQL WHERE conditions for the common transaction filters
+
+        Args:
+            category (str, optional): Category to match (case-insensitive)
+            transaction_type (str, optional): Transaction type to match (case-insensitive)
+            tag (str, optional): Tag the transaction must carry (exact match)
+            start_date (datetime, optional): Inclusive lower bound on date
+            end_date (datetime, optional): Inclusive upper bound on date
+
+        Returns:
+            list: SQLAlchemy column expressions, usable with ORM queries and Core selects
+        """
+        conditions = []
+        if category:
+            conditions.append(cls.category_key == category.casefold())
+        if transaction_type:
+            conditions.append(cls.transaction_type == transaction_type.lower())
+        if start_date:
+            conditions.append(cls.date >= start_date)
+        if end_date:
+            conditions.append(cls.date <= end_date)
+        if tag:
+            # Resolved through the (tag, transaction_id) index
+            conditions.append(cls.id.in_(
+                select(TransactionTag.transaction_id).where(TransactionTag.tag == tag)
+            ))
+        return conditions
+
+    @classmethod
+    def filtered_query(cls, **filters):
+        """Return a query with filter_conditions(**filters) applied"""
+        return cls.query.filter(*cls.filter_conditions(**filters))
 
     def to_dict(self):
         return {
@@ -43,5 +127,111 @@ class Transaction(db.Model):
             "transaction_type": self.transaction_type,
             "date": self.date.isoformat(),
             "created_at": self.created_at.isoformat(),
-            "tags": self.tags.split(',') if self.tags else []
-        }
\ No newline at end of file
+            "tags": self.tags
+        }
+
+
+# Case-insensitive description prefixes for the transaction picker (app.services.lookup)
+db.Index('ix_transactions_description_lower', db.func.lower(Transaction.description))
+
+
+class TransactionTag(db.Model):
+
+    """
+    One tag of a transaction
+
+    Attributes:
+        id (int): Surrogate key
+        transaction_id (int): Tagged transaction
+        position (int): Order of the tag within the transaction's tags
+        tag (str): Tag text
+    """
+    __tablename__ = "transaction_tags"
+    __table_args__ = (
+        # Backs the ?tag= filter: tag equality, then the matching transaction ids
+        db.Index('ix_transaction_tags_tag_transaction', 'tag', 'transaction_id'),
+        # Loads a transaction's tags in order
+        db.Index('ix_transaction_tags_transaction_position', 'transaction_id', 'position'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    transaction_id = db.Column(db.Integer, db.ForeignKey('transactions.id', ondelete='CASCADE'), nullable=False)
+    position = db.Column(db.Integer, nullable=False, default=0)
+    tag = db.Column(db.String(64), nullable=False)
+
+    @classmethod
+    def by_transaction(cls, connection, transaction_ids):
+        """
+        Load the tags of many transactions with one query
+
+        Args:
+            connection: Session or Connection to read from
+            transaction_ids (list): Transaction ids
+
+        Returns:
+            dict: {transaction_id: [tag, ...]} in tag order; untagged ids are absent
+        """
+        tags = {}
+        # Chunked to keep the IN list within the driver's parameter limit
+        for start in range(0, len(transaction_ids), 500):
+            rows = connection.execute(
+                select(cls.transaction_id, cls.tag)
+                .where(cls.transaction_id.in_(transaction_ids[start:start + 500]))
+                .order_by(cls.transaction_id, cls.position)
+            )
+            for transaction_id, tag in rows:
+                tags.setdefault(transaction_id, []).append(tag)
+        return tags
+
+
+class TransactionTombstone(db.Model):
+
+    """
+    Record of a deleted transaction, read by the change feed
+
+    Attributes:
+        transaction_id (int): Id of the deleted transaction
+        change_version (int): Ledger version of the deletion
+        deleted_at (datetime): When the transaction was deleted (UTC)
+    """
+    __tablename__ = "transaction_tombstones"
+    __table_args__ = (
+        db.Index('ix_transaction_tombstones_change_version', 'change_version'),
+    )
+
+    transaction_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    change_version = db.Column(db.BigInteger, nullable=False)
+    deleted_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+
+# Full-text index over category and description (app.services.search). On
+# SQLite an external-content FTS5 table is kept in step with transactions by
+# triggers; on PostgreSQL a GIN index covers the same tsvector expression the
+# search queries use. The migration creates the same objects.
+FTS_TABLE = 'transactions_fts'
+FTS_DOCUMENT_SQL = "to_tsvector('simple', coalesce(category, '') || ' ' || coalesce(description, ''))"
+
+SQLITE_FTS_DDL = (
+    f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(category, description, content='transactions', "
+    "content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    f"CREATE TRIGGER {FTS_TABLE}_insert AFTER INSERT ON transactions BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, category, description) VALUES (new.id, new.category, new.description); END",
+    f"CREATE TRIGGER {FTS_TABLE}_delete AFTER DELETE ON transactions BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, category, description) "
+    "VALUES ('delete', old.id, old.category, old.description); END",
+    f"CREATE TRIGGER {FTS_TABLE}_update AFTER UPDATE OF category, description ON transactions BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, category, description) "
+    "VALUES ('delete', old.id, old.category, old.description); "
+    f"INSERT INTO {FTS_TABLE}(rowid, category, description) VALUES (new.id, new.category, new.description); END",
+)
+POSTGRES_FTS_DDL = (
+    f"CREATE INDEX ix_transactions_fts ON transactions USING gin ({FTS_DOCUMENT_SQL})",
+)
+
+for _statement in SQLITE_FTS_DDL:
+    event.listen(Transaction.__table__, 'after_create', DDL(_statement).execute_if(dialect='sqlite'))
+for _statement in POSTGRES_FTS_DDL:
+    event.listen(Transaction.__table__, 'after_create', DDL(_statement).execute_if(dialect='postgresql'))
+# Triggers and the GIN index go with the table; the FTS5 table does not
+event.listen(Transaction.__table__, 'after_drop',
+             DDL(f"DROP TABLE IF EXISTS {FTS_TABLE}").execute_if(dialect='sqlite'))
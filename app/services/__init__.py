@@ -0,0 +1,6 @@
+"""
+Service modules for FinanceAI-Advisor
+
+Business logic shared by the API routes and CLI commands lives here so the
+route handlers stay thin.
+"""
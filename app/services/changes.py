@@ -0,0 +1,84 @@
+"""
+Transaction Change Feed
+
+This module lets clients keep a local copy of the ledger current by
+fetching only what changed. Every write stamps the rows it touches with
+the ledger version it bumped to (Transaction.change_version), and a
+deletion leaves a TransactionTombstone carrying its version, so "what
+changed since version N" is two index range scans:
+
+    upserted  transactions with change_version > N, in (change_version, id)
+              order, one keyset page at a time
+    deleted   tombstones with change_version > N
+
+A sync without N returns every transaction (a full snapshot) and no
+deletions. The version reported with the first page is read before the
+rows, so a change committing mid-sync is delivered again by the next sync
+rather than missed; applying upserts is idempotent. Rows changed while a
+client pages through the feed move to a higher change_version and appear
+on a later page.
+"""
+
+from datetime import datetime
+from sqlalchemy import delete, insert, select, tuple_
+from app.extensions import db
+from app.models.transaction import Transaction, TransactionTombstone
+from app.services.serialization import LISTING_COLUMNS, serialize_rows
+from app.utils.pagination import encode_change_cursor
+
+
+def record_deletions(transaction_ids, version, connection=None):
+    """
+    Leave tombstones for deleted transactions; the caller owns the DB transaction
+
+    Args:
+        transaction_ids (list): Ids of the deleted transactions
+        version (int): Ledger version returned by ledger.bump() for the deletion
+        connection (optional): Connection or session to write with (defaults to db.session)
+    """
+    connection = connection if connection is not None else db.session
+    table = TransactionTombstone.__table__
+    # SQLite may hand a deleted id to a later insert; keep one tombstone per id
+    connection.execute(delete(table).where(table.c.transaction_id.in_(transaction_ids)))
+    now = datetime.utcnow()
+    connection.execute(insert(table), [
+        {'transaction_id': transaction_id, 'change_version': version, 'deleted_at': now}
+        for transaction_id in transaction_ids
+    ])
+
+
+def changes_since(connection, since, limit, after=None):
+    """
+    Read one page of the change feed
+
+    Args:
+        connection: Session or Connection to read from
+        since (int or None): Ledger version the client has; None for a full sync
+        limit (int): Maximum upserted rows on the page
+        after (tuple, optional): (change_version, id) cursor from the previous page
+
+    Returns:
+        tuple: (upserted transaction dicts, deleted ids, next_cursor or None).
+        Deleted ids are only returned with the first page of a sync; clients
+        apply them before the upserts.
+    """
+    stmt = select(*LISTING_COLUMNS, Transaction.change_version).order_by(Transaction.change_version, Transaction.id)
+    if after is not None:
+        stmt = stmt.where(tuple_(Transaction.change_version, Transaction.id) > after)
+    elif since is not None:
+        stmt = stmt.where(Transaction.change_version > since)
+    rows = connection.execute(stmt.limit(limit + 1)).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_change_cursor(rows[-1].change_version, rows[-1].id) if has_more else None
+
+    deleted = []
+    if since is not None and after is None:
+        deleted = connection.execute(
+            select(TransactionTombstone.transaction_id)
+            .where(TransactionTombstone.change_version > since)
+            .order_by(TransactionTombstone.transaction_id)
+        ).scalars().all()
+
+    upserted = serialize_rows(connection, [row[:len(LISTING_COLUMNS)] for row in rows])
+    return upserted, deleted, next_cursor
@@ -0,0 +1,227 @@
+"""
+Background Export Jobs
+
+This module runs report rendering outside the request thread. Jobs are
+submitted to a process pool and tracked entirely on disk, so any worker
+process serving the API can report a job's status or hand out its result:
+
+    <EXPORT_DIR>/<job_id>.json   job metadata and status
+    <EXPORT_DIR>/<job_id>.pdf    finished report
+
+Finished reports and their metadata are removed once they are older than
+EXPORT_TTL_SECONDS.
+"""
+
+import json
+import multiprocessing
+import os
+import re
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from threading import Lock
+from sqlalchemy import create_engine
+from app.utils import metrics
+from app.utils.logger import logger
+
+SUPPORTED_FORMATS = {'pdf': 'application/pdf'}
+
+JOB_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+
+# Engines created inside pool workers, reused across jobs in the same process
+_worker_engines = {}
+
+
+def _write_json_atomic(path, payload):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as fh:
+        json.dump(payload, fh)
+    os.replace(tmp_path, path)
+
+
+def render_export_job(database_url, job_dir, job_id, export_format, filters):
+    """
+    Render an export to disk; runs inside a pool worker
+
+    Args:
+        database_url (str): Absolute database URL to read from
+        job_dir (str): Directory holding job metadata and results
+        job_id (str): Job identifier
+        export_format (str): One of SUPPORTED_FORMATS
+        filters (dict): Keyword arguments for Transaction.filter_conditions
+
+    Returns:
+        dict: The final job metadata
+    """
+    from app.services.exports import ExportTotals, iter_export_rows, render_pdf
+
+    meta_path = os.path.join(job_dir, f"{job_id}.json")
+    with open(meta_path) as fh:
+        meta = json.load(fh)
+
+    meta['status'] = 'running'
+    meta['started_at'] = datetime.utcnow().isoformat()
+    _write_json_atomic(meta_path, meta)
+    started = time.perf_counter()
+
+    try:
+        engine = _worker_engines.get(database_url)
+        if engine is None:
+            engine = _worker_engines[database_url] = create_engine(database_url)
+
+        totals = ExportTotals()
+        with engine.connect() as conn:
+            content = render_pdf(iter_export_rows(filters, connection=conn), totals)
+
+        result_path = os.path.join(job_dir, f"{job_id}.{export_format}")
+        with open(f"{result_path}.tmp", 'wb') as fh:
+            fh.write(content)
+        os.replace(f"{result_path}.tmp", result_path)
+
+        meta.update({
+            'status': 'completed',
+            'total_transactions': totals.total_transactions,
+            'size_bytes': len(content),
+        })
+    except Exception as e:
+        meta.update({'status': 'failed', 'error': str(e)})
+
+    meta['finished_at'] = datetime.utcnow().isoformat()
+    meta['duration_seconds'] = round(time.perf_counter() - started, 3)
+    _write_json_atomic(meta_path, meta)
+    return meta
+
+
+def _on_job_done(meta_path, future):
+    """
+    Done callback for a job's future; runs in the submitting process
+
+    Records metrics for completed jobs (this process serves /metrics). If
+    the future was cancelled or raised, the worker never reached its own
+    error handling (e.g. it died or the job could not be pickled), so this
+    marks the job 'failed' with the error in its metadata file, letting
+    pollers stop waiting.
+
+    Args:
+        meta_path (str): Path of the job's metadata file
+        future (Future): The job's future
+    """
+    error = 'Export job was cancelled' if future.cancelled() else future.exception()
+    if error is not None:
+        logger.error("Export job %s failed: %s", meta_path, error)
+        try:
+            with open(meta_path) as fh:
+                meta = json.load(fh)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return  # Expired and cleaned up; nothing left to report to
+        meta.update({'status': 'failed', 'error': str(error) or type(error).__name__,
+                     'finished_at': datetime.utcnow().isoformat()})
+        _write_json_atomic(meta_path, meta)
+        return
+    meta = future.result()
+    if meta['status'] == 'completed':
+        metrics.observe_export(meta['format'], meta['size_bytes'], meta['duration_seconds'], mode='job')
+
+
+class ExportJobManager:
+    """
+    Submits export jobs to a worker pool and reads their state from disk
+
+    Configuration:
+        EXPORT_DIR (str): Where job metadata and results are stored
+        EXPORT_TTL_SECONDS (int): Age after which jobs are cleaned up
+        EXPORT_WORKERS (int): Pool size
+        EXPORT_EXECUTOR (str): 'process' (default) or 'thread'
+    """
+
+    def __init__(self, app=None):
+        self._executor = None
+        self._lock = Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('EXPORT_DIR', os.getenv('EXPORT_DIR', os.path.join(app.instance_path, 'exports')))
+        app.config.setdefault('EXPORT_TTL_SECONDS', int(os.getenv('EXPORT_TTL_SECONDS', 3600)))
+        app.config.setdefault('EXPORT_WORKERS', int(os.getenv('EXPORT_WORKERS', 2)))
+        app.config.setdefault('EXPORT_EXECUTOR', os.getenv('EXPORT_EXECUTOR', 'process'))
+        app.extensions['export_jobs'] = self
+        self.app = app
+
+    @property
+    def job_dir(self):
+        path = self.app.config['EXPORT_DIR']
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def _get_executor(self):
+        # Created lazily so importing/creating the app never spawns workers
+        with self._lock:
+            if self._executor is None:
+                workers = self.app.config['EXPORT_WORKERS']
+                if self.app.config['EXPORT_EXECUTOR'] == 'thread':
+                    self._executor = ThreadPoolExecutor(max_workers=workers)
+                else:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=workers, mp_context=multiprocessing.get_context('spawn')
+                    )
+            return self._executor
+
+    def _meta_path(self, job_id):
+        return os.path.join(self.job_dir, f"{job_id}.json")
+
+    def submit(self, database_url, export_format, filters):
+        """
+        Queue an export job
+
+        Returns:
+            dict: Job metadata including its id and 'queued' status
+        """
+        self.cleanup_expired()
+
+        job_id = uuid.uuid4().hex
+        meta = {
+            'id': job_id,
+            'format': export_format,
+            'status': 'queued',
+            'created_at': datetime.utcnow().isoformat(),
+            'filters': {k: (v.isoformat() if isinstance(v, datetime) else v) for k, v in filters.items()},
+        }
+        _write_json_atomic(self._meta_path(job_id), meta)
+
+        future = self._get_executor().submit(
+            render_export_job, database_url, self.job_dir, job_id, export_format, filters
+        )
+        future.add_done_callback(partial(_on_job_done, self._meta_path(job_id)))
+        logger.info("Queued %s export job %s", export_format, job_id)
+        return meta
+
+    def get(self, job_id):
+        """Return job metadata, or None for unknown or expired jobs"""
+        if not JOB_ID_PATTERN.match(job_id):
+            return None
+        self.cleanup_expired()
+        try:
+            with open(self._meta_path(job_id)) as fh:
+                return json.load(fh)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def result_path(self, job):
+        return os.path.join(self.job_dir, f"{job['id']}.{job['format']}")
+
+    def cleanup_expired(self):
+        """Delete job files older than EXPORT_TTL_SECONDS"""
+        cutoff = time.time() - self.app.config['EXPORT_TTL_SECONDS']
+        with os.scandir(self.job_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                except FileNotFoundError:
+                    pass  # Removed concurrently by another worker
+
+
+export_jobs = ExportJobManager()
@@ -0,0 +1,215 @@
+"""
+Transaction Export Service
+
+This module streams filtered transactions out of the database and
+serializes them for the export endpoints. Rows are read in server-side
+batches and written through small buffers, so memory use does not depend
+on the size of the ledger. Each batch's tags are fetched with one extra
+query against the transaction_tags table.
+"""
+
+import csv
+import io
+from datetime import datetime
+from fpdf import FPDF
+from sqlalchemy import select
+from app.extensions import db
+from app.models.transaction import Transaction, TransactionTag
+from app.utils.money import from_minor
+
+EXPORT_HEADERS = ['ID', 'Amount', 'Category', 'Description', 'Transaction Type', 'Date', 'Tags']
+
+# Columns selected for export, in EXPORT_HEADERS order (tags are attached per batch)
+EXPORT_COLUMNS = (
+    Transaction.id,
+    Transaction.amount_minor,
+    Transaction.category,
+    Transaction.description,
+    Transaction.transaction_type,
+    Transaction.date,
+)
+
+DEFAULT_BATCH_SIZE = 1000
+CSV_FLUSH_BYTES = 64 * 1024
+PDF_COL_WIDTHS = [10, 20, 30, 60, 28, 31, 45]
+
+
+class ExportTotals:
+    """Running income/expense totals accumulated exactly in minor units while rows are streamed"""
+
+    def __init__(self):
+        self.income_minor = 0
+        self.expenses_minor = 0
+        self.total_transactions = 0
+
+    def add(self, amount_minor, transaction_type):
+        self.total_transactions += 1
+        if transaction_type == 'income':
+            self.income_minor += amount_minor
+        elif transaction_type == 'expense':
+            self.expenses_minor += abs(amount_minor)
+
+    @property
+    def total_income(self):
+        return from_minor(self.income_minor)
+
+    @property
+    def total_expenses(self):
+        return from_minor(self.expenses_minor)
+
+    @property
+    def net_balance(self):
+        return from_minor(self.income_minor - self.expenses_minor)
+
+
+def export_statement(filters):
+    """Build the SELECT for an export with the listing filters applied"""
+    return select(*EXPORT_COLUMNS).where(*Transaction.filter_conditions(**filters))
+
+
+def iter_export_rows(filters, batch_size=DEFAULT_BATCH_SIZE, connection=None):
+    """
+    Yield export rows as column tuples, fetched from the database in batches
+
+    Args:
+        filters (dict): Keyword arguments for Transaction.filter_conditions
+        batch_size (int): Rows fetched per round trip (server-side cursor where supported)
+        connection (optional): Connection to read from (defaults to the app session)
+
+    Yields:
+        tuple: (id, amount_minor, category, description, transaction_type, date, tags)
+    """
+    connection = connection or db.session
+    stmt = export_statement(filters).execution_options(yield_per=batch_size)
+    for batch in connection.execute(stmt).partitions():
+        tags = TransactionTag.by_transaction(connection, [row[0] for row in batch])
+        for row in batch:
+            yield (*row, ','.join(tags.get(row[0], ())))
+
+
+async def aiter_export_rows(connection, filters, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Async counterpart of iter_export_rows for an AsyncConnection
+
+    Yields:
+        tuple: (id, amount_minor, category, description, transaction_type, date, tags)
+    """
+    stmt = export_statement(filters).execution_options(yield_per=batch_size)
+    result = await connection.stream(stmt)
+    async for batch in result.partitions():
+        tags = await connection.run_sync(TransactionTag.by_transaction, [row[0] for row in batch])
+        for row in batch:
+            yield (*row, ','.join(tags.get(row[0], ())))
+
+
+class CSVExportWriter:
+    """
+    Incremental CSV writer for export rows, shared by the sync and async endpoints
+
+    Rows are buffered and handed back in chunks of roughly flush_bytes; finish()
+    returns the remainder followed by the totals footer.
+    """
+
+    def __init__(self, totals, flush_bytes=CSV_FLUSH_BYTES):
+        self.totals = totals
+        self.flush_bytes = flush_bytes
+        self.buffer = io.StringIO()
+        self.writer = csv.writer(self.buffer)
+        self.writer.writerow(EXPORT_HEADERS)
+
+    def _drain(self):
+        chunk = self.buffer.getvalue()
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        return chunk
+
+    def write(self, row):
+        """Write one export row tuple; return a chunk once enough text is buffered, else None"""
+        tx_id, amount_minor, category, description, transaction_type, date, tags = row
+        self.totals.add(amount_minor, transaction_type)
+        self.writer.writerow([
+            tx_id, from_minor(amount_minor), category, description,
+            transaction_type, date.isoformat(), tags
+        ])
+        if self.buffer.tell() >= self.flush_bytes:
+            return self._drain()
+        return None
+
+    def finish(self):
+        """Return the buffered rows and the totals footer"""
+        # adding total expenses, income and balance at the end of the csv file
+        totals = self.totals
+        self.writer.writerow([])
+        self.writer.writerow(['', '', '', '', '', '', '', 'Total Income', totals.total_income])
+        self.writer.writerow(['', '', '', '', '', '', '', 'Total Expenses', totals.total_expenses])
+        self.writer.writerow(['', '', '', '', '', '', '', 'Net Balance', totals.net_balance])
+        return self._drain()
+
+
+def stream_csv(rows, totals, flush_bytes=CSV_FLUSH_BYTES):
+    """
+    Serialize export rows to CSV chunks
+
+    Args:
+        rows (iterable): Export row tuples from iter_export_rows
+        totals (ExportTotals): Updated in place as rows are written
+        flush_bytes (int): Approximate size of each yielded chunk
+
+    Yields:
+        str: CSV text chunks, ending with the totals footer
+    """
+    writer = CSVExportWriter(totals, flush_bytes)
+    for row in rows:
+        chunk = writer.write(row)
+        if chunk:
+            yield chunk
+    yield writer.finish()
+
+
+def render_pdf(rows, totals):
+    """
+    Render export rows as a PDF report
+
+    Args:
+        rows (iterable): Export row tuples from iter_export_rows
+        totals (ExportTotals): Updated in place as rows are rendered
+
+    Returns:
+        bytes: The PDF document
+    """
+    col_widths = PDF_COL_WIDTHS
+    pdf = FPDF(orientation='L')
+    pdf.add_page()
+    pdf.set_font("Arial", size=10)
+    pdf.cell(0, 10, "Transactions Report - FinanceAI-Advisor", align="L", ln=1)
+
+    for i, header in enumerate(EXPORT_HEADERS):
+        pdf.cell(col_widths[i], 10, header, 1, 0, 'C')
+    pdf.ln()
+
+    for tx_id, amount_minor, category, description, transaction_type, date, tags in rows:
+        totals.add(amount_minor, transaction_type)
+        row = [
+            str(tx_id), str(from_minor(amount_minor)), category, description,
+            transaction_type, date.strftime('%Y-%m-%d'), tags
+        ]
+        for i, field in enumerate(row):
+            # Use multi_cell for long text fields
+            if i in [3, 6]:
+                x_pos = pdf.get_x()
+                y_pos = pdf.get_y()
+                pdf.multi_cell(col_widths[i], 10, field, border=1)
+                pdf.set_xy(x_pos + col_widths[i], y_pos)
+            else:
+                pdf.cell(col_widths[i], 10, field, border=1)
+        pdf.ln(10)  # Move to next line after each row
+
+    pdf.ln(5)
+    pdf.cell(0, 10, f"Total Income: {totals.total_income}   Total Expenses: {totals.total_expenses}   Net Balance: {totals.net_balance}", 0, 1)
+
+    # add header saying generated by FinanceAI-Advisor with time and date
+    pdf.set_y(0)  # Move to top of page
+    pdf.set_font('Arial', 'I', 8)
+    pdf.cell(0, 10, f"Generated by FinanceAI-Advisor on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", 0, 0, 'C')
+
+    return pdf.output(dest='S').encode('latin-1')
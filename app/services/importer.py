@@ -0,0 +1,314 @@
+"""
+Bank Statement Import Service
+
+This module imports CSV and OFX bank statements through a generator
+pipeline, so only one batch of rows is in memory at a time:
+
+    decode_lines -> parse_csv / parse_ofx -> map_columns -> normalize
+                 -> validate -> batch_insert
+
+Each stage consumes the previous one lazily. Rows that fail to parse or
+validate are counted and reported (up to MAX_REPORTED_ERRORS) without
+stopping the import. Each batch is committed as it is inserted.
+"""
+
+import csv
+import html
+import io
+import re
+import time
+from datetime import datetime
+from app.extensions import db
+from app.services.ingest import DEFAULT_CHUNK_SIZE, insert_rows, transaction_row
+from app.utils.exceptions import ValidationError
+from app.utils.logger import logger
+from app.utils.validators import validate_transactions_batch
+
+SUPPORTED_FORMATS = ('csv', 'ofx')
+
+MAX_REPORTED_ERRORS = 100
+
+DEFAULT_CATEGORY = 'uncategorized'
+
+# Source columns tried for each field when no explicit mapping is given
+DEFAULT_CSV_MAPPING = {
+    'date': ('date', 'transaction date', 'txn date', 'value date', 'posted date'),
+    'description': ('description', 'narration', 'details', 'particulars', 'memo', 'name'),
+    'amount': ('amount', 'transaction amount'),
+    'debit': ('debit', 'withdrawal', 'withdrawal amt.', 'withdrawal amount'),
+    'credit': ('credit', 'deposit', 'deposit amt.', 'deposit amount'),
+    'category': ('category',),
+    'transaction_type': ('transaction_type', 'type'),
+    'tags': ('tags',),
+}
+
+OFX_MAPPING = {
+    'date': 'DTPOSTED',
+    'description': 'NAME',
+    'memo': 'MEMO',
+    'amount': 'TRNAMT',
+}
+
+# Statement type labels that map onto transaction types
+TYPE_ALIASES = {'debit': 'expense', 'dr': 'expense', 'credit': 'income', 'cr': 'income'}
+
+DATE_FORMATS = ('%d/%m/%Y', '%d-%m-%Y', '%d/%m/%y', '%d-%b-%Y', '%d %b %Y', '%m/%d/%Y')
+
+_OFX_DATE = re.compile(r'^(\d{8})(\d{6})?')
+_AMOUNT_NOISE = re.compile(r'[,\s₹$€£]|INR|Rs\.?', re.IGNORECASE)
+
+
+class ImportStats:
+    """Counters and throughput for a running import"""
+
+    def __init__(self, progress=None, progress_every=50000):
+        self.rows_read = 0
+        self.rows_inserted = 0
+        self.rows_failed = 0
+        self.errors = []
+        self.started = time.perf_counter()
+        self._progress = progress
+        self._progress_every = progress_every
+        self._next_report = progress_every
+
+    def fail(self, row, errors):
+        self.rows_failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'row': row, 'errors': errors})
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    @property
+    def rows_per_second(self):
+        elapsed = self.elapsed
+        return round(self.rows_read / elapsed) if elapsed else None
+
+    def report(self, final=False):
+        if self._progress and (final or self.rows_read >= self._next_report):
+            self._next_report = self.rows_read + self._progress_every
+            self._progress(self)
+
+    def to_dict(self):
+        return {
+            'rows_read': self.rows_read,
+            'rows_inserted': self.rows_inserted,
+            'rows_failed': self.rows_failed,
+            'errors': self.errors,
+            'elapsed_ms': round(self.elapsed * 1000, 2),
+            'rows_per_second': self.rows_per_second,
+        }
+
+
+# --- Pipeline stages ---
+
+def decode_lines(stream, encoding='utf-8'):
+    """Decode a binary stream into text lines without reading it all at once"""
+    text = io.TextIOWrapper(stream, encoding=encoding, errors='replace', newline='')
+    yield from text
+
+
+def parse_csv(lines):
+    """Yield (row_number, record) for each CSV data row, keyed by lower-cased header"""
+    reader = csv.reader(lines)
+    header = None
+    for row in reader:
+        if not any(cell.strip() for cell in row):
+            continue
+        if header is None:
+            header = [cell.strip().lstrip('\ufeff').lower() for cell in row]
+            continue
+        yield reader.line_num, dict(zip(header, row))
+
+
+def parse_ofx(lines):
+    """Yield (transaction_number, record) for each <STMTTRN> block of an OFX statement"""
+    record = None
+    count = 0
+    for line in lines:
+        for token in line.split('<')[1:]:
+            tag, _, value = token.partition('>')
+            tag = tag.strip().upper()
+            if tag == 'STMTTRN':
+                record = {}
+            elif tag == '/STMTTRN':
+                if record is not None:
+                    count += 1
+                    yield count, record
+                record = None
+            elif record is not None and not tag.startswith('/'):
+                record[tag] = html.unescape(value.strip())
+
+
+def map_columns(records, mapping):
+    """
+    Rename source columns to transaction fields
+
+    Args:
+        records (iterable): (row_number, source record) pairs
+        mapping (dict): field -> source column name, or tuple of candidate names
+    """
+    resolved = None
+    for row, record in records:
+        if resolved is None:
+            # Resolve candidate names once, against the first record's columns
+            resolved = {}
+            for field, source in mapping.items():
+                if isinstance(source, str):
+                    resolved[field] = source.lower() if source.lower() in record else source
+                    continue
+                for name in source:
+                    if name in record:
+                        resolved[field] = name
+                        break
+        yield row, {field: record.get(source) for field, source in resolved.items()}
+
+
+def _parse_amount(value):
+    if value is None:
+        return None
+    value = _AMOUNT_NOISE.sub('', str(value))
+    if not value:
+        return None
+    negative = value.startswith('(') and value.endswith(')')
+    if negative:
+        value = value[1:-1]
+    if value.endswith(('CR', 'Cr', 'cr')):
+        value = value[:-2]
+    elif value.endswith(('DR', 'Dr', 'dr')):
+        value, negative = value[:-2], True
+    amount = float(value)
+    return -amount if negative else amount
+
+
+def _parse_date(value):
+    value = (value or '').strip()
+    match = _OFX_DATE.match(value)
+    if match:
+        return datetime.strptime(match.group(1) + (match.group(2) or '000000'), '%Y%m%d%H%M%S')
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    if len(value) == 10 and value[2] == value[5] and value[2] in '/-' and value[:2].isdigit():
+        # Fast path for DD/MM/YYYY, the usual Indian bank statement format
+        try:
+            return datetime(int(value[6:]), int(value[3:5]), int(value[:2]))
+        except ValueError:
+            pass
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognized date: {value!r}")
+
+
+def normalize(records, stats):
+    """
+    Turn mapped records into API transaction payloads
+
+    Amounts are parsed from signed values or separate debit/credit columns;
+    the sign decides the transaction type when the statement has none, and
+    the stored amount is positive like transactions entered in the UI.
+    """
+    for row, record in records:
+        stats.rows_read += 1
+        try:
+            amount = _parse_amount(record.get('amount'))
+            if amount is None:
+                debit = _parse_amount(record.get('debit'))
+                credit = _parse_amount(record.get('credit'))
+                amount = (credit or 0) - abs(debit or 0)
+
+            description = ' '.join(filter(None, (record.get('description'), record.get('memo')))).strip()
+            transaction_type = (record.get('transaction_type') or '').strip().lower()
+            tags = record.get('tags')
+            yield row, {
+                'amount': abs(amount),
+                'category': (record.get('category') or '').strip() or DEFAULT_CATEGORY,
+                'description': description or 'Imported transaction',
+                'transaction_type': TYPE_ALIASES.get(transaction_type, transaction_type)
+                                    or ('income' if amount > 0 else 'expense'),
+                'date': _parse_date(record.get('date')).isoformat(),
+                'tags': [t.strip() for t in tags.split(',') if t.strip()] if tags else ['imported'],
+            }
+        except (TypeError, ValueError) as e:
+            stats.fail(row, [str(e)])
+        stats.report()
+
+
+def validate(payloads, stats, batch_size=DEFAULT_CHUNK_SIZE):
+    """Yield column rows for payloads that pass validation, checking them a batch at a time"""
+    now = datetime.utcnow()
+    for batch in _batches(payloads, batch_size):
+        for (row, payload), errors in zip(batch, validate_transactions_batch([p for _, p in batch])):
+            if errors:
+                stats.fail(row, list(errors))
+            else:
+                yield transaction_row(payload, now)
+
+
+def _batches(items, size):
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def batch_insert(rows, stats, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Insert rows in chunks, committing each chunk"""
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= chunk_size:
+            stats.rows_inserted += insert_rows(batch, chunk_size)
+            db.session.commit()
+            batch = []
+    if batch:
+        stats.rows_inserted += insert_rows(batch, chunk_size)
+        db.session.commit()
+
+
+def import_statement(stream, file_format, mapping=None, encoding='utf-8',
+                     chunk_size=DEFAULT_CHUNK_SIZE, progress=None):
+    """
+    Import a bank statement from a binary stream
+
+    Args:
+        stream: Binary file-like object
+        file_format (str): 'csv' or 'ofx'
+        mapping (dict, optional): field -> source column overrides for CSV
+        encoding (str): Text encoding of the statement
+        chunk_size (int): Rows per insert/commit batch
+        progress (callable, optional): Called with ImportStats periodically
+
+    Returns:
+        ImportStats: Final counters
+    """
+    if file_format not in SUPPORTED_FORMATS:
+        raise ValidationError("Unsupported import format", [f"format must be one of: {', '.join(SUPPORTED_FORMATS)}"])
+
+    stats = ImportStats(progress)
+    lines = decode_lines(stream, encoding)
+    if file_format == 'ofx':
+        records = map_columns(parse_ofx(lines), OFX_MAPPING)
+    else:
+        records = map_columns(parse_csv(lines), {**DEFAULT_CSV_MAPPING, **(mapping or {})})
+
+    try:
+        batch_insert(validate(normalize(records, stats), stats, chunk_size), stats, chunk_size)
+    except Exception:
+        db.session.rollback()
+        raise
+    finally:
+        stats.report(final=True)
+
+    logger.info("Imported %s of %s rows (%s failed) at %s rows/sec",
+                stats.rows_inserted, stats.rows_read, stats.rows_failed, stats.rows_per_second)
+    return stats
@@ -0,0 +1,92 @@
+"""
+Transaction Ingestion Service
+
+This module turns validated transaction payloads into rows and inserts them
+in chunks with executemany, bypassing per-row ORM object construction. Tag
+rows are inserted the same way using the ids returned by the transaction
+INSERT. The ledger version is bumped once per call and stamped on every
+row for the change feed, and the daily rollups are updated once per
+affected bucket, in the same DB transaction.
+"""
+
+from datetime import datetime
+from sqlalchemy import insert
+from app.extensions import db
+from app.models.transaction import Transaction, TransactionTag
+from app.services import ledger, rollups
+from app.utils.money import to_minor
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def transaction_row(data, now=None):
+    """
+    Build the column values for a validated transaction payload
+
+    Mirrors what create_transaction stores for the same payload.
+
+    Args:
+        data (dict): Payload accepted by validate_transaction_data
+        now (datetime, optional): Timestamp for created_at and missing dates
+
+    Returns:
+        dict: Column values for an INSERT into transactions, plus a 'tags'
+        list (or None) that insert_rows writes to transaction_tags
+    """
+    now = now or datetime.utcnow()
+    return {
+        'amount_minor': to_minor(data['amount']),
+        'category': data['category'],
+        'category_key': data['category'].casefold(),
+        'description': data['description'],
+        'transaction_type': data['transaction_type'].lower(),
+        'date': datetime.fromisoformat(data['date']) if data.get('date') else now,
+        'created_at': now,
+        'tags': data.get('tags') or None,
+    }
+
+
+def insert_rows(rows, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Insert transaction rows in chunks and update the rollups
+
+    The caller owns the DB transaction and must commit.
+
+    Args:
+        rows (list): Column dicts from transaction_row
+        chunk_size (int): Rows per executemany batch
+
+    Returns:
+        int: Number of rows inserted
+    """
+    table = Transaction.__table__
+    stmt = insert(table)
+    returning_ids = insert(table).returning(table.c.id, sort_by_parameter_order=True)
+    tag_stmt = insert(TransactionTag.__table__)
+    if not rows:
+        return 0
+    version = ledger.bump()
+
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        tags = [row['tags'] for row in chunk]
+        params = [{key: value for key, value in row.items() if key != 'tags'} for row in chunk]
+        for row_params in params:
+            row_params['change_version'] = version
+        if not any(tags):
+            db.session.execute(stmt, params)
+            continue
+
+        ids = db.session.execute(returning_ids, params).scalars().all()
+        tag_rows = [
+            {'transaction_id': transaction_id, 'position': position, 'tag': tag}
+            for transaction_id, row_tags in zip(ids, tags) if row_tags
+            for position, tag in enumerate(row_tags)
+        ]
+        db.session.execute(tag_stmt, tag_rows)
+
+    rollups.add(
+        rollups.BucketValues(row['date'], row['category'], row['transaction_type'], row['amount_minor'])
+        for row in rows
+    )
+    return len(rows)
@@ -0,0 +1,71 @@
+"""
+Ledger Version Service
+
+This module maintains the ledger version counter (app.models.ledger).
+Mutating routes and ingestion call bump() inside the same database
+transaction as the change itself, next to their rollup updates, so the
+version commits or rolls back together with the ledger.
+
+Writers call bump() before touching transactions or rollup buckets: the
+UPDATE locks the ledger row, so taking it first gives every writer the
+same lock order (ledger row, then rows and buckets) and concurrent
+writers queue on it instead of deadlocking on PostgreSQL.
+
+Read endpoints turn the current version into validators (ETag and
+Last-Modified) and answer conditional requests from this one row; see
+app.api.conditional.
+"""
+
+import uuid
+from collections import namedtuple
+from datetime import datetime
+from sqlalchemy import insert, select, update
+from app.extensions import db
+from app.models.ledger import LedgerState
+
+LEDGER_ID = 1
+
+LedgerVersion = namedtuple('LedgerVersion', 'epoch version updated_at')
+
+
+def current(connection=None):
+    """
+    Return the current LedgerVersion
+
+    Args:
+        connection (optional): Connection or session to read with (defaults to db.session)
+
+    Returns:
+        LedgerVersion, or None before the ledger has ever been changed on a
+        database created without migrations
+    """
+    connection = connection if connection is not None else db.session
+    table = LedgerState.__table__
+    row = connection.execute(
+        select(table.c.epoch, table.c.version, table.c.updated_at).where(table.c.id == LEDGER_ID)
+    ).first()
+    return LedgerVersion(*row) if row else None
+
+
+def bump(connection=None):
+    """
+    Increment the ledger version; the caller owns the DB transaction
+
+    Args:
+        connection (optional): Connection or session to write with (defaults to db.session)
+
+    Returns:
+        int: The new version, which writers also stamp on the rows they change
+        (see app.services.changes)
+    """
+    connection = connection if connection is not None else db.session
+    table = LedgerState.__table__
+    now = datetime.utcnow()
+    result = connection.execute(
+        update(table).where(table.c.id == LEDGER_ID).values(version=table.c.version + 1, updated_at=now)
+    )
+    if result.rowcount == 0:
+        connection.execute(insert(table).values(id=LEDGER_ID, epoch=uuid.uuid4().hex, version=1, updated_at=now))
+        return 1
+    # The UPDATE holds the row's write lock, so this reads our own increment
+    return connection.execute(select(table.c.version).where(table.c.id == LEDGER_ID)).scalar_one()
@@ -0,0 +1,83 @@
+"""
+Transaction Lookup Service
+
+This module backs the typeahead used to pick a transaction in the
+frontend's update and delete forms. A query is matched as:
+
+    an id          when it is all digits (primary key lookup)
+    a prefix of    the category (case-folded, ix_transactions_category_key_date)
+    a prefix of    the description (lowercased, ix_transactions_description_lower)
+
+Each match is read newest first off an index and stops after `limit` rows,
+so the cost of a lookup depends on the limit rather than the size of the
+ledger. Exact id matches rank first, then the prefix matches by
+recency. An empty query returns the most recent transactions.
+"""
+
+from sqlalchemy import func, select
+from app.models.transaction import Transaction
+from app.services.serialization import LISTING_COLUMNS, listing_statement, serialize_rows
+from app.utils.exceptions import ValidationError
+
+DEFAULT_LOOKUP_LIMIT = 10
+MAX_LOOKUP_LIMIT = 50
+MAX_QUERY_LENGTH = 100
+# Categories searched for one prefix; longer prefixes narrow it down
+MAX_PREFIX_CATEGORIES = 20
+
+# Sorts after any character, closing a prefix range on the index
+_PREFIX_END = '\U0010ffff'
+
+
+def _prefix_of(expression, prefix):
+    return (expression >= prefix) & (expression < prefix + _PREFIX_END)
+
+
+def lookup_transactions(connection, query, limit=DEFAULT_LOOKUP_LIMIT):
+    """
+    Return the top matches for a typeahead query
+
+    Args:
+        connection: Session or Connection to read from
+        query (str): Text typed by the user
+        limit (int): Maximum matches to return
+
+    Returns:
+        list: Transaction objects as returned by the listing, best match first
+
+    Raises:
+        ValidationError: If the query is too long
+    """
+    query = (query or '').strip()
+    if len(query) > MAX_QUERY_LENGTH:
+        raise ValidationError("Invalid query", [f"q must be at most {MAX_QUERY_LENGTH} characters"])
+    if not query:
+        return serialize_rows(connection, connection.execute(listing_statement({}).limit(limit)).all())
+
+    exact = []
+    if query.isdigit():
+        exact = connection.execute(select(*LISTING_COLUMNS).where(Transaction.id == int(query))).all()
+
+    newest_first = (Transaction.date.desc(), Transaction.id.desc())
+    # A short prefix can cover whole categories; reading each matching
+    # category's newest rows off (category_key, date) avoids sorting them all
+    category_keys = connection.execute(
+        select(Transaction.category_key).distinct()
+        .where(_prefix_of(Transaction.category_key, query.casefold()))
+        .limit(MAX_PREFIX_CATEGORIES)
+    ).scalars().all()
+    conditions = [Transaction.category_key == key for key in category_keys]
+    conditions.append(_prefix_of(func.lower(Transaction.description), query.lower()))
+    matches = []
+    for condition in conditions:
+        matches += connection.execute(
+            select(*LISTING_COLUMNS).where(condition).order_by(*newest_first).limit(limit)
+        ).all()
+    matches.sort(key=lambda row: (row.date, row.id), reverse=True)
+
+    rows, seen = [], set()
+    for row in exact + matches:
+        if row.id not in seen:
+            seen.add(row.id)
+            rows.append(row)
+    return serialize_rows(connection, rows[:limit])
@@ -0,0 +1,236 @@
+"""
+Response Cache
+
+This module caches the bodies of read endpoints (summary and listing) so
+identical requests are not recomputed. Entries are keyed on:
+
+    endpoint | ledger ETag | normalized query parameters
+
+The ledger ETag (app.api.conditional) carries the ledger version and the
+Accept variant, so a committed mutation in any worker process makes every
+earlier entry unreachable; the mutating routes also call invalidate() to
+release this process's entries at once. Query parameters are normalized
+through the same parsers the views use, so ?category=Food&tag=x and
+?tag=x&category=food share an entry, and parameters the views ignore
+(e.g. cache busters) do not split it.
+
+Entries live in an in-process LRU bounded by a byte budget and a TTL, and,
+when RESPONSE_CACHE_URI points at Redis, in a shared second tier that all
+workers read before recomputing. Redis errors are logged and treated as
+misses. Hits, misses, evictions and the cache's size are exported through
+app.utils.metrics.
+
+Configuration (environment):
+    RESPONSE_CACHE_ENABLED (bool): Default true
+    RESPONSE_CACHE_MAX_BYTES (int): In-process budget, default 64 MiB
+    RESPONSE_CACHE_TTL (int): Seconds an entry is kept, default 300
+    RESPONSE_CACHE_URI (str): Optional shared tier, e.g. redis://localhost:6379/1
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from app.utils import metrics
+from app.utils.logger import logger
+
+# Approximate per-entry bookkeeping (key, tuple, OrderedDict node) added to the body size
+ENTRY_OVERHEAD_BYTES = 256
+
+REDIS_KEY_PREFIX = 'financeai:response:'
+
+CachedResponse = namedtuple('CachedResponse', 'content_type headers body')
+
+CACHE_REQUESTS = metrics.registry.register(metrics.Counter(
+    'response_cache_requests_total', 'Response cache lookups, by endpoint and result', ('endpoint', 'result')))
+CACHE_EVICTIONS = metrics.registry.register(metrics.Counter(
+    'response_cache_evictions_total', 'Entries dropped from the in-process cache, by reason', ('reason',)))
+CACHE_BYTES = metrics.registry.register(metrics.Gauge(
+    'response_cache_bytes', 'Approximate memory held by the in-process response cache'))
+CACHE_ENTRIES = metrics.registry.register(metrics.Gauge(
+    'response_cache_entries', 'Entries in the in-process response cache'))
+
+
+def encode_entry(entry):
+    """Serialize a CachedResponse as a JSON header line followed by the body"""
+    head = json.dumps([entry.content_type, entry.headers]).encode('utf-8')
+    return head + b'\n' + entry.body
+
+
+def decode_entry(data):
+    head, body = data.split(b'\n', 1)
+    content_type, headers = json.loads(head)
+    return CachedResponse(content_type, [tuple(header) for header in headers], body)
+
+
+class LRUCache:
+    """Thread-safe LRU of byte strings with a total size budget and per-entry TTL"""
+
+    def __init__(self, max_bytes, ttl):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self._entries = OrderedDict()  # key -> (expires_at, size, value)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            if item[0] <= time.monotonic():
+                self._drop(key, 'expired')
+                return None
+            self._entries.move_to_end(key)
+            return item[2]
+
+    def set(self, key, value, size):
+        size += len(key) + ENTRY_OVERHEAD_BYTES
+        if size > self.max_bytes:
+            return False
+        with self._lock:
+            if key in self._entries:
+                self._drop(key, 'replaced')
+            while self.size + size > self.max_bytes:
+                self._drop(next(iter(self._entries)), 'size')
+            self._entries[key] = (time.monotonic() + self.ttl, size, value)
+            self.size += size
+            self._report()
+        return True
+
+    def clear(self, reason='invalidated'):
+        with self._lock:
+            for key in list(self._entries):
+                self._drop(key, reason)
+
+    def _drop(self, key, reason):
+        # Caller holds the lock
+        self.size -= self._entries.pop(key)[1]
+        CACHE_EVICTIONS.inc(reason)
+        self._report()
+
+    def _report(self):
+        CACHE_BYTES.set(self.size)
+        CACHE_ENTRIES.set(len(self._entries))
+
+
+class RedisTier:
+    """Shared cache tier on a Redis-protocol server; entries expire by TTL"""
+
+    def __init__(self, uri, ttl, client=None):
+        if client is None:
+            import redis
+            client = redis.Redis.from_url(uri)
+        self.client = client
+        self.ttl = ttl
+
+    def get(self, key):
+        return self.client.get(REDIS_KEY_PREFIX + key)
+
+    def set(self, key, data):
+        self.client.set(REDIS_KEY_PREFIX + key, data, ex=self.ttl)
+
+
+class ResponseCache:
+    """
+    Two-tier response cache
+
+    Configuration:
+        RESPONSE_CACHE_ENABLED, RESPONSE_CACHE_MAX_BYTES, RESPONSE_CACHE_TTL,
+        RESPONSE_CACHE_URI (see the module docstring)
+    """
+
+    def __init__(self, app=None):
+        self.local = None
+        self.shared = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('RESPONSE_CACHE_ENABLED',
+                              os.getenv('RESPONSE_CACHE_ENABLED', 'True').lower() == 'true')
+        app.config.setdefault('RESPONSE_CACHE_MAX_BYTES', int(os.getenv('RESPONSE_CACHE_MAX_BYTES', 64 * 1024 * 1024)))
+        app.config.setdefault('RESPONSE_CACHE_TTL', int(os.getenv('RESPONSE_CACHE_TTL', 300)))
+        app.config.setdefault('RESPONSE_CACHE_URI', os.getenv('RESPONSE_CACHE_URI') or None)
+        app.extensions['response_cache'] = self
+
+        self.local = self.shared = None
+        if app.config['RESPONSE_CACHE_ENABLED']:
+            self.local = LRUCache(app.config['RESPONSE_CACHE_MAX_BYTES'], app.config['RESPONSE_CACHE_TTL'])
+            if app.config['RESPONSE_CACHE_URI']:
+                self.shared = RedisTier(app.config['RESPONSE_CACHE_URI'], app.config['RESPONSE_CACHE_TTL'])
+
+    @property
+    def enabled(self):
+        return self.local is not None
+
+    def get(self, endpoint, key):
+        """Return the CachedResponse for key, or None on a miss"""
+        entry = self.local.get(key)
+        if entry is not None:
+            CACHE_REQUESTS.inc(endpoint, 'hit')
+            return entry
+        if self.shared is not None:
+            try:
+                data = self.shared.get(key)
+            except Exception as e:
+                logger.warning("Shared response cache read failed: %s", e)
+                data = None
+            if data is not None:
+                entry = decode_entry(data)
+                self.local.set(key, entry, len(entry.body))
+                CACHE_REQUESTS.inc(endpoint, 'shared_hit')
+                return entry
+        CACHE_REQUESTS.inc(endpoint, 'miss')
+        return None
+
+    def set(self, key, entry):
+        """Store a CachedResponse in both tiers"""
+        self.local.set(key, entry, len(entry.body))
+        if self.shared is not None:
+            try:
+                self.shared.set(key, encode_entry(entry))
+            except Exception as e:
+                logger.warning("Shared response cache write failed: %s", e)
+
+    def invalidate(self):
+        """Drop this process's entries after a mutation (shared entries are superseded by the new ledger version)"""
+        if self.local is not None:
+            self.local.clear()
+
+
+response_cache = ResponseCache()
+
+
+def cache_key(endpoint, ledger_tag, filters, page=None, export_format=None, options=None):
+    """
+    Build the cache key for a read request from its parsed parameters
+
+    Args:
+        endpoint (str): Endpoint name
+        ledger_tag (str): ETag from app.api.conditional.ledger_etag
+        filters (dict): Output of parse_filter_params
+        page (dict, optional): Output of parse_page_params
+        export_format (str, optional): Columnar format requested by ?format=
+        options (dict, optional): Other parsed parameters the response depends on
+    """
+    normalized = {
+        'category': filters['category'].casefold() if filters['category'] else None,
+        'transaction_type': filters['transaction_type'].lower() if filters['transaction_type'] else None,
+        'start_date': filters['start_date'].isoformat() if filters['start_date'] else None,
+        'end_date': filters['end_date'].isoformat() if filters['end_date'] else None,
+        'tag': filters['tag'],
+    }
+    if page is not None:
+        after = page['after']
+        normalized['limit'] = page['limit']
+        normalized['after'] = [after[0].isoformat(), after[1]] if after else None
+    if export_format:
+        normalized['format'] = export_format
+    if options:
+        normalized['options'] = options
+    return f"{endpoint}|{ledger_tag}|{json.dumps(normalized, sort_keys=True, separators=(',', ':'))}"
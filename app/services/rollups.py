@@ -0,0 +1,296 @@
+"""
+Transaction Rollup Service
+
+This module maintains the per-day rollup table incrementally. Mutating
+routes call add()/remove() with the affected transactions inside the same
+database transaction as the change itself, so the rollups commit or roll
+back together with the ledger.
+
+The summary endpoint reads the rollups instead of scanning the ledger
+whenever the requested filters line up with whole days.
+"""
+
+from collections import namedtuple
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+from sqlalchemy import case, delete, func, insert, literal, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from app.extensions import db
+from app.models.rollup import TransactionRollup
+from app.models.transaction import Transaction
+
+# Values of a transaction that determine its rollup bucket and contribution
+BucketValues = namedtuple('BucketValues', 'date category transaction_type amount_minor')
+
+# INSERT constructs supporting ON CONFLICT DO UPDATE, by dialect
+_UPSERTS = {'sqlite': sqlite.insert, 'postgresql': postgresql.insert}
+
+# Rollup columns a delta adds to
+_DELTA_COLUMNS = ('total_amount_minor', 'total_abs_amount_minor', 'transaction_count', 'first_date', 'last_date')
+
+ROLLUP_COLUMNS = [
+    TransactionRollup.day,
+    TransactionRollup.category,
+    TransactionRollup.transaction_type,
+    TransactionRollup.category_key,
+    TransactionRollup.total_amount_minor,
+    TransactionRollup.total_abs_amount_minor,
+    TransactionRollup.transaction_count,
+    TransactionRollup.first_date,
+    TransactionRollup.last_date,
+]
+
+
+class _Delta:
+    """Aggregated change to one rollup bucket (amounts in minor units)"""
+
+    __slots__ = ('amount', 'abs_amount', 'count', 'first', 'last')
+
+    def __init__(self, first):
+        self.amount = 0
+        self.abs_amount = 0
+        self.count = 0
+        self.first = self.last = first
+
+
+def snapshot(transaction):
+    """Capture the rollup-relevant values of a transaction before it changes"""
+    return BucketValues(transaction.date, transaction.category,
+                        transaction.transaction_type, transaction.amount_minor)
+
+
+def _group(values):
+    buckets = {}
+    for v in values:
+        key = (v.date.date(), v.category, v.transaction_type)
+        delta = buckets.get(key)
+        if delta is None:
+            delta = buckets[key] = _Delta(v.date)
+        delta.amount += v.amount_minor
+        delta.abs_amount += abs(v.amount_minor)
+        delta.count += 1
+        delta.first = min(delta.first, v.date)
+        delta.last = max(delta.last, v.date)
+    return buckets
+
+
+def _bucket_filter(key):
+    day, category, transaction_type = key
+    return (
+        TransactionRollup.day == day,
+        TransactionRollup.category == category,
+        TransactionRollup.transaction_type == transaction_type,
+    )
+
+
+def _merged_values(c, new):
+    """SET clause adding the delta row `new` to the existing bucket columns `c`"""
+    return {
+        'total_amount_minor': c.total_amount_minor + new.total_amount_minor,
+        'total_abs_amount_minor': c.total_abs_amount_minor + new.total_abs_amount_minor,
+        'transaction_count': c.transaction_count + new.transaction_count,
+        'first_date': case((new.first_date < c.first_date, new.first_date), else_=c.first_date),
+        'last_date': case((new.last_date > c.last_date, new.last_date), else_=c.last_date),
+    }
+
+
+def _increment_all(buckets):
+    """
+    Add positive deltas to their buckets, creating missing buckets
+
+    On SQLite and PostgreSQL this is one executemany INSERT ... ON CONFLICT
+    DO UPDATE: the database adds each delta or inserts the bucket atomically,
+    so concurrent writers creating the same bucket do not race. Other
+    dialects UPDATE each bucket and INSERT it when no row matched, which is
+    safe because every writer holds the ledger row lock (ledger.bump()) first.
+    """
+    table = TransactionRollup.__table__
+    c = table.c
+    rows = [
+        {
+            'day': day, 'category': category, 'transaction_type': transaction_type,
+            'category_key': category.casefold(),
+            'total_amount_minor': delta.amount, 'total_abs_amount_minor': delta.abs_amount,
+            'transaction_count': delta.count, 'first_date': delta.first, 'last_date': delta.last,
+        }
+        for (day, category, transaction_type), delta in buckets.items()
+    ]
+
+    upsert = _UPSERTS.get(db.engine.dialect.name)
+    if upsert is not None:
+        stmt = upsert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[c.day, c.category, c.transaction_type],
+            set_=_merged_values(c, stmt.excluded),
+        )
+        db.session.execute(stmt, rows)
+        return
+
+    for key, row in zip(buckets, rows):
+        new = SimpleNamespace(**{name: literal(row[name], c[name].type) for name in _DELTA_COLUMNS})
+        result = db.session.execute(update(table).where(*_bucket_filter(key)).values(_merged_values(c, new)))
+        if result.rowcount == 0:
+            db.session.execute(insert(table), row)
+
+
+def _decrement(key, delta):
+    r = TransactionRollup
+    db.session.execute(
+        update(r).where(*_bucket_filter(key)).values(
+            total_amount_minor=r.total_amount_minor - delta.amount,
+            total_abs_amount_minor=r.total_abs_amount_minor - delta.abs_amount,
+            transaction_count=r.transaction_count - delta.count,
+        ).execution_options(synchronize_session=False)
+    )
+    row = db.session.execute(
+        select(r.transaction_count, r.first_date, r.last_date).where(*_bucket_filter(key))
+    ).first()
+    if row is None:
+        return  # Bucket was never rolled up; check-rollups will report it
+
+    if row.transaction_count <= 0:
+        db.session.execute(delete(r).where(*_bucket_filter(key)))
+    elif delta.first <= row.first_date or delta.last >= row.last_date:
+        # A boundary transaction left the bucket; recompute from the day's rows
+        day, category, transaction_type = key
+        start = datetime.combine(day, time.min)
+        first, last = db.session.execute(
+            select(func.min(Transaction.date), func.max(Transaction.date)).where(
+                Transaction.transaction_type == transaction_type,
+                Transaction.category == category,
+                Transaction.date >= start,
+                Transaction.date < start + timedelta(days=1),
+            )
+        ).one()
+        db.session.execute(
+            update(r).where(*_bucket_filter(key)).values(first_date=first, last_date=last)
+        )
+
+
+def add(values):
+    """
+    Add transactions to their rollup buckets
+
+    Args:
+        values (iterable): BucketValues (see snapshot()) of inserted transactions
+    """
+    db.session.flush()
+    buckets = _group(values)
+    if buckets:
+        _increment_all(buckets)
+
+
+def remove(values):
+    """
+    Remove transactions from their rollup buckets
+
+    Must run after the removal itself has been applied to the transactions
+    table (the session is flushed first), so boundary recomputation sees it.
+
+    Args:
+        values (iterable): BucketValues captured before the change
+    """
+    db.session.flush()
+    for key, delta in _group(values).items():
+        _decrement(key, delta)
+
+
+def can_serve(filters):
+    """Return True if the filters can be answered exactly from daily rollups"""
+    start_date = filters.get('start_date')
+    if filters.get('end_date') is not None or filters.get('tag'):
+        return False
+    return start_date is None or start_date.time() == time.min
+
+
+def filter_conditions(filters):
+    """Build WHERE conditions on the rollup table for filters accepted by can_serve"""
+    r = TransactionRollup
+    conditions = []
+    if filters.get('category'):
+        conditions.append(r.category_key == filters['category'].casefold())
+    if filters.get('transaction_type'):
+        conditions.append(r.transaction_type == filters['transaction_type'].lower())
+    if filters.get('start_date'):
+        conditions.append(r.day >= filters['start_date'].date())
+    return conditions
+
+
+def summary_statement(filters):
+    """Build the summary aggregate over the rollup table (same row shape as the ledger query)"""
+    r = TransactionRollup
+    return (
+        select(
+            r.category,
+            r.transaction_type,
+            func.sum(r.total_amount_minor),
+            func.sum(r.total_abs_amount_minor),
+            func.sum(r.transaction_count),
+            func.min(r.first_date),
+            func.max(r.last_date),
+        )
+        .where(*filter_conditions(filters))
+        .group_by(r.category, r.transaction_type)
+    )
+
+
+def source_statement():
+    """Build the GROUP BY over the ledger that the rollup table materializes"""
+    day = func.date(Transaction.date)
+    return (
+        select(
+            day,
+            Transaction.category,
+            Transaction.transaction_type,
+            func.min(Transaction.category_key),
+            func.sum(Transaction.amount_minor),
+            func.sum(func.abs(Transaction.amount_minor)),
+            func.count(),
+            func.min(Transaction.date),
+            func.max(Transaction.date),
+        )
+        .group_by(day, Transaction.category, Transaction.transaction_type)
+    )
+
+
+def rebuild():
+    """
+    Recompute the whole rollup table from the ledger with one INSERT ... SELECT
+
+    Returns:
+        int: Number of rollup rows written
+    """
+    db.session.execute(delete(TransactionRollup))
+    db.session.execute(insert(TransactionRollup).from_select(ROLLUP_COLUMNS, source_statement()))
+    return db.session.scalar(select(func.count()).select_from(TransactionRollup))
+
+
+def check():
+    """
+    Compare the rollup table with a fresh aggregation of the ledger
+
+    Returns:
+        list: Human-readable descriptions of inconsistent buckets (empty if consistent)
+    """
+    def as_date(value):
+        return date.fromisoformat(value) if isinstance(value, str) else value
+
+    expected = {
+        (as_date(row[0]), row[1], row[2]): tuple(row[4:])
+        for row in db.session.execute(source_statement())
+    }
+    actual = {
+        (row[0], row[1], row[2]): tuple(row[4:])
+        for row in db.session.execute(select(*ROLLUP_COLUMNS))
+    }
+
+    problems = []
+    for key in sorted(expected.keys() | actual.keys()):
+        want, got = expected.get(key), actual.get(key)
+        if want is None:
+            problems.append(f"{key}: rollup row has no matching transactions")
+        elif got is None:
+            problems.append(f"{key}: missing rollup row")
+        elif want != got:
+            problems.append(f"{key}: expected {want}, found {got}")
+    return problems
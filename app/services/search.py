@@ -0,0 +1,102 @@
+"""
+Transaction Search Service
+
+This module runs full-text searches over transaction categories and
+descriptions. On SQLite the query goes to the FTS5 table kept in sync by
+triggers and is ranked with bm25 (category matches weigh more than
+description matches); on PostgreSQL it uses the GIN-indexed tsvector
+expression and ts_rank. See the full-text section of
+app.models.transaction. Other databases fall back to unranked, case-folded
+LIKE matching, newest first.
+
+User input is reduced to its words, each matched as a prefix and all
+required, so "groc mark" finds "Groceries at market" and no FTS query
+syntax reaches the database. The listing filters apply on top of the
+match. Without search words the filtered listing is returned, newest
+first.
+"""
+
+import re
+from sqlalchemy import column, func, literal_column, select, table
+from app.extensions import db
+from app.models.transaction import FTS_DOCUMENT_SQL, FTS_TABLE, Transaction
+from app.services.serialization import LISTING_COLUMNS, serialize_rows
+from app.utils.exceptions import ValidationError
+
+DEFAULT_SEARCH_LIMIT = 50
+MAX_SEARCH_LIMIT = 200
+MAX_QUERY_LENGTH = 200
+
+# bm25 weights for the FTS5 columns (category, description)
+BM25_WEIGHTS = (2.0, 1.0)
+
+_WORD = re.compile(r'\w+', re.UNICODE)
+
+
+def query_words(query):
+    """Split search input into the words that are matched"""
+    return _WORD.findall(query or '')
+
+
+def _ranked_statement(words, dialect):
+    """Return a SELECT of LISTING_COLUMNS for rows matching every word, best match first where ranked"""
+    newest_first = (Transaction.date.desc(), Transaction.id.desc())
+    if dialect == 'sqlite':
+        fts = table(FTS_TABLE, column('rowid'))
+        match = literal_column(FTS_TABLE).op('MATCH')(' '.join(f'"{word}"*' for word in words))
+        score = func.bm25(literal_column(FTS_TABLE), *BM25_WEIGHTS)
+        return (select(*LISTING_COLUMNS).select_from(fts)
+                .join(Transaction, Transaction.id == fts.c.rowid)
+                .where(match)
+                .order_by(score, *newest_first))
+    if dialect == 'postgresql':
+        document = literal_column(FTS_DOCUMENT_SQL)
+        tsquery = func.to_tsquery(literal_column("'simple'"), ' & '.join(f'{word}:*' for word in words))
+        match = document.op('@@')(tsquery)
+        return (select(*LISTING_COLUMNS)
+                .where(match)
+                .order_by(func.ts_rank(document, tsquery).desc(), *newest_first))
+    # No full-text index elsewhere: every word must occur in the case-folded
+    # category or description, and there is no rank to order by
+    description = func.lower(Transaction.description)
+    return (select(*LISTING_COLUMNS)
+            .where(*(Transaction.category_key.contains(word.casefold(), autoescape=True)
+                     | description.contains(word.lower(), autoescape=True) for word in words))
+            .order_by(*newest_first))
+
+
+def search_transactions(connection, query, filters, limit=DEFAULT_SEARCH_LIMIT, offset=0):
+    """
+    Return one page of search hits
+
+    Args:
+        connection: Session or Connection to read from
+        query (str): Search input; empty for the filtered listing
+        filters (dict): Keyword arguments for Transaction.filter_conditions
+        limit (int): Hits per page
+        offset (int): Hits to skip
+
+    Returns:
+        tuple: (transaction objects as returned by the listing, total hits,
+        offset of the next page or None)
+
+    Raises:
+        ValidationError: If the query is too long
+    """
+    if len(query or '') > MAX_QUERY_LENGTH:
+        raise ValidationError("Invalid query", [f"q must be at most {MAX_QUERY_LENGTH} characters"])
+    conditions = Transaction.filter_conditions(**filters)
+    words = query_words(query)
+    if words:
+        stmt = _ranked_statement(words, db.engine.dialect.name).where(*conditions)
+        count = select(func.count()).select_from(stmt.order_by(None).subquery())
+    else:
+        stmt = (select(*LISTING_COLUMNS).where(*conditions)
+                .order_by(Transaction.date.desc(), Transaction.id.desc()))
+        count = select(func.count()).select_from(Transaction).where(*conditions)
+
+    rows = connection.execute(stmt.limit(limit + 1).offset(offset)).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    total = connection.execute(count).scalar_one()
+    return serialize_rows(connection, rows), total, (offset + limit if has_more else None)
@@ -0,0 +1,88 @@
+"""
+Transaction Serialization Service
+
+This module is the fast path for large transaction listings. Rows are
+selected as plain column tuples and turned straight into JSON-ready values,
+so no ORM objects are built and Transaction.to_dict is not called. Dates
+are left as datetime objects for the JSON provider, which writes them
+natively instead of calling isoformat() twice per row in Python. Tags for
+the whole page come from one query against transaction_tags.
+"""
+
+from sqlalchemy import select, tuple_
+from app.models.transaction import Transaction, TransactionTag
+from app.utils.money import MINOR_UNITS
+from app.utils.pagination import encode_cursor
+
+# Columns selected for listings, in the order serialize_rows unpacks them
+LISTING_COLUMNS = (
+    Transaction.id,
+    Transaction.amount_minor,
+    Transaction.category,
+    Transaction.description,
+    Transaction.transaction_type,
+    Transaction.date,
+    Transaction.created_at,
+)
+
+
+def listing_statement(filters):
+    """Build the listing SELECT with filters applied, newest first"""
+    return (
+        select(*LISTING_COLUMNS)
+        .where(*Transaction.filter_conditions(**filters))
+        .order_by(Transaction.date.desc(), Transaction.id.desc())
+    )
+
+
+def listing_rows(connection, filters, page=None):
+    """
+    Run the listing query, one keyset page at a time when page is given
+
+    Args:
+        connection: Session or Connection to read from
+        filters (dict): Keyword arguments for Transaction.filter_conditions
+        page (dict, optional): Parsed page parameters from parse_page_params
+
+    Returns:
+        tuple: (rows as LISTING_COLUMNS tuples, next_cursor or None)
+    """
+    stmt = listing_statement(filters)
+    if page is None:
+        return connection.execute(stmt).all(), None
+
+    # Keyset pagination: continue strictly after the last (date, id) seen,
+    # so every page is an index range scan regardless of depth
+    if page['after']:
+        stmt = stmt.where(tuple_(Transaction.date, Transaction.id) < page['after'])
+    rows = connection.execute(stmt.limit(page['limit'] + 1)).all()
+    has_more = len(rows) > page['limit']
+    rows = rows[:page['limit']]
+    return rows, (encode_cursor(rows[-1].date, rows[-1].id) if has_more else None)
+
+
+def serialize_rows(connection, rows):
+    """
+    Turn listing rows into the same objects Transaction.to_dict returns
+
+    Args:
+        connection: Session or Connection used to load the page's tags
+        rows (list): Column tuples selected with LISTING_COLUMNS
+
+    Returns:
+        list: JSON-ready transaction objects, in row order
+    """
+    tags = TransactionTag.by_transaction(connection, [row[0] for row in rows])
+    return [
+        {
+            "id": tx_id,
+            "amount": amount_minor / MINOR_UNITS,
+            "category": category,
+            "description": description,
+            "transaction_type": transaction_type,
+            "date": date,
+            "created_at": created_at,
+            "tags": tags.get(tx_id, ()),
+        }
+        for tx_id, amount_minor, category, description, transaction_type, date, created_at in rows
+    ]
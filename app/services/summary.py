@@ -0,0 +1,120 @@
+"""
+Transaction Summary Service
+
+This module computes the financial summary with a single GROUP BY query.
+The database returns one row per (category, transaction_type) pair, which
+is then folded into the overall totals and the per-category and per-type
+breakdowns. The query reads the daily rollup table when the filters allow
+it and falls back to the transactions table otherwise. Amounts are summed
+as integer minor units and converted to rupees once, at the end.
+"""
+
+from flask import current_app
+from sqlalchemy import func, select
+from app.extensions import db
+from app.models.transaction import Transaction
+from app.services import rollups
+from app.utils.money import from_minor
+
+EMPTY_SUMMARY = {
+    'total_transactions': 0,
+    'total_income': 0,
+    'total_expenses': 0,
+    'net_balance': 0,
+    'categories': {},
+    'transaction_types': {},
+}
+
+
+def summary_statement(filters):
+    """Build the grouped aggregate SELECT with the listing filters applied"""
+    return (
+        select(
+            Transaction.category,
+            Transaction.transaction_type,
+            func.sum(Transaction.amount_minor),
+            func.sum(func.abs(Transaction.amount_minor)),
+            func.count(),
+            func.min(Transaction.date),
+            func.max(Transaction.date),
+        )
+        .where(*Transaction.filter_conditions(**filters))
+        .group_by(Transaction.category, Transaction.transaction_type)
+    )
+
+
+def fold_summary(rows):
+    """
+    Fold grouped aggregate rows into the summary payload
+
+    Args:
+        rows (iterable): (category, transaction_type, sum, abs_sum, count, min_date, max_date)
+            with sums in minor units
+
+    Returns:
+        dict: Summary in the /transactions/summary response format
+    """
+    total_transactions = 0
+    total_income = 0
+    total_expenses = 0
+    categories = {}
+    transaction_types = {}
+    earliest = latest = None
+
+    for category, transaction_type, amount, abs_amount, count, min_date, max_date in rows:
+        total_transactions += count
+        if transaction_type == 'income':
+            total_income += amount
+        elif transaction_type == 'expense':
+            total_expenses += abs_amount
+
+        # Category summary
+        entry = categories.setdefault(category, {'total_amount': 0, 'transaction_count': 0})
+        entry['total_amount'] += amount
+        entry['transaction_count'] += count
+
+        # Transaction type summary
+        entry = transaction_types.setdefault(transaction_type, {'total_amount': 0, 'transaction_count': 0})
+        entry['total_amount'] += abs_amount
+        entry['transaction_count'] += count
+
+        if earliest is None or min_date < earliest:
+            earliest = min_date
+        if latest is None or max_date > latest:
+            latest = max_date
+
+    if not total_transactions:
+        return dict(EMPTY_SUMMARY)
+
+    for entry in (*categories.values(), *transaction_types.values()):
+        entry['total_amount'] = from_minor(entry['total_amount'])
+
+    return {
+        'total_transactions': total_transactions,
+        'total_income': from_minor(total_income),
+        'total_expenses': from_minor(total_expenses),
+        'net_balance': from_minor(total_income - total_expenses),
+        'categories': categories,
+        'transaction_types': transaction_types,
+        'latest_transaction_date': latest.isoformat(),
+        'earliest_transaction_date': earliest.isoformat(),
+    }
+
+
+def compute_summary(filters, connection=None, use_rollups=None):
+    """
+    Run the aggregate query and return the summary payload
+
+    Args:
+        filters (dict): Keyword arguments for Transaction.filter_conditions
+        connection (optional): Connection to read from (defaults to the app session)
+        use_rollups (bool, optional): Read daily rollups when possible
+            (defaults to the app's SUMMARY_USE_ROLLUPS)
+    """
+    if use_rollups is None:
+        use_rollups = current_app.config.get('SUMMARY_USE_ROLLUPS', True)
+    if use_rollups and rollups.can_serve(filters):
+        stmt = rollups.summary_statement(filters)
+    else:
+        stmt = summary_statement(filters)
+    return fold_summary((connection or db.session).execute(stmt))
@@ -0,0 +1,122 @@
+"""
+Transaction Time Series Service
+
+This module buckets transaction amounts by day, ISO week (starting Monday)
+or calendar month and sums them per transaction type or category in one
+GROUP BY query. Like the summary, it reads the daily rollup table when the
+filters line up with whole days and the transactions table otherwise, and
+sums integer minor units, converting to rupees once at the end.
+
+The result is columnar: one list of period start dates and, per group,
+lists of amounts and counts aligned with it (0 where a group has no
+transactions in a period):
+
+    {"bucket": "month", "group_by": "transaction_type",
+     "periods": ["2024-01-01", "2024-02-01"],
+     "series": {"expense": {"amount": [-120.5, 0], "count": [3, 0]},
+                "income": {"amount": [5000.0, 5000.0], "count": [1, 1]}}}
+"""
+
+from flask import current_app
+from sqlalchemy import Date, cast, func, select
+from app.extensions import db
+from app.models.rollup import TransactionRollup
+from app.models.transaction import Transaction
+from app.services import rollups
+from app.utils.exceptions import ValidationError
+from app.utils.money import from_minor
+
+BUCKETS = ('day', 'week', 'month')
+GROUP_BY = ('transaction_type', 'category')
+
+
+def parse_timeseries_params(params):
+    """
+    Parse the `bucket` (default month) and `group_by` (default transaction_type) parameters
+
+    Raises:
+        ValidationError: If either value is not supported
+    """
+    bucket = (params.get('bucket') or 'month').lower()
+    group_by = (params.get('group_by') or 'transaction_type').lower()
+    errors = []
+    if bucket not in BUCKETS:
+        errors.append(f"bucket must be one of: {', '.join(BUCKETS)}")
+    if group_by not in GROUP_BY:
+        errors.append(f"group_by must be one of: {', '.join(GROUP_BY)}")
+    if errors:
+        raise ValidationError("Invalid query parameters", errors)
+    return bucket, group_by
+
+
+def bucket_start(expression, bucket, dialect):
+    """Return a SQL expression for the first day of the bucket containing a date or datetime"""
+    if dialect == 'postgresql':
+        return cast(func.date_trunc(bucket, expression), Date)
+    if bucket == 'week':
+        # Forward to Sunday (unless already one), then back to its Monday
+        return func.date(expression, 'weekday 0', '-6 days')
+    if bucket == 'month':
+        return func.date(expression, 'start of month')
+    return func.date(expression)
+
+
+def timeseries_statement(filters, bucket, group_by, dialect, use_rollups):
+    """Build the (period, group, amount_minor, count) aggregate, from rollups when possible"""
+    if use_rollups and rollups.can_serve(filters):
+        r = TransactionRollup
+        period = bucket_start(r.day, bucket, dialect)
+        group = getattr(r, group_by)
+        return (
+            select(period, group, func.sum(r.total_amount_minor), func.sum(r.transaction_count))
+            .where(*rollups.filter_conditions(filters))
+            .group_by(period, group)
+        )
+    period = bucket_start(Transaction.date, bucket, dialect)
+    group = getattr(Transaction, group_by)
+    return (
+        select(period, group, func.sum(Transaction.amount_minor), func.count())
+        .where(*Transaction.filter_conditions(**filters))
+        .group_by(period, group)
+    )
+
+
+def fold_timeseries(rows, bucket, group_by):
+    """Turn (period, group, amount_minor, count) rows into the columnar payload"""
+    rows = [(period if isinstance(period, str) else period.isoformat(), group, amount, count)
+            for period, group, amount, count in rows]
+    periods = sorted({row[0] for row in rows})
+    position = {period: i for i, period in enumerate(periods)}
+    series = {}
+    for period, group, amount, count in rows:
+        entry = series.get(group)
+        if entry is None:
+            entry = series[group] = {'amount': [0] * len(periods), 'count': [0] * len(periods)}
+        entry['amount'][position[period]] += amount
+        entry['count'][position[period]] += count
+    for entry in series.values():
+        entry['amount'] = [from_minor(amount) for amount in entry['amount']]
+    return {
+        'bucket': bucket,
+        'group_by': group_by,
+        'periods': periods,
+        'series': dict(sorted(series.items())),
+    }
+
+
+def compute_timeseries(filters, bucket='month', group_by='transaction_type', connection=None, use_rollups=None):
+    """
+    Run the bucketed aggregate and return the columnar payload
+
+    Args:
+        filters (dict): Keyword arguments for Transaction.filter_conditions
+        bucket (str): 'day', 'week' or 'month'
+        group_by (str): 'transaction_type' or 'category'
+        connection (optional): Connection to read from (defaults to the app session)
+        use_rollups (bool, optional): Read daily rollups when possible
+            (defaults to the app's SUMMARY_USE_ROLLUPS)
+    """
+    if use_rollups is None:
+        use_rollups = current_app.config.get('SUMMARY_USE_ROLLUPS', True)
+    stmt = timeseries_statement(filters, bucket, group_by, db.engine.dialect.name, use_rollups)
+    return fold_timeseries((connection or db.session).execute(stmt), bucket, group_by)
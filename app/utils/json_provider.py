@@ -0,0 +1,56 @@
+"""
+JSON Provider
+
+A Flask JSON provider backed by orjson when it is installed, falling back
+to the standard library otherwise. Both paths produce the same documents:
+compact separators, sorted keys (per the provider's sort_keys), datetimes
+and dates as ISO 8601 strings, and anything else handled by Flask's default
+hook (Decimal, UUID, dataclasses). The orjson path writes non-ASCII text as
+UTF-8 rather than \\u escapes.
+"""
+
+import json
+from datetime import date
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Serialize responses with orjson when available"""
+
+    #: Set to False (e.g. in tests) to force the standard library encoder
+    use_orjson = orjson is not None
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, date):
+            return o.isoformat()
+        return DefaultJSONProvider.default(o)
+
+    def dumps(self, obj, **kwargs):
+        if self.use_orjson and not kwargs.get('indent'):
+            option = orjson.OPT_NON_STR_KEYS
+            if kwargs.get('sort_keys', self.sort_keys):
+                option |= orjson.OPT_SORT_KEYS
+            return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+        kwargs.setdefault('default', self.default)
+        kwargs.setdefault('ensure_ascii', self.ensure_ascii)
+        kwargs.setdefault('sort_keys', self.sort_keys)
+        return json.dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if self.use_orjson and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            body = self.dumps(obj, indent=2)
+        else:
+            body = self.dumps(obj, separators=(',', ':'))
+        return self._app.response_class(f"{body}\n", mimetype=self.mimetype)
@@ -1,14 +1,142 @@
+"""
+Logging Configuration
+
+Log records are put on an in-process queue by a QueueHandler and written by
+a background QueueListener thread, so request threads never wait on the
+output stream or its lock. Message %-arguments are merged by the listener,
+not the caller, so pass them lazily:
+
+    logger.info("Imported %s rows", count)
+
+Records are written as one JSON object per line (LOG_FORMAT=json, the
+default) or as plain text (LOG_FORMAT=text). Fields passed with
+extra={...} (request_id, route, status, duration_ms, ...) become keys of
+the JSON object.
+
+Configuration (environment):
+    LOG_LEVEL (str): Minimum level, default INFO
+    LOG_FORMAT (str): 'json' (default) or 'text'
+
+Per-request records are written by log_request, which can sample
+successful requests (see LOG_SAMPLE_RATE and LOG_SLOW_MS in create_app).
+"""
+
+import atexit
+import json
 import logging
+import os
+import queue
+import random
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# LogRecord attributes that are not user-supplied `extra` fields
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {'message', 'asctime', 'taskName'}
+
+
+class JSONFormatter(logging.Formatter):
+    """Format records as single-line JSON objects"""
+
+    def format(self, record):
+        entry = {
+            'ts': time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(record.created)) + f'.{int(record.msecs):03d}Z',
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exc_info'] = record.exc_text
+        if orjson is not None:
+            return orjson.dumps(entry, default=str).decode('utf-8')
+        return json.dumps(entry, default=str)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves message formatting to the listener thread
+
+    The stock handler merges msg % args in the calling thread; here only the
+    traceback (which references live frames) is rendered before enqueueing.
+    """
+
+    def prepare(self, record):
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,  # Set to DEBUG for more verbose output
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.StreamHandler(),
-        # logging.FileHandler('financeai.log', mode='a') 
-    ]
-)
+
+_listener = None
+
+
+def _output_handler(stream=None):
+    handler = logging.StreamHandler(stream or sys.stderr)
+    if os.getenv('LOG_FORMAT', 'json').lower() == 'text':
+        handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+    else:
+        handler.setFormatter(JSONFormatter())
+    return handler
+
+
+def start_listener(stream=None):
+    """(Re)start the background writer, e.g. to send output to another stream"""
+    global _listener
+    stop_listener()
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, DeferredQueueHandler):
+            root.removeHandler(handler)
+    root.addHandler(DeferredQueueHandler(log_queue))
+    root.setLevel(os.getenv('LOG_LEVEL', 'INFO').upper())
+    _listener = QueueListener(log_queue, _output_handler(stream), respect_handler_level=True)
+    _listener.start()
+
+
+def stop_listener():
+    """Flush queued records and stop the background writer"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def _restart_after_fork():
+    # The parent's listener thread does not exist in the child (e.g. gunicorn --preload)
+    global _listener
+    _listener = None
+    start_listener()
+
+
+start_listener()
+atexit.register(stop_listener)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_after_fork)
 
 # Create a logger for this module
 logger = logging.getLogger(__name__)
+
+
+def log_request(method, path, route, status, duration_ms, request_id, sample_rate=1.0, slow_ms=float('inf')):
+    """
+    Log one structured record for a finished request
+
+    Successful responses faster than slow_ms are kept with probability
+    sample_rate; errors and slow responses are always logged.
+    """
+    if status < 400 and duration_ms < slow_ms and sample_rate < 1 and random.random() >= sample_rate:
+        return
+    logger.info("%s %s %s %.1fms", method, path, status, duration_ms,
+                extra={'request_id': request_id, 'method': method, 'route': route, 'path': path,
+                       'status': status, 'duration_ms': round(duration_ms, 3)})
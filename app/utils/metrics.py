@@ -0,0 +1,254 @@
+"""
+Request and Export Metrics
+
+A small in-process metrics registry rendered in the Prometheus text format
+at GET /metrics. Recording a sample is a dict lookup and a few integer
+updates under an uncontended lock, so the per-request hooks add a few
+microseconds:
+
+    http_request_duration_seconds{method,route,status}   histogram
+    http_requests_in_flight{route}                        gauge
+    db_queries_per_request{route}                         histogram
+    db_query_seconds_per_request{route}                   histogram
+    db_query_duration_seconds                             histogram
+    export_size_bytes{format,mode}                        histogram
+    export_duration_seconds{format,mode}                  histogram
+
+Routes are labelled with their URL rule (/api/v1/transactions/<transaction_id>),
+never the raw path, so label cardinality stays bounded. For streamed
+responses the request duration is the time to the response headers (as in
+the request log); the export histograms cover the whole body.
+
+Database queries are timed by SQLAlchemy cursor-execute events on every
+engine and attributed to the current request through a context variable,
+which follows both Flask's request thread and the async views' task.
+
+Values are kept per process: with several gunicorn/uvicorn workers each
+scrape is answered by one worker, so scrape workers individually (or run
+one per container) when exact totals matter.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (1e3, 1e4, 1e5, 1e6, 1e7, 1e8, 1e9)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels(names, values, extra=''):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _number(value):
+    if isinstance(value, float):
+        return '+Inf' if value == float('inf') else repr(value)
+    return str(value)
+
+
+class _Metric:
+    type = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.type}']
+        with self._lock:
+            series = [(labels, list(value) if isinstance(value, list) else value)
+                      for labels, value in sorted(self._series.items())]
+        for labels, value in series:
+            lines.extend(self._samples(labels, value))
+        return lines
+
+    def _samples(self, labels, value):
+        return [f'{self.name}{_labels(self.labelnames, labels)} {_number(value)}']
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+
+    type = 'counter'
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._series[labels] = self._series.get(labels, 0) + amount
+
+
+class Gauge(_Metric):
+    """Value that goes up and down"""
+
+    type = 'gauge'
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._series[labels] = self._series.get(labels, 0) + amount
+
+    def dec(self, *labels, amount=1):
+        with self._lock:
+            self._series[labels] = self._series.get(labels, 0) - amount
+
+    def set(self, value, *labels):
+        with self._lock:
+            self._series[labels] = value
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in fixed cumulative buckets"""
+
+    type = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, *labels):
+        # One slot per bucket, one for +Inf, then the running sum
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def _samples(self, labels, series):
+        lines, cumulative = [], 0
+        for bound, count in zip(self.buckets + (float('inf'),), series):
+            cumulative += count
+            le = 'le="%s"' % _number(float(bound))
+            lines.append(f'{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}')
+        label_text = _labels(self.labelnames, labels)
+        lines.append(f'{self.name}_sum{label_text} {_number(series[-1])}')
+        lines.append(f'{self.name}_count{label_text} {cumulative}')
+        return lines
+
+
+class Registry:
+    """Ordered collection of metrics rendered together"""
+
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def clear(self):
+        """Drop every recorded series (for tests and benchmarks)"""
+        for metric in self._metrics:
+            metric.clear()
+
+    def render(self):
+        """Return all metrics in the Prometheus text exposition format"""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+registry = Registry()
+
+REQUEST_LATENCY = registry.register(Histogram(
+    'http_request_duration_seconds', 'Time to handle a request, by route', ('method', 'route', 'status')))
+REQUESTS_IN_FLIGHT = registry.register(Gauge(
+    'http_requests_in_flight', 'Requests currently being handled, by route', ('route',)))
+REQUEST_QUERIES = registry.register(Histogram(
+    'db_queries_per_request', 'Database queries issued per request', ('route',), QUERY_COUNT_BUCKETS))
+REQUEST_QUERY_SECONDS = registry.register(Histogram(
+    'db_query_seconds_per_request', 'Time spent in database queries per request', ('route',)))
+QUERY_LATENCY = registry.register(Histogram(
+    'db_query_duration_seconds', 'Duration of individual database queries'))
+EXPORT_SIZE = registry.register(Histogram(
+    'export_size_bytes', 'Size of completed exports', ('format', 'mode'), SIZE_BUCKETS))
+EXPORT_DURATION = registry.register(Histogram(
+    'export_duration_seconds', 'Time to produce completed exports', ('format', 'mode')))
+
+# [query count, query seconds] for the request being handled, or None outside requests
+_request_queries = ContextVar('request_queries', default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._metrics_started
+    QUERY_LATENCY.observe(elapsed)
+    stats = _request_queries.get()
+    if stats is not None:
+        stats[0] += 1
+        stats[1] += elapsed
+
+
+def install_query_hooks():
+    """Time every query on every engine (idempotent)"""
+    if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+
+
+def start_request(route):
+    """Mark a request as in flight and start counting its queries"""
+    REQUESTS_IN_FLIGHT.inc(route)
+    _request_queries.set([0, 0.0])
+
+
+def finish_request(method, route, status, seconds):
+    """Record a finished request started with start_request"""
+    REQUESTS_IN_FLIGHT.dec(route)
+    REQUEST_LATENCY.observe(seconds, method, route, str(status))
+    stats = _request_queries.get()
+    if stats is not None:
+        REQUEST_QUERIES.observe(stats[0], route)
+        REQUEST_QUERY_SECONDS.observe(stats[1], route)
+        _request_queries.set(None)
+
+
+def observe_export(export_format, size, seconds, mode='request'):
+    """Record a completed export of `size` bytes"""
+    EXPORT_SIZE.observe(size, export_format, mode)
+    EXPORT_DURATION.observe(seconds, export_format, mode)
+
+
+def _chunk_size(chunk):
+    return len(chunk.encode('utf-8')) if isinstance(chunk, str) else len(chunk)
+
+
+def measure_export(chunks, export_format):
+    """Pass a streamed export body through, recording its size and duration once fully sent"""
+    started, size = time.perf_counter(), 0
+    for chunk in chunks:
+        size += _chunk_size(chunk)
+        yield chunk
+    observe_export(export_format, size, time.perf_counter() - started)
+
+
+async def ameasure_export(chunks, export_format):
+    """Async counterpart of measure_export"""
+    started, size = time.perf_counter(), 0
+    async for chunk in chunks:
+        size += _chunk_size(chunk)
+        yield chunk
+    observe_export(export_format, size, time.perf_counter() - started)
@@ -0,0 +1,38 @@
+"""
+Money Utilities
+
+Amounts are stored as integers in minor units (paise) so that sums and
+rollups are exact. The API keeps exchanging amounts in rupees as JSON
+numbers; these helpers convert at the boundary.
+"""
+
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from typing import Any, Optional
+
+MINOR_UNITS = 100
+
+_MINOR = Decimal(MINOR_UNITS)
+_WHOLE = Decimal(1)
+
+
+def to_minor(amount: Any) -> int:
+    """
+    Convert a rupee amount to integer minor units
+
+    Floats are converted through their shortest repr, so 0.1 becomes
+    10 paise rather than 10.000000000000000555 rounded. Half-paise values
+    round away from zero.
+
+    Raises:
+        ValueError: If the amount is not a finite number
+    """
+    try:
+        value = Decimal(str(amount)) * _MINOR
+        return int(value.quantize(_WHOLE, rounding=ROUND_HALF_UP))
+    except (InvalidOperation, OverflowError):
+        raise ValueError(f"Invalid amount: {amount!r}")
+
+
+def from_minor(minor: Optional[int]) -> Optional[float]:
+    """Convert integer minor units (e.g. a SUM, which some drivers return as Decimal) to rupees"""
+    return int(minor) / MINOR_UNITS if minor is not None else None
@@ -0,0 +1,150 @@
+"""
+Keyset Pagination Utilities
+
+This module encodes and decodes the opaque cursors used by the paginated
+transaction listing. A cursor captures the (date, id) of the last row on a
+page so the next page can continue with an indexed range scan instead of
+an OFFSET. The change feed (app.services.changes) uses the same scheme
+over (change_version, id).
+"""
+
+import base64
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+from app.utils.exceptions import ValidationError
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+DEFAULT_CHANGES_PAGE_SIZE = 1000
+MAX_CHANGES_PAGE_SIZE = 5000
+
+
+def encode_cursor(date: datetime, row_id: int) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor"""
+    raw = f"{date.isoformat()}|{row_id}".encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        date_part, id_part = base64.urlsafe_b64decode(padded).decode('utf-8').split('|')
+        return datetime.fromisoformat(date_part), int(id_part)
+    except (ValueError, UnicodeDecodeError):
+        raise ValidationError("Invalid cursor", ["cursor is not a value returned by this API"])
+
+
+def encode_change_cursor(version: int, row_id: int) -> str:
+    """Encode the (change_version, id) of the last row on a change feed page"""
+    raw = f"{version}|{row_id}".encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_change_cursor(cursor: str) -> Tuple[int, int]:
+    """
+    Decode a cursor produced by encode_change_cursor
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        version_part, id_part = base64.urlsafe_b64decode(padded).decode('utf-8').split('|')
+        return int(version_part), int(id_part)
+    except (ValueError, UnicodeDecodeError):
+        raise ValidationError("Invalid cursor", ["cursor is not a value returned by this API"])
+
+
+def parse_limit(params: Dict[str, str], default: int, maximum: int) -> int:
+    """
+    Parse a `limit` query parameter between 1 and maximum
+
+    Raises:
+        ValidationError: If limit is not an integer in range
+    """
+    limit = params.get('limit') or default
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        raise ValidationError("Invalid limit", ["limit must be an integer"])
+    if not 1 <= limit <= maximum:
+        raise ValidationError("Invalid limit", [f"limit must be between 1 and {maximum}"])
+    return limit
+
+
+def parse_offset(params: Dict[str, str]) -> int:
+    """
+    Parse an `offset` query parameter (default 0)
+
+    Raises:
+        ValidationError: If offset is not a non-negative integer
+    """
+    try:
+        offset = int(params.get('offset') or 0)
+    except ValueError:
+        raise ValidationError("Invalid offset", ["offset must be an integer"])
+    if offset < 0:
+        raise ValidationError("Invalid offset", ["offset must not be negative"])
+    return offset
+
+
+def parse_page_params(params: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """
+    Parse `limit` and `cursor` query parameters
+
+    Args:
+        params: Mapping of query parameters (e.g. request.args)
+
+    Returns:
+        Dict with 'limit' and 'after' (decoded cursor or None), or None when
+        the request did not ask for pagination
+
+    Raises:
+        ValidationError: If limit or cursor is invalid
+    """
+    if 'limit' not in params and 'cursor' not in params:
+        return None
+
+    limit = parse_limit(params, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+    cursor = params.get('cursor')
+    return {
+        'limit': limit,
+        'after': decode_cursor(cursor) if cursor else None,
+    }
+
+
+def parse_change_params(params: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Parse the change feed's `since`, `epoch`, `limit` and `cursor` parameters
+
+    Args:
+        params: Mapping of query parameters (e.g. request.args)
+
+    Returns:
+        Dict with 'since' (int, or None for a full sync), 'epoch' (str or
+        None), 'limit' and 'after' (decoded cursor or None)
+
+    Raises:
+        ValidationError: If a parameter is invalid
+    """
+    since = params.get('since') or None
+    if since is not None:
+        try:
+            since = int(since)
+        except ValueError:
+            raise ValidationError("Invalid since", ["since must be an integer ledger version"])
+        if since < 0:
+            raise ValidationError("Invalid since", ["since must not be negative"])
+    cursor = params.get('cursor')
+    return {
+        'since': since,
+        'epoch': params.get('epoch') or None,
+        'limit': parse_limit(params, DEFAULT_CHANGES_PAGE_SIZE, MAX_CHANGES_PAGE_SIZE),
+        'after': decode_change_cursor(cursor) if cursor else None,
+    }
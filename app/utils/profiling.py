@@ -0,0 +1,219 @@
+"""
+Request Profiling and Slow Query Logging
+
+Opt-in profiling for individual requests. A request is profiled when its
+URL rule is listed in PROFILE_ROUTES, or when it carries an
+`X-Profile: <PROFILE_TOKEN>` header (ignored unless a token is
+configured):
+
+    curl -H "X-Profile: $PROFILE_TOKEN" "http://127.0.0.1:5000/api/v1/transactions/summary"
+
+Profiles are written to PROFILE_DIR, named after the time, route and
+request id; the name is returned in the X-Profile-Id response header.
+Two profilers are available (PROFILE_MODE, or X-Profile-Mode per request):
+
+    sample    samples the request thread's stack every PROFILE_INTERVAL_MS
+              and writes <id>.collapsed, one "frame;frame;... count" line
+              per stack (flamegraph.pl, speedscope, inferno)
+    cprofile  deterministic cProfile trace written as <id>.pstats
+              (pstats, snakeviz, gprof2dot)
+
+Streamed responses (CSV/Arrow/Parquet exports) are profiled until the body
+has been sent.
+
+SQL statements slower than SLOW_QUERY_MS are logged with their bound
+parameters, whether or not the request is profiled.
+
+Configuration (environment):
+    PROFILE_TOKEN (str): Token accepted in the X-Profile header
+    PROFILE_ROUTES (str): Comma-separated URL rules profiled on every request
+    PROFILE_MODE (str): 'sample' (default) or 'cprofile'
+    PROFILE_INTERVAL_MS (float): Sampling interval, default 1
+    PROFILE_DIR (str): Output directory, default <instance>/profiles
+    SLOW_QUERY_MS (float): Slow query threshold; 0 (default) disables
+"""
+
+import cProfile
+import hmac
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.utils.logger import logger
+
+PROFILE_MODES = ('sample', 'cprofile')
+
+# Longest rendering of a statement's parameters in the slow query log
+MAX_PARAMETERS_LENGTH = 1000
+
+
+class SamplingProfiler:
+    """Periodically record one thread's Python stack from a background thread"""
+
+    extension = 'collapsed'
+
+    def __init__(self, interval=0.001):
+        self.interval = interval
+        self.stacks = Counter()
+        self._stopped = threading.Event()
+        self._sampler = None
+
+    def start(self):
+        self._thread_id = threading.get_ident()
+        self._sampler = threading.Thread(target=self._run, name='profile-sampler', daemon=True)
+        self._sampler.start()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def stop(self):
+        self._stopped.set()
+        self._sampler.join()
+
+    def save(self, path):
+        with open(path, 'w') as fh:
+            for stack, count in self.stacks.most_common():
+                fh.write(f"{stack} {count}\n")
+
+
+class DeterministicProfiler:
+    """cProfile trace of the calling thread"""
+
+    extension = 'pstats'
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+
+    def start(self):
+        self.profile.enable()
+
+    def stop(self):
+        self.profile.disable()
+
+    def save(self, path):
+        self.profile.dump_stats(path)
+
+
+def wants_profile(config, route, headers):
+    """Return True if a request to `route` with these headers should be profiled"""
+    if route in config['PROFILE_ROUTES']:
+        return True
+    token, supplied = config['PROFILE_TOKEN'], headers.get('X-Profile')
+    return bool(token and supplied) and hmac.compare_digest(supplied.encode(), token.encode())
+
+
+def _format_parameters(parameters, executemany):
+    text = f"{len(parameters)} sets, first {parameters[0]!r}" if executemany and parameters else repr(parameters)
+    if len(text) > MAX_PARAMETERS_LENGTH:
+        text = text[:MAX_PARAMETERS_LENGTH] + '...'
+    return text
+
+
+class RequestProfiler:
+    """
+    Flask extension that profiles selected requests and logs slow queries
+
+    Register it with create_app:
+
+        request_profiler.init_app(app)
+    """
+
+    def __init__(self, app=None):
+        self.slow_query_seconds = float('inf')
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('PROFILE_TOKEN', os.getenv('PROFILE_TOKEN') or None)
+        app.config.setdefault('PROFILE_ROUTES', [rule.strip() for rule in os.getenv('PROFILE_ROUTES', '').split(',')
+                                                 if rule.strip()])
+        app.config.setdefault('PROFILE_MODE', os.getenv('PROFILE_MODE', 'sample'))
+        app.config.setdefault('PROFILE_INTERVAL_MS', float(os.getenv('PROFILE_INTERVAL_MS', 1)))
+        app.config.setdefault('PROFILE_DIR', os.getenv('PROFILE_DIR', os.path.join(app.instance_path, 'profiles')))
+        app.config.setdefault('SLOW_QUERY_MS', float(os.getenv('SLOW_QUERY_MS', 0)))
+        app.extensions['request_profiler'] = self
+
+        app.before_request(self._start)
+        app.after_request(self._finish)
+        # Query events are engine-wide; the threshold follows the latest app
+        self.slow_query_seconds = app.config['SLOW_QUERY_MS'] / 1000 or float('inf')
+        if app.config['SLOW_QUERY_MS'] > 0:
+            if not event.contains(Engine, 'before_cursor_execute', self._before_cursor_execute):
+                event.listen(Engine, 'before_cursor_execute', self._before_cursor_execute)
+                event.listen(Engine, 'after_cursor_execute', self._after_cursor_execute)
+
+    def _start(self):
+        config = current_app.config
+        route = request.url_rule.rule if request.url_rule else None
+        if route is None or not wants_profile(config, route, request.headers):
+            return
+        mode = request.headers.get('X-Profile-Mode', config['PROFILE_MODE'])
+        if mode not in PROFILE_MODES:
+            mode = config['PROFILE_MODE']
+        if mode == 'cprofile':
+            profiler = DeterministicProfiler()
+        else:
+            profiler = SamplingProfiler(config['PROFILE_INTERVAL_MS'] / 1000)
+        try:
+            profiler.start()
+        except ValueError:
+            # Another profiler (e.g. a debugger or coverage) already owns this thread
+            logger.warning("Could not start %s profiler for %s", mode, route)
+            return
+        g.profiler = profiler
+        g.profile_id = "%s-%s-%s" % (time.strftime('%Y%m%dT%H%M%S'),
+                                     re.sub(r'[^A-Za-z0-9]+', '_', route).strip('_') or 'root',
+                                     g.get('request_id', 'request')[:12])
+
+    def _finish(self, response):
+        profiler = g.pop('profiler', None)
+        if profiler is None:
+            return response
+        profile_id = g.profile_id
+        directory = current_app.config['PROFILE_DIR']
+        response.headers['X-Profile-Id'] = profile_id
+
+        def save():
+            profiler.stop()
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"{profile_id}.{profiler.extension}")
+            profiler.save(path)
+            logger.info("Saved request profile %s", path, extra={'profile': path})
+
+        if response.is_streamed:
+            # Keep profiling while the body is generated; the server closes
+            # the response once it has been sent
+            response.call_on_close(save)
+        else:
+            save()
+        return response
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        context._profiling_started = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._profiling_started
+        if elapsed < self.slow_query_seconds:
+            return
+        logger.warning("Slow query (%.1fms): %s", elapsed * 1000, statement, extra={
+            'duration_ms': round(elapsed * 1000, 3),
+            'statement': statement,
+            'parameters': _format_parameters(parameters, executemany),
+            'request_id': g.get('request_id') if has_request_context() else None,
+        })
+
+
+request_profiler = RequestProfiler()
@@ -0,0 +1,191 @@
+"""
+Rate Limit Configuration and Storage
+
+Per-endpoint limits are read from app.config['RATELIMITS'] at request time,
+so deployments can change them with RATELIMIT_<NAME> environment variables
+instead of editing decorators:
+
+    @limiter.limit(endpoint_limit('listing'))
+
+Counters live wherever RATELIMIT_STORAGE_URI points. Besides the backends
+bundled with the limits library (memory://, redis://, memcached://, ...),
+this module registers a sqlite:// backend so several worker processes on
+one host can share counters without running a server. Put the file on a
+tmpfs such as /dev/shm for a shared-memory store:
+
+    RATELIMIT_STORAGE_URI=sqlite:////dev/shm/financeai-ratelimits.db
+
+The SQLite backend supports the fixed-window and sliding-window-counter
+strategies (not moving-window).
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from math import floor
+from flask import current_app
+from limits.storage import Storage
+from limits.storage.base import SlidingWindowCounterSupport, TimestampedSlidingWindow
+
+# Limits applied when RATELIMIT_<NAME> is not set; values use Flask-Limiter's notation
+DEFAULT_LIMITS = {
+    'listing': '10 per minute',
+    'changes': '60 per minute',
+    'lookup': '120 per minute',
+    'search': '60 per minute',
+    'export': '5 per minute',
+    'export_jobs': '5 per minute',
+    'create': '10 per minute',
+    'bulk': '10 per minute',
+    'imports': '5 per minute',
+    'read': '10 per minute',
+    'update': '10 per minute',
+    'summary': '10 per minute',
+    'analytics': '30 per minute',
+}
+
+
+def load_limits(environ=os.environ):
+    """Return the per-endpoint limits, with RATELIMIT_<NAME> overrides applied"""
+    return {name: environ.get(f'RATELIMIT_{name.upper()}', default) for name, default in DEFAULT_LIMITS.items()}
+
+
+def endpoint_limit(name):
+    """Return a limit provider for @limiter.limit that reads RATELIMITS[name] per request"""
+    return lambda: current_app.config['RATELIMITS'][name]
+
+
+class SQLiteStorage(Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow):
+    """
+    Rate limit counters in a SQLite file shared by every process that opens it
+
+    Each counter is one row; increments are single UPSERT statements in
+    autocommit mode, and sliding-window hits run in one IMMEDIATE
+    transaction so concurrent workers cannot both take the last slot.
+    Durability is traded for speed (WAL, synchronous=OFF): losing the last
+    few increments in a crash is harmless for rate limiting.
+    """
+
+    STORAGE_SCHEME = ['sqlite']
+
+    #: Expired rows are purged after this many increments per process
+    PURGE_EVERY = 1000
+
+    def __init__(self, uri, wrap_exceptions=False, timeout=5.0, **options):
+        path = uri.split('://', 1)[1][1:]
+        if not path:
+            raise ValueError("sqlite:// rate limit storage needs a file path, e.g. sqlite:////dev/shm/ratelimits.db")
+        self.path = path
+        self.timeout = float(timeout)
+        self._local = threading.local()
+        self._increments = 0
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_counters "
+                "(key TEXT PRIMARY KEY, value INTEGER NOT NULL, expiry REAL NOT NULL)"
+            )
+
+    @property
+    def base_exceptions(self):
+        return sqlite3.Error
+
+    def _connection(self):
+        # One connection per thread, reopened after a fork
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def _incr(self, conn, key, expiry, amount, now):
+        # A missing or expired counter restarts at `amount` with a fresh expiry
+        return conn.execute(
+            "INSERT INTO rate_limit_counters (key, value, expiry) VALUES (?1, ?2, ?3 + ?4) "
+            "ON CONFLICT(key) DO UPDATE SET "
+            "value = CASE WHEN expiry <= ?4 THEN excluded.value ELSE value + excluded.value END, "
+            "expiry = CASE WHEN expiry <= ?4 THEN excluded.expiry ELSE expiry END "
+            "RETURNING value",
+            (key, amount, expiry, now),
+        ).fetchone()[0]
+
+    def _get(self, conn, key, now):
+        row = conn.execute(
+            "SELECT value, expiry FROM rate_limit_counters WHERE key = ? AND expiry > ?", (key, now)
+        ).fetchone()
+        return row or (0, None)
+
+    def _purge(self, conn, now):
+        self._increments += 1
+        if self._increments % self.PURGE_EVERY == 0:
+            conn.execute("DELETE FROM rate_limit_counters WHERE expiry <= ?", (now,))
+
+    def incr(self, key, expiry, amount=1):
+        now = time.time()
+        conn = self._connection()
+        self._purge(conn, now)
+        return self._incr(conn, key, expiry, amount, now)
+
+    def decr(self, key, amount=1):
+        row = self._connection().execute(
+            "UPDATE rate_limit_counters SET value = max(value - ?, 0) WHERE key = ? AND expiry > ? RETURNING value",
+            (amount, key, time.time()),
+        ).fetchone()
+        return row[0] if row else 0
+
+    def get(self, key):
+        return self._get(self._connection(), key, time.time())[0]
+
+    def get_expiry(self, key):
+        now = time.time()
+        expiry = self._get(self._connection(), key, now)[1]
+        return now if expiry is None else expiry
+
+    def clear(self, key):
+        self._connection().execute("DELETE FROM rate_limit_counters WHERE key = ?", (key,))
+
+    def check(self):
+        try:
+            self._connection().execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def reset(self):
+        return self._connection().execute("DELETE FROM rate_limit_counters").rowcount
+
+    def _sliding_window(self, conn, key, expiry, now):
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        previous_count = self._get(conn, previous_key, now)[0]
+        current_count = self._get(conn, current_key, now)[0]
+        # Same weighting as the limits library's own backends
+        previous_ttl = (1 - (((now - expiry) / expiry) % 1)) * expiry if previous_count else 0.0
+        current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+        return previous_count, previous_ttl, current_count, current_ttl
+
+    def get_sliding_window(self, key, expiry):
+        return self._sliding_window(self._connection(), key, expiry, time.time())
+
+    def acquire_sliding_window_entry(self, key, limit, expiry, amount=1):
+        if amount > limit:
+            return False
+        now = time.time()
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            previous_count, previous_ttl, current_count, _ = self._sliding_window(conn, key, expiry, now)
+            if floor(previous_count * previous_ttl / expiry + current_count) + amount > limit:
+                return False
+            # Current windows live for two periods so the next window can weight them
+            self._incr(conn, self.sliding_window_keys(key, expiry, now)[1], 2 * expiry, amount, now)
+            return True
+        finally:
+            conn.execute("COMMIT")
+
+    def clear_sliding_window(self, key, expiry):
+        for window_key in self.sliding_window_keys(key, expiry, time.time()):
+            self.clear(window_key)
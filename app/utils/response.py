@@ -1,4 +1,4 @@
-def json_response(success, message="", data=None, error=None, details=None, status_code=200):
+def json_response(success, message="", data=None, error=None, details=None, status_code=200, meta=None):
     """
     Standardized JSON response format for API.
 
@@ -9,6 +9,7 @@ def json_response(success, message="", data=None, error=None, details=None, stat
         error (str, optional): Error message if failure
         details (list, optional): List of detailed error strings
         status_code (int): HTTP status code
+        meta (dict, optional): Extra top-level fields such as counts or pagination cursors
 
     Returns:
         tuple: (response dict, HTTP status code)
@@ -24,4 +25,6 @@ def json_response(success, message="", data=None, error=None, details=None, stat
         response["error"] = error or "An error occurred"
         if details:
             response["details"] = details
+    if meta:
+        response.update(meta)
     return response, status_code
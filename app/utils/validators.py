@@ -5,103 +5,252 @@ This module contains functions for validating input data
 to ensure data integrity and security.
 """
 
-from typing import Dict, Any, List
+from datetime import datetime
+from functools import partial
+from itertools import repeat
+from operator import itemgetter
+from typing import Dict, Any, List, Tuple
 from app.utils.exceptions import ValidationError
 
-def validate_transaction_data(data: Dict[str, Any]) -> Dict[str, Any]:
+VALID_TRANSACTION_TYPES = ('income', 'expense', 'investment', 'transfer')
+REQUIRED_FIELDS = ('amount', 'category', 'description', 'transaction_type')
+
+# Precomputed lookups shared by the single-row and batch validators
+_VALID_TYPE_SET = frozenset(VALID_TRANSACTION_TYPES)
+_parse_iso = datetime.fromisoformat
+
+_TYPE_ERROR = f"Transaction type must be one of: {', '.join(VALID_TRANSACTION_TYPES)}"
+_AMOUNT_ERROR = "Amount must be a valid number"
+_ZERO_ERROR = "Amount cannot be zero"
+_TAGS_LIST_ERROR = "Tags must be a list"
+_TAGS_STR_ERROR = "All tags must be strings"
+_ROW_ERROR = "Row must be a JSON object"
+_DATE_ERROR = "Date must be in ISO format (YYYY-MM-DDTHH:MM:SS)"
+_REQUIRED_ERRORS = {field: f"'{field}' is required" for field in REQUIRED_FIELDS}
+_EMPTY_ERRORS = {field: f"'{field}' cannot be empty" for field in REQUIRED_FIELDS}
+
+# Column checks for the batch validator: (field, value used when the key is
+# missing, or _REQUIRED to flag the row, checks applied in order, whether a
+# falsy result flags the row). Every value transaction_errors() rejects
+# makes a check raise or return a falsy result.
+_REQUIRED = object()
+_COLUMN_CHECKS = (
+    ('amount', _REQUIRED, (float,), True),  # Non-numbers raise, zero is falsy
+    ('category', _REQUIRED, (str.strip,), True),  # Non-strings raise, blank is falsy
+    ('description', _REQUIRED, (str.strip,), True),
+    ('transaction_type', _REQUIRED, (_VALID_TYPE_SET.__contains__,), True),
+    ('date', datetime.min.isoformat(), (_parse_iso,), True),
+    # Non-lists and non-string tags raise; no tags joins to a falsy '', which is valid
+    ('tags', [], (list.copy, partial(str.join, '')), False),
+)
+
+
+def _amount_errors(value) -> List[str]:
+    try:
+        if float(value) == 0:
+            return [_ZERO_ERROR]
+    except (ValueError, TypeError, OverflowError):
+        return [_AMOUNT_ERROR]
+    return []
+
+
+def _type_is_valid(value) -> bool:
+    return isinstance(value, str) and (value in _VALID_TYPE_SET or value.lower() in _VALID_TYPE_SET)
+
+
+def _date_is_valid(value) -> bool:
+    try:
+        _parse_iso(value)
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+def transaction_errors(data: Dict[str, Any]) -> List[str]:
     """
-    Validate transaction data for creation/update
-    
+    Collect validation errors for one transaction payload without raising
+
     Args:
         data: Dictionary containing transaction data
-    
+
     Returns:
-        Dict: Validation result with 'valid' boolean, 'message', and 'errors'
+        List[str]: Error messages (empty if the payload is valid)
     """
     errors = []
-    
+
     # Validate required fields
-    required_fields = ['amount', 'category', 'description', 'transaction_type']
-    
-    for field in required_fields:
-        if field not in data or data[field] is None:
-            errors.append(f"'{field}' is required")
-        elif isinstance(data[field], str) and not data[field].strip():
-            errors.append(f"'{field}' cannot be empty")
-    
+    for field in REQUIRED_FIELDS:
+        value = data.get(field)
+        if value is None:
+            errors.append(_REQUIRED_ERRORS[field])
+        elif isinstance(value, str) and not value.strip():
+            errors.append(_EMPTY_ERRORS[field])
+
     # Validate amount
     if 'amount' in data:
-        try:
-            amount = float(data['amount'])
-            if amount == 0:
-                errors.append("Amount cannot be zero")
-        except (ValueError, TypeError):
-            errors.append("Amount must be a valid number")
-    
+        errors.extend(_amount_errors(data['amount']))
+
     # Validate transaction_type
-    valid_types = ['income', 'expense', 'investment', 'transfer']
-    if 'transaction_type' in data:
-        if data['transaction_type'].lower() not in valid_types:
-            errors.append(f"Transaction type must be one of: {', '.join(valid_types)}")
-    
+    if 'transaction_type' in data and not _type_is_valid(data['transaction_type']):
+        errors.append(_TYPE_ERROR)
+
     # Validate tags if provided
-    if 'tags' in data and data['tags'] is not None:
-        if not isinstance(data['tags'], list):
-            errors.append("Tags must be a list")
-        elif not all(isinstance(tag, str) for tag in data['tags']):
-            errors.append("All tags must be strings")
-    
+    tags = data.get('tags')
+    if tags is not None:
+        if not isinstance(tags, list):
+            errors.append(_TAGS_LIST_ERROR)
+        elif not all(isinstance(tag, str) for tag in tags):
+            errors.append(_TAGS_STR_ERROR)
+
     # Validate date if provided
-    if 'date' in data and data['date'] is not None:
-        try:
-            from datetime import datetime
-            datetime.fromisoformat(data['date'])
-        except ValueError:
-            errors.append("Date must be in ISO format (YYYY-MM-DDTHH:MM:SS)")
-    
+    date = data.get('date')
+    if date is not None and not _date_is_valid(date):
+        errors.append(_DATE_ERROR)
+
+    return errors
+
+
+def validate_transaction_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate transaction data for creation/update
+
+    Args:
+        data: Dictionary containing transaction data
+
+    Returns:
+        Dict: Validation result with 'valid' boolean, 'message', and 'errors'
+
+    Raises:
+        ValidationError: If the payload is invalid
+    """
+    errors = transaction_errors(data)
     if errors:
         raise ValidationError("Invalid transaction data", errors)
-    else:
-        is_valid = True
-        message = "Validation successful"
-    
+
     return {
-        'valid': is_valid,
-        'message': message,
+        'valid': True,
+        'message': "Validation successful",
         'errors': errors
     }
 
 
+def _flagged_rows(rows, field, default, checks, falsy_fails):
+    """
+    Return the positions of rows whose field fails the column checks
+
+    The checks are chained with map() over the whole column and consumed by
+    all(), so no Python code runs per row. A failing value either raises or
+    (if falsy_fails) stops all() with a falsy result; either way the row
+    iterator has just passed it, so its position is read off the iterator's
+    remaining length and the scan resumes with the next row.
+    """
+    remaining = iter(rows)
+    if default is _REQUIRED:
+        values = map(itemgetter(field), remaining)
+    else:
+        values = map(dict.get, remaining, repeat(field), repeat(default))
+    for check in checks:
+        values = map(check, values)
+
+    flagged = []
+    while True:
+        try:
+            if all(values):
+                return flagged
+            if not falsy_fails:
+                continue
+        except Exception:
+            pass
+        flagged.append(len(rows) - remaining.__length_hint__() - 1)
+
+
+def validate_transactions_batch(rows: List[Any]) -> List[Tuple[str, ...]]:
+    """
+    Validate a batch of transaction payloads one field (column) at a time
+
+    Each field of every row is checked in a single pass of C-level builtins
+    (see _COLUMN_CHECKS). Those checks flag every row transaction_errors()
+    would reject, plus a few valid ones (numeric strings, uppercase types,
+    explicit nulls), and only the flagged rows are validated one by one, so
+    the messages match the single-row validator exactly. Valid rows all
+    share the empty tuple.
+
+    Args:
+        rows: List of transaction payloads (non-object rows are reported as errors)
+
+    Returns:
+        List[Tuple[str, ...]]: Error messages per row, aligned with rows
+    """
+    flagged = set()
+    for field, default, checks, falsy_fails in _COLUMN_CHECKS:
+        flagged.update(_flagged_rows(rows, field, default, checks, falsy_fails))
+
+    result = [()] * len(rows)
+    for i in flagged:
+        row = rows[i]
+        if not isinstance(row, dict):
+            result[i] = (_ROW_ERROR,)
+            continue
+        errors = transaction_errors(row)
+        if errors:
+            result[i] = tuple(errors)
+    return result
+
+
 def validate_query_params(params: Dict[str, str]) -> Dict[str, Any]:
     """
     Validate query parameters for filtering
-    
+
     Args:
         params: Dictionary of query parameters
-    
+
     Returns:
         Dict: Validation result
     """
     errors = []
-    
+
     # Validate date parameters
     for date_param in ['start_date', 'end_date']:
         if date_param in params and params[date_param]:
-            try:
-                from datetime import datetime
-                datetime.fromisoformat(params[date_param])
-            except ValueError:
+            if not _date_is_valid(params[date_param]):
                 errors.append(f"{date_param} must be in ISO format")
-    
+
     # Validate transaction_type if provided
     if 'transaction_type' in params and params['transaction_type']:
-        valid_types = ['income', 'expense', 'investment', 'transfer']
-        if params['transaction_type'].lower() not in valid_types:
-            errors.append(f"Transaction type must be one of: {', '.join(valid_types)}")
-    
+        if not _type_is_valid(params['transaction_type']):
+            errors.append(_TYPE_ERROR)
+
     is_valid = len(errors) == 0
-    
+
     return {
         'valid': is_valid,
         'errors': errors
     }
+
+
+def parse_filter_params(params: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Validate and parse the common transaction filter query parameters
+
+    Args:
+        params: Mapping of query parameters (e.g. request.args)
+
+    Returns:
+        Dict: Keyword arguments for Transaction.filter_conditions
+
+    Raises:
+        ValidationError: If any filter parameter is invalid
+    """
+    result = validate_query_params(params)
+    if not result['valid']:
+        raise ValidationError("Invalid query parameters", result['errors'])
+
+    start_date = params.get('start_date')
+    end_date = params.get('end_date')
+    return {
+        'category': params.get('category') or None,
+        'transaction_type': params.get('transaction_type') or None,
+        'start_date': _parse_iso(start_date) if start_date else None,
+        'end_date': _parse_iso(end_date) if end_date else None,
+        'tag': params.get('tag') or None,
+    }
@@ -0,0 +1,12 @@
+"""
+FinanceAI-Advisor ASGI Entry Point
+
+Serves the API with async listing, summary and export views (see app/asgi.py):
+
+    uvicorn asgi:app --host 127.0.0.1 --port 5000 --workers 4
+"""
+
+from app.asgi import create_asgi_app
+
+# Create ASGI application instance
+app = create_asgi_app()
@@ -0,0 +1 @@
+"""Benchmark scripts for FinanceAI-Advisor (not collected by pytest)."""
@@ -0,0 +1,62 @@
+"""
+Benchmark POST /transactions/bulk throughput on SQLite.
+
+Posts batches of synthetic rows as a JSON array and as NDJSON and reports
+end-to-end rows/sec (including JSON parsing, validation and rollup
+maintenance). Each batch models a year of bank history.
+
+    python -m benchmarks.bench_bulk --batch 10000 --batches 10
+"""
+
+import argparse
+import json
+import os
+import time
+
+from benchmarks.common import generate_rows, make_app
+
+
+def payloads(count, seed):
+    for row in generate_rows(count, seed=seed, span_days=365):
+        yield {
+            'amount': row['amount_minor'] / 100,
+            'category': row['category'],
+            'description': row['description'],
+            'transaction_type': row['transaction_type'],
+            'date': row['date'].isoformat(),
+            'tags': ['bench'],
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--batch', type=int, default=10000)
+    parser.add_argument('--batches', type=int, default=5)
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    app, db_path = make_app()
+    app.config['BULK_MAX_ROWS'] = max(args.batch, app.config['BULK_MAX_ROWS'])
+    client = app.test_client()
+    url = f'/api/v1/transactions/bulk?chunk_size={args.chunk_size}'
+    try:
+        for mode in ('json', 'ndjson'):
+            total_rows, total_time = 0, 0.0
+            for i in range(args.batches):
+                rows = list(payloads(args.batch, seed=i))
+                if mode == 'json':
+                    kwargs = {'data': json.dumps(rows), 'content_type': 'application/json'}
+                else:
+                    kwargs = {'data': '\n'.join(map(json.dumps, rows)), 'content_type': 'application/x-ndjson'}
+                started = time.perf_counter()
+                response = client.post(url, **kwargs)
+                total_time += time.perf_counter() - started
+                assert response.status_code == 201, response.get_json()
+                total_rows += response.get_json()['data']['inserted']
+            print(f"{mode:>7}: {total_rows} rows in {total_time:.2f}s -> {total_rows / total_time:,.0f} rows/sec")
+    finally:
+        os.remove(db_path)
+
+
+if __name__ == '__main__':
+    main()
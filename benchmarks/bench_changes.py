@@ -0,0 +1,60 @@
+"""
+Benchmark a frontend refresh through the change feed against a full reload.
+
+For each ledger size, times paging through the whole ledger (what a
+refresh used to cost, and what the first sync still costs) and fetching
+the delta after `--changes` updates, and reports bytes transferred:
+
+    python -m benchmarks.bench_changes --rows 10000 100000 --changes 10
+"""
+
+import argparse
+import json
+import os
+
+from benchmarks.common import make_app, seed, timeit
+
+
+def sync(client, since=None, epoch=None, limit=5000):
+    """Page through /transactions/changes; return (version, epoch, bytes received)"""
+    params = f"limit={limit}" + (f"&since={since}&epoch={epoch}" if since is not None else '')
+    received, version, cursor = 0, None, None
+    while True:
+        response = client.get(f"/api/v1/transactions/changes?{params}" + (f"&cursor={cursor}" if cursor else ''))
+        received += len(response.data)
+        body = json.loads(response.data)
+        if version is None:
+            version, epoch = body['version'], body['epoch']
+        cursor = body['next_cursor']
+        if not cursor:
+            return version, epoch, received
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--changes', type=int, default=10, help='Transactions updated between syncs')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'full ms':>9} {'full bytes':>11} {'delta ms':>9} {'delta bytes':>12}")
+    for rows in args.rows:
+        app, db_path = make_app()
+        try:
+            seed(app, rows)
+            client = app.test_client()
+            full_ms, _ = timeit(lambda: sync(client), args.repeat)
+            version, epoch, full_bytes = sync(client)
+            for transaction_id in range(1, args.changes + 1):
+                client.put(f"/api/v1/transactions/{transaction_id}", json={
+                    'amount': 1.0, 'category': 'food', 'description': 'Updated', 'transaction_type': 'expense',
+                })
+            delta_ms, _ = timeit(lambda: sync(client, version, epoch), args.repeat)
+            delta_bytes = sync(client, version, epoch)[2]
+            print(f"{rows:>8} {full_ms:9.1f} {full_bytes:>11} {delta_ms:9.2f} {delta_bytes:>12}")
+        finally:
+            os.remove(db_path)
+
+
+if __name__ == '__main__':
+    main()
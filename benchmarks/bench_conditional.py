@@ -0,0 +1,53 @@
+"""
+Benchmark the response cache and 304 revalidation for the read endpoints.
+
+For each endpoint, times an unconditional GET that misses the response
+cache (the view runs), one that hits it, and a GET carrying the
+If-None-Match validator from the previous response (answered from the
+ledger_state row without running the view), and reports bytes transferred:
+
+    python -m benchmarks.bench_conditional --rows 10000 100000
+"""
+
+import argparse
+import os
+
+from benchmarks.common import make_app, seed, timeit
+from app.services.response_cache import response_cache
+
+ENDPOINTS = [
+    ('/api/v1/transactions?limit=500', {}),
+    ('/api/v1/transactions?limit=500', {'Accept': 'application/vnd.apache.arrow.stream'}),
+    ('/api/v1/transactions/summary', {}),
+    ('/api/v1/transactions/summary?category=food', {}),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'endpoint':<44} {'accept':<8} {'miss ms':>8} {'hit ms':>8} {'304 ms':>8} {'200 bytes':>10}")
+    for rows in args.rows:
+        app, db_path = make_app()
+        try:
+            seed(app, rows)
+            client = app.test_client()
+            for path, headers in ENDPOINTS:
+                full = client.get(path, headers=headers)
+                conditional = dict(headers, **{'If-None-Match': full.headers['ETag']})
+                assert client.get(path, headers=conditional).status_code == 304
+                miss_ms, _ = timeit(lambda: (response_cache.invalidate(), client.get(path, headers=headers)), args.repeat)
+                hit_ms, _ = timeit(lambda: client.get(path, headers=headers), args.repeat)
+                not_modified_ms, _ = timeit(lambda: client.get(path, headers=conditional), args.repeat)
+                accept = 'arrow' if headers else 'json'
+                print(f"{rows:>8} {path:<44} {accept:<8} {miss_ms:8.2f} {hit_ms:8.2f} {not_modified_ms:8.2f} "
+                      f"{len(full.data):>10}")
+        finally:
+            os.remove(db_path)
+
+
+if __name__ == '__main__':
+    main()
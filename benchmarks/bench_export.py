@@ -0,0 +1,50 @@
+"""
+Benchmark the streamed CSV export.
+
+Reports time to first byte, total time and peak traced Python memory while
+the response is consumed chunk by chunk. Peak memory should stay flat as
+the number of exported rows grows.
+
+    python -m benchmarks.bench_export --rows 1000 100000 1000000 10000000
+"""
+
+import argparse
+import os
+import time
+import tracemalloc
+
+from benchmarks.common import make_app, seed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 100000, 1000000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'ttfb ms':>9} {'total s':>9} {'MB out':>9} {'peak MB':>9}")
+    for rows in args.rows:
+        app, db_path = make_app()
+        try:
+            seed(app, rows)
+            client = app.test_client()
+
+            tracemalloc.start()
+            started = time.perf_counter()
+            response = client.get('/api/v1/transactions/export?format=csv', buffered=False)
+            chunks = iter(response.response)
+            size = len(next(chunks))
+            ttfb = (time.perf_counter() - started) * 1000
+            for chunk in chunks:
+                size += len(chunk)
+            total = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            response.close()
+
+            print(f"{rows:>10} {ttfb:>9.1f} {total:>9.2f} {size / 1e6:>9.1f} {peak / 1e6:>9.2f}")
+        finally:
+            os.remove(db_path)
+
+
+if __name__ == '__main__':
+    main()
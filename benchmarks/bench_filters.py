@@ -0,0 +1,44 @@
+"""
+Benchmark selective GET /transactions queries as the ledger grows.
+
+With the filters pushed into SQL and backed by the composite indexes, the
+latency of a selective query should stay roughly flat from 10k to 5M rows.
+
+    python -m benchmarks.bench_filters --rows 10000 100000 1000000 5000000
+"""
+
+import argparse
+import os
+
+from benchmarks.common import make_app, seed, timeit
+
+QUERIES = {
+    'type + 1 day': '/api/v1/transactions?transaction_type=income'
+                    '&start_date=2020-06-01&end_date=2020-06-02',
+    'category + 1 day': '/api/v1/transactions?category=Food'
+                        '&start_date=2020-06-01&end_date=2020-06-02',
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10}  {'query':<18} {'median ms':>10} {'p95 ms':>10} {'hits':>6}")
+    for rows in args.rows:
+        app, db_path = make_app()
+        try:
+            seed(app, rows)
+            client = app.test_client()
+            for name, url in QUERIES.items():
+                hits = len(client.get(url).get_json()['data'])
+                median, p95 = timeit(lambda: client.get(url), repeat=args.repeat)
+                print(f"{rows:>10}  {name:<18} {median:>10.2f} {p95:>10.2f} {hits:>6}")
+        finally:
+            os.remove(db_path)
+
+
+if __name__ == '__main__':
+    main()
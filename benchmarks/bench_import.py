@@ -0,0 +1,81 @@
+"""
+Benchmark the streaming bank-statement importer on a synthetic CSV.
+
+Writes a statement of roughly --size-mb megabytes to a temporary file, then
+imports it with the same pipeline as `flask import-statement`, reporting
+rows/sec and the process's peak RSS (which should not grow with file size).
+
+    python -m benchmarks.bench_import --size-mb 1024
+"""
+
+import argparse
+import csv
+import os
+import random
+import resource
+import tempfile
+import time
+from datetime import date, timedelta
+
+from benchmarks.common import CATEGORIES, make_app
+
+
+def write_statement(path, size_mb, seed=7):
+    """Write a bank-style CSV statement of about size_mb megabytes"""
+    rng = random.Random(seed)
+    limit = size_mb * 1024 * 1024
+    start = date(2024, 1, 1)
+    rows = 0
+    with open(path, 'w', newline='') as fh:
+        writer = csv.writer(fh)
+        writer.writerow(['Txn Date', 'Narration', 'Withdrawal Amt.', 'Deposit Amt.', 'Category'])
+        while fh.tell() < limit:
+            for _ in range(1000):
+                amount = f"{rng.uniform(10, 50000):,.2f}"
+                debit = rng.random() < 0.8
+                writer.writerow([
+                    (start + timedelta(days=rng.randrange(365))).strftime('%d/%m/%Y'),
+                    f"UPI/{rng.randrange(10**9)}/MERCHANT {rng.randrange(1000)}",
+                    amount if debit else '',
+                    '' if debit else amount,
+                    rng.choice(CATEGORIES),
+                ])
+            rows += 1000
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size-mb', type=int, default=50)
+    parser.add_argument('--chunk-size', type=int, default=5000)
+    args = parser.parse_args()
+
+    fd, csv_path = tempfile.mkstemp(suffix='.csv', prefix='financeai-statement-')
+    os.close(fd)
+    app, db_path = make_app()
+    try:
+        rows = write_statement(csv_path, args.size_mb)
+        print(f"statement: {os.path.getsize(csv_path) / 1e6:.1f} MB, {rows:,} rows")
+
+        from app.services.importer import import_statement
+
+        def progress(stats):
+            print(f"  {stats.rows_read:>12,} rows read  {stats.rows_per_second or 0:>8,} rows/sec", flush=True)
+
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        with app.app_context(), open(csv_path, 'rb') as fh:
+            started = time.perf_counter()
+            stats = import_statement(fh, 'csv', chunk_size=args.chunk_size, progress=progress)
+            elapsed = time.perf_counter() - started
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        print(f"imported {stats.rows_inserted:,} rows ({stats.rows_failed} failed) in {elapsed:.1f}s "
+              f"-> {stats.rows_inserted / elapsed:,.0f} rows/sec, "
+              f"peak RSS {rss_before / 1024:.0f} MB before / {rss_after / 1024:.0f} MB after")
+    finally:
+        os.remove(csv_path)
+        os.remove(db_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark the per-request cost of request logging.
+
+Compares what a request thread pays to log itself under three setups, with
+several threads logging at once so handler-lock contention shows up:
+
+  legacy      two f-string lines per request through a StreamHandler
+              (the previous before/after_request hooks)
+  queue       one structured record per request through the queue pipeline
+              (app.utils.logger.log_request), written as JSON by the listener
+  sampled     as queue, keeping LOG_SAMPLE_RATE of successful requests
+
+Output goes to a temporary file. "caller us" is the time request threads
+spend per request; "total us" includes waiting for the listener to finish
+writing everything queued.
+
+    python -m benchmarks.bench_logging --requests 50000 --threads 1 8 --sample-rate 0.1
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import threading
+import time
+import uuid
+
+from app.utils import logger as app_logger
+
+
+def legacy_logger(stream):
+    log = logging.getLogger('bench.legacy')
+    log.handlers[:] = [logging.StreamHandler(stream)]
+    log.handlers[0].setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+    log.propagate = False
+    log.setLevel(logging.INFO)
+    return log
+
+
+def run_threads(threads, per_thread, func):
+    workers = [threading.Thread(target=lambda: [func() for _ in range(per_thread)]) for _ in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=50000)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 8])
+    parser.add_argument('--sample-rate', type=float, default=0.1)
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix='.log', prefix='financeai-bench-')
+    os.close(fd)
+    try:
+        with open(path, 'a') as stream:
+            legacy = legacy_logger(stream)
+            app_logger.start_listener(stream)
+            request_id = uuid.uuid4().hex
+
+            def legacy_request():
+                method, url, status = 'GET', 'http://localhost/api/v1/transactions?limit=100', '200 OK'
+                legacy.info(f"Incoming request: {method} {url}")
+                legacy.info(f"Response status: {status}")
+
+            def queue_request(sample_rate):
+                return lambda: app_logger.log_request('GET', '/api/v1/transactions', '/api/v1/transactions',
+                                                      200, 1.234, request_id, sample_rate)
+
+            print(f"{'setup':<10} {'threads':>7} {'caller us':>10} {'total us':>10} {'bytes/req':>10}")
+            for threads in args.threads:
+                per_thread = args.requests // threads
+                count = per_thread * threads
+                for name, func in (('legacy', legacy_request),
+                                   ('queue', queue_request(1.0)),
+                                   ('sampled', queue_request(args.sample_rate))):
+                    stream.flush()
+                    before = os.path.getsize(path)
+                    caller = run_threads(threads, per_thread, func)
+                    # Restarting the listener waits for the old one to drain its queue
+                    drain_started = time.perf_counter()
+                    app_logger.start_listener(stream)
+                    total = caller + time.perf_counter() - drain_started
+                    stream.flush()
+                    written = os.path.getsize(path) - before
+                    print(f"{name:<10} {threads:>7} {caller / count * 1e6:10.2f} "
+                          f"{total / count * 1e6:10.2f} {written / count:10.1f}")
+    finally:
+        app_logger.start_listener()
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
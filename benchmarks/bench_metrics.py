@@ -0,0 +1,108 @@
+"""
+Benchmark the per-request cost of metrics collection.
+
+Two measurements:
+
+  recording   start_request/finish_request plus one query observation per
+              simulated query, from several threads at once so lock
+              contention shows up
+  end-to-end  requests through the Flask test client with METRICS_ENABLED
+              on and off (each setting in its own process, since the query
+              hooks are installed per process); the median per-round
+              difference is the overhead a request pays, including the
+              SQLAlchemy events
+
+    python -m benchmarks.bench_metrics --rows 10000 --requests 5000 --threads 1 8
+"""
+
+import argparse
+import os
+import statistics
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.common import make_app, seed
+
+ENDPOINTS = [
+    '/health',
+    '/api/v1/transactions/1',
+    '/api/v1/transactions?limit=100',
+    '/api/v1/transactions/summary',
+]
+
+
+def time_recording(threads, per_thread, queries):
+    """Return microseconds per request spent recording metrics"""
+    from app.utils import metrics
+
+    def work():
+        for _ in range(per_thread):
+            metrics.start_request('/api/v1/transactions/<transaction_id>')
+            for _ in range(queries):
+                metrics.QUERY_LATENCY.observe(0.0004)
+            metrics.finish_request('GET', '/api/v1/transactions/<transaction_id>', 200, 0.003)
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return (time.perf_counter() - started) / (threads * per_thread) * 1e6
+
+
+_client = None
+
+
+def _init_worker(db_path, enabled):
+    global _client
+    os.environ['METRICS_ENABLED'] = str(enabled)
+    os.environ['LOG_SAMPLE_RATE'] = '0'  # keep request-log output out of the timings
+    app, _ = make_app(db_path)
+    _client = app.test_client()
+
+
+def time_requests(path, requests):
+    """Return microseconds per request for `requests` GETs of path"""
+    _client.get(path)
+    started = time.perf_counter()
+    for _ in range(requests):
+        _client.get(path)
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--rounds', type=int, default=9)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 8])
+    parser.add_argument('--queries', type=int, default=3, help='Queries per simulated request')
+    args = parser.parse_args()
+
+    print(f"{'threads':>7} {'recording us/req':>17}")
+    for threads in args.threads:
+        print(f"{threads:>7} {time_recording(threads, 100000 // threads, args.queries):17.2f}")
+
+    app, db_path = make_app()
+    try:
+        seed(app, args.rows)
+        # Rounds alternate between the two processes so drifting machine
+        # load hits both settings alike
+        with ProcessPoolExecutor(1, initializer=_init_worker, initargs=(db_path, False)) as off, \
+                ProcessPoolExecutor(1, initializer=_init_worker, initargs=(db_path, True)) as on:
+            print(f"\n{'endpoint':<36} {'off us':>9} {'on us':>9} {'overhead':>9}")
+            for path in ENDPOINTS:
+                rounds = [(off.submit(time_requests, path, args.requests).result(),
+                           on.submit(time_requests, path, args.requests).result())
+                          for _ in range(args.rounds)]
+                print(f"{path:<36} {statistics.median(r[0] for r in rounds):9.1f} "
+                      f"{statistics.median(r[1] for r in rounds):9.1f} "
+                      f"{statistics.median(r[1] - r[0] for r in rounds):9.1f}")
+    finally:
+        os.remove(db_path)
+
+
+if __name__ == '__main__':
+    main()
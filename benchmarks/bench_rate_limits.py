@@ -0,0 +1,89 @@
+"""
+Benchmark rate-limit storage backends and check they hold across processes.
+
+For each storage URI and strategy, reports the cost of one limiter hit, then
+has several worker processes hit the same key concurrently and checks that
+exactly `limit` hits were granted in total (per-process memory storage
+grants `limit` per process, which is the bug shared storage fixes):
+
+    python -m benchmarks.bench_rate_limits --hits 20000 --processes 4
+    python -m benchmarks.bench_rate_limits --storage redis://127.0.0.1:6379
+
+Without --storage, runs memory:// and a SQLite file on /dev/shm (or the
+temp directory). Pass a redis:// URI to include a Redis-protocol server
+(Redis, Valkey, KeyDB, ...).
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import STRATEGIES
+
+import app.utils.rate_limits  # noqa: F401 - registers sqlite://
+
+STRATEGY_NAMES = ['fixed-window', 'sliding-window-counter']
+
+
+def limiter_for(uri, strategy):
+    return STRATEGIES[strategy](storage_from_string(uri))
+
+
+def time_hits(uri, strategy, hits):
+    """Return seconds per hit against distinct keys that never hit the limit"""
+    limiter = limiter_for(uri, strategy)
+    item = parse(f"{hits * 10} per minute")
+    limiter.storage.reset()
+    started = time.perf_counter()
+    for i in range(hits):
+        limiter.hit(item, 'bench', str(i % 64))
+    return (time.perf_counter() - started) / hits
+
+
+def grab(uri, strategy, limit, attempts):
+    """Hit one shared key `attempts` times; return how many hits were granted"""
+    limiter = limiter_for(uri, strategy)
+    item = parse(f"{limit} per hour")
+    return sum(limiter.hit(item, 'shared', 'client') for _ in range(attempts))
+
+
+def default_storages():
+    shm = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+    return ['memory://', f"sqlite:///{os.path.join(shm, f'financeai-bench-ratelimits-{os.getpid()}.db')}"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--storage', nargs='+')
+    parser.add_argument('--hits', type=int, default=20000)
+    parser.add_argument('--processes', type=int, default=4)
+    parser.add_argument('--limit', type=int, default=100)
+    args = parser.parse_args()
+
+    storages = args.storage or default_storages()
+    print(f"{'storage':<60} {'strategy':<24} {'us/hit':>8} {'granted':>8} {'expected':>8}")
+    try:
+        with ProcessPoolExecutor(max_workers=args.processes) as pool:
+            for uri in storages:
+                for strategy in STRATEGY_NAMES:
+                    per_hit = time_hits(uri, strategy, args.hits)
+                    storage_from_string(uri).reset()
+                    futures = [pool.submit(grab, uri, strategy, args.limit, args.limit)
+                               for _ in range(args.processes)]
+                    granted = sum(future.result() for future in futures)
+                    print(f"{uri:<60} {strategy:<24} {per_hit * 1e6:8.1f} {granted:>8} {args.limit:>8}")
+    finally:
+        for uri in storages:
+            if uri.startswith('sqlite:///'):
+                path = uri[len('sqlite:///'):]
+                for suffix in ('', '-wal', '-shm'):
+                    if os.path.exists(path + suffix):
+                        os.remove(path + suffix)
+
+
+if __name__ == '__main__':
+    main()
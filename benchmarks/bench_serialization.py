@@ -0,0 +1,108 @@
+"""
+Benchmark listing serialization: ORM objects + to_dict vs column tuples.
+
+Builds the GET /transactions response body for a page of rows three ways
+and reports bytes/sec for each:
+
+  orm+default   ORM query, Transaction.to_dict, Flask's default JSON provider
+  tuples+json   column tuples (serialize_rows), FastJSONProvider on the stdlib
+  tuples+orjson column tuples (serialize_rows), FastJSONProvider on orjson
+
+All three bodies are checked to decode to the same document.
+
+    python -m benchmarks.bench_serialization --rows 100000 --page 1000 10000
+"""
+
+import argparse
+import json
+import os
+import time
+
+from benchmarks.common import make_app, seed
+
+
+def tag_rows(app, every=3):
+    """Give every `every`-th transaction two tags"""
+    from app.extensions import db
+    from app.models.transaction import Transaction, TransactionTag
+
+    with app.app_context():
+        ids = db.session.scalars(db.select(Transaction.id).where(Transaction.id % every == 0)).all()
+        db.session.execute(db.insert(TransactionTag), [
+            {'transaction_id': tx_id, 'position': position, 'tag': tag}
+            for tx_id in ids for position, tag in enumerate(('bench', 'monthly'))
+        ])
+        db.session.commit()
+
+
+def best_of(func, repeat):
+    best, body = None, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--page', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    app, db_path = make_app()
+    try:
+        seed(app, args.rows)
+        tag_rows(app)
+
+        from flask.json.provider import DefaultJSONProvider
+        from app.extensions import db
+        from app.models.transaction import Transaction
+        from app.services.serialization import listing_statement, serialize_rows
+        from app.utils.json_provider import FastJSONProvider
+        from app.utils.response import json_response
+
+        default_provider = DefaultJSONProvider(app)
+        stdlib_provider = FastJSONProvider(app)
+        stdlib_provider.use_orjson = False
+        orjson_provider = FastJSONProvider(app)
+
+        def envelope(data):
+            return json_response(True, f"Retrieved {len(data)} transactions", data=data,
+                                 meta={'count': len(data)})[0]
+
+        with app.app_context():
+            for page in args.page:
+                def orm_default():
+                    query = Transaction.query.order_by(Transaction.date.desc(), Transaction.id.desc())
+                    data = [t.to_dict() for t in query.limit(page)]
+                    return default_provider.response(envelope(data)).get_data()
+
+                def tuples(provider):
+                    def run():
+                        rows = db.session.execute(listing_statement({}).limit(page)).all()
+                        return provider.response(envelope(serialize_rows(db.session, rows))).get_data()
+                    return run
+
+                results = {}
+                for name, func in (('orm+default', orm_default),
+                                   ('tuples+json', tuples(stdlib_provider)),
+                                   ('tuples+orjson', tuples(orjson_provider))):
+                    db.session.expire_all()
+                    results[name] = best_of(func, args.repeat)
+
+                documents = [json.loads(body) for _, body in results.values()]
+                assert all(doc == documents[0] for doc in documents), "serialization paths disagree"
+
+                baseline = results['orm+default'][0]
+                for name, (elapsed, body) in results.items():
+                    print(f"{page:>8} rows  {name:<14} {elapsed * 1000:8.1f} ms  "
+                          f"{len(body) / elapsed / 1e6:8.1f} MB/s  {baseline / elapsed:5.1f}x")
+    finally:
+        os.remove(db_path)
+
+
+if __name__ == '__main__':
+    main()
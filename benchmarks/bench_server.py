@@ -0,0 +1,141 @@
+"""
+Load-test the production servers under different worker counts.
+
+Seeds a throwaway SQLite database, starts each server for each worker count,
+and hammers each endpoint with keep-alive HTTP clients for a fixed duration.
+Reports requests/sec and p50/p99 latency:
+
+    python -m benchmarks.bench_server --rows 100000 --workers 1 2 4 --clients 8
+    python -m benchmarks.bench_server --server sync async --workers 2 --clients 64
+
+Servers:
+
+  sync   gunicorn with gunicorn.conf.py (gthread workers), wsgi:app
+  async  uvicorn, asgi:app (async listing/summary/export views)
+
+Clients run in separate processes so the load generator is not limited by
+one interpreter's GIL; on small machines it still competes with the server
+for CPU, so compare worker counts against each other rather than reading
+the absolute numbers as capacity. Rate limiting is disabled for the run.
+"""
+
+import argparse
+import http.client
+import os
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.common import make_app, seed
+
+ENDPOINTS = [
+    '/health',
+    '/api/v1/transactions/1',
+    '/api/v1/transactions?limit=100',
+    '/api/v1/transactions?limit=1000',
+    '/api/v1/transactions/summary',
+    '/api/v1/transactions/export?format=csv&category=food',
+]
+
+
+def client(host, port, path, duration):
+    """Issue GETs on one keep-alive connection for `duration` seconds; return latencies"""
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    latencies, errors = [], 0
+    deadline = time.perf_counter() + duration
+    while True:
+        started = time.perf_counter()
+        if started >= deadline:
+            break
+        try:
+            conn.request('GET', path)
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                errors += 1
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            conn.close()
+            conn = http.client.HTTPConnection(host, port, timeout=30)
+            continue
+        latencies.append(time.perf_counter() - started)
+    conn.close()
+    return latencies, errors
+
+
+def wait_until_ready(host, port, server, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"server exited with status {server.returncode}")
+        try:
+            conn = http.client.HTTPConnection(host, port, timeout=1)
+            conn.request('GET', '/health')
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("server did not become ready")
+
+
+def start_server(kind, db_path, host, port, workers, threads):
+    env = dict(os.environ,
+               DATABASE_URL=f'sqlite:///{db_path}',
+               FLASK_ENV='development',  # disables the rate limiter
+               GUNICORN_BIND=f'{host}:{port}',
+               WEB_CONCURRENCY=str(workers),
+               GUNICORN_THREADS=str(threads))
+    if kind == 'async':
+        command = ['-m', 'uvicorn', 'asgi:app', '--host', host, '--port', str(port),
+                   '--workers', str(workers), '--no-access-log']
+    else:
+        command = ['-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'wsgi:app']
+    server = subprocess.Popen([sys.executable, *command], env=env,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    wait_until_ready(host, port, server)
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--server', nargs='+', choices=['sync', 'async'], default=['sync'])
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=5.0, help='Seconds per endpoint')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5055)
+    args = parser.parse_args()
+
+    app, db_path = make_app()
+    try:
+        seed(app, args.rows)
+        print(f"{'server':<6} {'workers':>7} {'endpoint':<52} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'errors':>6}")
+        with ProcessPoolExecutor(max_workers=args.clients) as pool:
+            for kind, workers in ((kind, workers) for kind in args.server for workers in args.workers):
+                server = start_server(kind, db_path, args.host, args.port, workers, args.threads)
+                try:
+                    for path in ENDPOINTS:
+                        futures = [pool.submit(client, args.host, args.port, path, args.duration)
+                                   for _ in range(args.clients)]
+                        results = [future.result() for future in futures]
+                        latencies = sorted(l for lats, _ in results for l in lats)
+                        errors = sum(e for _, e in results)
+                        if len(latencies) < 2:
+                            print(f"{kind:<6} {workers:>7} {path:<52} {'-':>9} {'-':>8} {'-':>8} {errors:>6}")
+                            continue
+                        cuts = statistics.quantiles(latencies, n=100)
+                        print(f"{kind:<6} {workers:>7} {path:<52} {len(latencies) / args.duration:9.0f} "
+                              f"{cuts[49] * 1000:8.2f} {cuts[98] * 1000:8.2f} {errors:>6}")
+                finally:
+                    server.terminate()
+                    server.wait(timeout=60)
+    finally:
+        os.remove(db_path)
+
+
+if __name__ == '__main__':
+    main()
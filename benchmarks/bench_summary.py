@@ -0,0 +1,43 @@
+"""
+Benchmark GET /transactions/summary on large ledgers.
+
+The summary is a single GROUP BY query, so the Python side only folds one
+row per (category, transaction_type) pair regardless of ledger size.
+
+    python -m benchmarks.bench_summary --rows 100000 1000000 5000000
+"""
+
+import argparse
+import os
+
+from benchmarks.common import make_app, seed, timeit
+
+QUERIES = {
+    'all rows': '/api/v1/transactions/summary',
+    'expense, 1 year': '/api/v1/transactions/summary?transaction_type=expense'
+                       '&start_date=2020-01-01&end_date=2020-12-31',
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, nargs='+', default=[100000, 1000000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10}  {'query':<16} {'median ms':>10} {'p95 ms':>10}")
+    for rows in args.rows:
+        app, db_path = make_app()
+        try:
+            seed(app, rows)
+            client = app.test_client()
+            for name, url in QUERIES.items():
+                assert client.get(url).status_code == 200
+                median, p95 = timeit(lambda: client.get(url), repeat=args.repeat)
+                print(f"{rows:>10}  {name:<16} {median:>10.2f} {p95:>10.2f}")
+        finally:
+            os.remove(db_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""
+Benchmark batch validation against looping the single-row validator.
+
+Validates the same synthetic payloads three ways: the original per-row
+validator (kept verbatim below as the baseline) in a try/except loop, the
+current validate_transaction_data() in the same loop, and
+validate_transactions_batch(). The three run in turn on every round so
+machine noise affects them alike. Checks all three report identical errors,
+prints the batch speedup over each loop and fails if it is below
+--min-speedup over the original. A fraction of rows is made invalid so
+error paths are exercised too.
+
+    python -m benchmarks.bench_validators --rows 100000
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.common import generate_rows
+from app.utils.exceptions import ValidationError
+from app.utils.validators import validate_transaction_data, validate_transactions_batch
+
+# Columnar validation measures 6-8x over the original loop on CPython 3.11;
+# one dict lookup and one C call per field and row bound it well short of 10x
+MIN_SPEEDUP = 5
+
+
+def payloads(count, invalid_ratio, seed=7):
+    rng = random.Random(seed)
+    rows = []
+    for row in generate_rows(count, seed=seed, span_days=365):
+        payload = {
+            'amount': row['amount_minor'] / 100,
+            'category': row['category'],
+            'description': row['description'],
+            'transaction_type': row['transaction_type'],
+            'date': row['date'].isoformat(),
+            'tags': ['bench'],
+        }
+        if rng.random() < invalid_ratio:
+            payload[rng.choice(['amount', 'category', 'transaction_type', 'date'])] = ''
+        rows.append(payload)
+    return rows
+
+
+def original_validate(data):
+    """validate_transaction_data() as it was before batch validation"""
+    errors = []
+
+    required_fields = ['amount', 'category', 'description', 'transaction_type']
+
+    for field in required_fields:
+        if field not in data or data[field] is None:
+            errors.append(f"'{field}' is required")
+        elif isinstance(data[field], str) and not data[field].strip():
+            errors.append(f"'{field}' cannot be empty")
+
+    if 'amount' in data:
+        try:
+            amount = float(data['amount'])
+            if amount == 0:
+                errors.append("Amount cannot be zero")
+        except (ValueError, TypeError):
+            errors.append("Amount must be a valid number")
+
+    valid_types = ['income', 'expense', 'investment', 'transfer']
+    if 'transaction_type' in data:
+        if data['transaction_type'].lower() not in valid_types:
+            errors.append(f"Transaction type must be one of: {', '.join(valid_types)}")
+
+    if 'tags' in data and data['tags'] is not None:
+        if not isinstance(data['tags'], list):
+            errors.append("Tags must be a list")
+        elif not all(isinstance(tag, str) for tag in data['tags']):
+            errors.append("All tags must be strings")
+
+    if 'date' in data and data['date'] is not None:
+        try:
+            from datetime import datetime
+            datetime.fromisoformat(data['date'])
+        except ValueError:
+            errors.append("Date must be in ISO format (YYYY-MM-DDTHH:MM:SS)")
+
+    if errors:
+        raise ValidationError("Invalid transaction data", errors)
+    return {'valid': True, 'message': "Validation successful", 'errors': errors}
+
+
+def looped(validator):
+    def run(rows):
+        errors = []
+        for payload in rows:
+            try:
+                validator(payload)
+                errors.append(())
+            except ValidationError as e:
+                errors.append(tuple(e.errors))
+        return errors
+    return run
+
+
+def best_of(funcs, rows, repeat):
+    """Return the best time and last result of each function, run in turn each round"""
+    best, results = [None] * len(funcs), [None] * len(funcs)
+    for _ in range(repeat):
+        for i, func in enumerate(funcs):
+            started = time.perf_counter()
+            results[i] = func(rows)
+            elapsed = time.perf_counter() - started
+            best[i] = elapsed if best[i] is None else min(best[i], elapsed)
+    return best, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--invalid-ratio', type=float, default=0.01)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-speedup', type=float, default=MIN_SPEEDUP,
+                        help="fail unless batch validation beats the original loop by this factor")
+    args = parser.parse_args()
+
+    for count in args.rows:
+        rows = payloads(count, args.invalid_ratio)
+        (original_time, loop_time, batch_time), (expected, current, actual) = best_of(
+            [looped(original_validate), looped(validate_transaction_data), validate_transactions_batch],
+            rows, args.repeat,
+        )
+        assert actual == current == expected, "batch and per-row validation disagree"
+        speedup = original_time / batch_time
+        print(f"{count:>8} rows: original loop {original_time * 1000:8.1f} ms  "
+              f"loop {loop_time * 1000:8.1f} ms  "
+              f"batch {batch_time * 1000:8.1f} ms ({count / batch_time:,.0f} rows/sec)  "
+              f"speedup {speedup:.1f}x vs original, {loop_time / batch_time:.1f}x vs loop")
+        assert speedup >= args.min_speedup, f"batch validation is only {speedup:.1f}x faster than the original loop"
+
+
+if __name__ == '__main__':
+    main()
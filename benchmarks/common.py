@@ -0,0 +1,85 @@
+"""
+Shared helpers for the FinanceAI-Advisor benchmark scripts.
+
+Benchmarks run against a throwaway SQLite file so they never touch the
+development database. Run them from the repository root, e.g.:
+
+    python -m benchmarks.bench_filters --rows 10000 100000
+"""
+
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+CATEGORIES = ['food', 'rent', 'salary', 'transport', 'shopping', 'utilities',
+              'healthcare', 'education', 'entertainment', 'investment']
+TYPES = ['income', 'expense', 'investment', 'transfer']
+
+
+def make_app(db_path=None):
+    """Create an app bound to a temporary SQLite file with rate limiting off"""
+    if db_path is None:
+        fd, db_path = tempfile.mkstemp(suffix='.db', prefix='financeai-bench-')
+        os.close(fd)
+        os.remove(db_path)
+    os.environ['DATABASE_URL'] = f'sqlite:///{db_path}'
+
+    from app import create_app
+    from app.extensions import db, limiter
+
+    app = create_app()
+    limiter.enabled = False
+    with app.app_context():
+        db.create_all()
+    return app, db_path
+
+
+def generate_rows(count, seed=42, start=datetime(2015, 1, 1), span_days=3650):
+    """Yield synthetic transaction rows as column dicts, spread over span_days"""
+    rng = random.Random(seed)
+    span = span_days * 24 * 3600
+    for _ in range(count):
+        category = rng.choice(CATEGORIES)
+        yield {
+            'amount_minor': rng.randrange(1000, 5000000),
+            'category': category,
+            'category_key': category,
+            'description': f'Synthetic {category} transaction',
+            'transaction_type': rng.choice(TYPES),
+            'date': start + timedelta(seconds=rng.randrange(span)),
+            'created_at': start,
+        }
+
+
+def seed(app, count, chunk_size=50000):
+    """Insert `count` synthetic rows with executemany in chunks"""
+    from app.extensions import db
+    from app.models.transaction import Transaction
+    from app.services import ledger, rollups
+
+    with app.app_context():
+        table = Transaction.__table__
+        chunk = []
+        for row in generate_rows(count):
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                db.session.execute(table.insert(), chunk)
+                chunk = []
+        if chunk:
+            db.session.execute(table.insert(), chunk)
+        rollups.rebuild()
+        ledger.bump()
+        db.session.commit()
+
+
+def timeit(func, repeat=20):
+    """Return (median, p95) wall time of func() in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2], samples[int(len(samples) * 0.95) - 1]
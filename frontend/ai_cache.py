@@ -0,0 +1,142 @@
+"""
+AI Response Cache
+
+Gemini answers for the Streamlit frontend are cached on disk, keyed by a
+hash of the model, the prompt template, the normalized question and the
+normalized financial summary it was asked about. The canned insight tabs
+send the same questions against a summary that rarely changes, so repeat
+clicks are answered without calling the model; any new transaction
+changes the summary and therefore the key.
+
+Entries live in a SQLite file so they survive restarts and are shared by
+every Streamlit session and process on the host. Each entry expires
+AI_CACHE_TTL seconds after it was generated, and once the file holds more
+than AI_CACHE_MAX_ENTRIES the least recently used entries are evicted.
+Failed generations are not cached.
+
+This module does not import Streamlit or the Gemini SDK; any object with
+generate_content(prompt) returning something with a .text attribute can
+be passed as the model, e.g. a local stub in tests.
+
+Configuration (environment):
+    AI_CACHE_PATH (str): SQLite file, default frontend/.cache/ai_responses.db
+    AI_CACHE_TTL (int): Seconds an answer is reused, default 86400
+    AI_CACHE_MAX_ENTRIES (int): Entries kept, default 500
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'ai_responses.db')
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def _normalize(value):
+    # Amounts that differ only past the paise do not change the answer
+    if isinstance(value, float):
+        return round(value, 2)
+    if isinstance(value, dict):
+        return {str(key): _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def cache_key(query, summary, model, template=''):
+    """
+    Return the cache key for a question about a summary
+
+    Args:
+        query (str): User question; case and whitespace are ignored
+        summary (dict): Financial summary sent with the question
+        model (str): Model name
+        template (str, optional): Prompt template the answer was generated with
+    """
+    payload = json.dumps({
+        'model': model,
+        'template': hashlib.sha256(template.encode('utf-8')).hexdigest(),
+        'query': _WHITESPACE.sub(' ', query).strip().casefold(),
+        'summary': _normalize(summary or {}),
+    }, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class AIResponseCache:
+    """Disk-backed LRU of model answers with a TTL"""
+
+    def __init__(self, path=None, ttl=None, max_entries=None, clock=time.time):
+        self.path = path or os.getenv('AI_CACHE_PATH', DEFAULT_PATH)
+        self.ttl = ttl if ttl is not None else int(os.getenv('AI_CACHE_TTL', 86400))
+        self.max_entries = max_entries if max_entries is not None else int(os.getenv('AI_CACHE_MAX_ENTRIES', 500))
+        self.clock = clock
+        self._lock = threading.Lock()
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # One connection shared by the session threads, serialized by the lock;
+        # other processes coordinate through SQLite's file locking
+        self._conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+        with self._conn as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ai_responses ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL, used_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_ai_responses_used_at ON ai_responses (used_at)")
+
+    def __len__(self):
+        with self._lock, self._conn as conn:
+            return conn.execute("SELECT count(*) FROM ai_responses").fetchone()[0]
+
+    def get(self, key):
+        """Return the cached answer for key, or None if missing or expired"""
+        now = self.clock()
+        with self._lock, self._conn as conn:
+            row = conn.execute("SELECT response, created_at FROM ai_responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[1] + self.ttl <= now:
+                conn.execute("DELETE FROM ai_responses WHERE key = ?", (key,))
+                return None
+            conn.execute("UPDATE ai_responses SET used_at = ? WHERE key = ?", (now, key))
+            return row[0]
+
+    def set(self, key, response):
+        """Store an answer, evicting expired and then least recently used entries"""
+        now = self.clock()
+        with self._lock, self._conn as conn:
+            conn.execute("INSERT OR REPLACE INTO ai_responses (key, response, created_at, used_at) VALUES (?, ?, ?, ?)",
+                         (key, response, now, now))
+            conn.execute("DELETE FROM ai_responses WHERE created_at <= ?", (now - self.ttl,))
+            conn.execute(
+                "DELETE FROM ai_responses WHERE key IN "
+                "(SELECT key FROM ai_responses ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+
+    def get_or_generate(self, query, summary, model, prompt, model_name, template=''):
+        """
+        Return (answer, cached) for a question, calling the model only on a miss
+
+        Args:
+            query (str): User question
+            summary (dict): Financial summary the question is about
+            model: Object with generate_content(prompt) returning a response with .text
+            prompt (str): Full prompt to send on a miss
+            model_name (str): Model name, part of the key
+            template (str, optional): Prompt template, part of the key
+
+        Raises:
+            Exception: Whatever the model raises; nothing is cached then
+        """
+        key = cache_key(query, summary, model_name, template)
+        answer = self.get(key)
+        if answer is not None:
+            return answer, True
+        answer = model.generate_content(prompt).text
+        self.set(key, answer)
+        return answer, False
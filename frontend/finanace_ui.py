@@ -8,8 +8,14 @@ import os
 from dotenv import load_dotenv
 import google.generativeai as genai
 from datetime import datetime, timedelta
+from ai_cache import AIResponseCache
 import time
 
+try:
+    import pyarrow as pa
+except ImportError:  # JSON pages are used instead
+    pa = None
+
 # Load environment variables
 load_dotenv()
 genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
@@ -88,36 +94,210 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # --- Utility Functions ---
+PAGE_SIZE = 500  # Rows per request when paging through /transactions
+LOOKUP_LIMIT = 20  # Options offered by the transaction picker
+SEARCH_PAGE_SIZE = 50  # Hits per page in the Search & Filter tab
+EXPORT_POLL_INTERVAL = 1  # Seconds between status checks of a PDF export job
+EXPORT_POLL_TIMEOUT = 300  # Seconds before giving up on a PDF export job
+TRANSACTION_TYPES = ["income", "expense", "investment", "transfer"]
+TIMESERIES_BUCKETS = {"month": ("Month", "Monthly"), "week": ("Week", "Weekly"), "day": ("Day", "Daily")}
+ARROW_STREAM_MIMETYPE = "application/vnd.apache.arrow.stream"
+
+VALIDATED_RESPONSES_MAX = 256  # Responses kept for revalidation
+
+@st.cache_resource
+def validated_responses():
+    """Parsed responses with their ETag/Last-Modified, kept across st.cache_data.clear()"""
+    return {}
+
+def conditional_get(url, parse, params=None, headers=None, timeout=10):
+    """GET url, revalidating a previously parsed response with the validators it came with
+
+    The backend answers 304 from its ledger version when nothing changed,
+    so the cached parse(res) result is reused without re-downloading the body.
+    """
+    headers = dict(headers or {})
+    key = (url, tuple(sorted((params or {}).items())), tuple(sorted(headers.items())))
+    cache = validated_responses()
+    cached = cache.get(key)
+    if cached:
+        headers.update(cached["validators"])
+    res = requests.get(url, params=params, headers=headers, timeout=timeout)
+    if res.status_code == 304 and cached:
+        return cached["value"]
+    value = parse(res)
+    if res.status_code == 200 and res.headers.get("ETag"):
+        validators = {"If-None-Match": res.headers["ETag"]}
+        if res.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = res.headers["Last-Modified"]
+        cache.pop(key, None)
+        cache[key] = {"validators": validators, "value": value}
+        while len(cache) > VALIDATED_RESPONSES_MAX:
+            cache.pop(next(iter(cache)), None)
+    return value
+
+def _parse_transactions_page(res):
+    if res.status_code == 200 and res.headers.get("Content-Type", "").startswith(ARROW_STREAM_MIMETYPE):
+        page = pa.ipc.open_stream(res.content).read_pandas()
+        return page, res.headers.get("X-Next-Cursor")
+    if res.status_code == 200 and res.json()["success"]:
+        body = res.json()
+        return pd.DataFrame(body["data"]), body.get("next_cursor")
+    else:
+        st.error("❌ Failed to load transactions from backend")
+        return pd.DataFrame(), None
+
 @st.cache_data(ttl=300)  # Cache for 5 minutes
-def get_transactions():
-    """Fetch transactions from the API with caching"""
+def get_transactions_page(cursor=None, limit=PAGE_SIZE):
+    """Fetch a single page of transactions (newest first) with caching
+
+    Returns:
+        tuple: (DataFrame for the page, cursor for the next page or None)
+    """
     try:
-        res = requests.get(f"{API_BASE}/transactions", timeout=10)
-        if res.status_code == 200 and res.json()["success"]:
-            return pd.DataFrame(res.json()["data"])
-        else:
-            st.error("❌ Failed to load transactions from backend")
-            return pd.DataFrame()
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        # Ask for an Arrow stream so pages load column-wise without JSON decoding
+        headers = {"Accept": ARROW_STREAM_MIMETYPE} if pa is not None else {}
+        return conditional_get(f"{API_BASE}/transactions", _parse_transactions_page, params=params, headers=headers)
     except requests.RequestException as e:
         st.error(f"❌ Connection error: {str(e)}")
+        return pd.DataFrame(), None
+
+def iter_transaction_pages(limit=PAGE_SIZE):
+    """Lazily yield transaction pages, requesting the next one only when needed"""
+    cursor = None
+    while True:
+        page, cursor = get_transactions_page(cursor, limit)
+        if not page.empty:
+            yield page
+        if not cursor:
+            return
+
+def get_transactions(max_rows):
+    """Return the newest `max_rows` transactions, fetching only the pages needed"""
+    frames = []
+    loaded = 0
+    for page in iter_transaction_pages(min(PAGE_SIZE, max_rows)):
+        frames.append(page)
+        loaded += len(page)
+        if loaded >= max_rows:
+            break
+    if not frames:
         return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True).head(max_rows)
+
+def poll_pdf_export():
+    """Check the pending PDF export job once, storing the report when it is ready
+
+    Returns:
+        bool: True while the job is still queued or running
+    """
+    job_id = st.session_state.get("pdf_export_job")
+    if not job_id or "pdf_export_bytes" in st.session_state:
+        return False
+    if time.time() - st.session_state.get("pdf_export_started", 0) > EXPORT_POLL_TIMEOUT:
+        st.error("❌ PDF report generation timed out")
+        st.session_state.pop("pdf_export_job", None)
+        return False
+    try:
+        res = requests.get(f"{API_BASE}/exports/{job_id}", timeout=5)
+        if not res.ok:
+            st.error("❌ PDF report job was not found")
+            st.session_state.pop("pdf_export_job", None)
+            return False
+        job = res.json()["data"]
+        if job["status"] == "completed":
+            res = requests.get(f"{API_BASE}/exports/{job_id}", params={"download": 1}, timeout=30)
+            if res.ok:
+                st.session_state["pdf_export_bytes"] = res.content
+            else:
+                st.error("❌ Failed to download PDF report")
+                st.session_state.pop("pdf_export_job", None)
+            return False
+        if job["status"] == "failed":
+            st.error(f"❌ Failed to generate PDF report: {job.get('error', 'Unknown error')}")
+            st.session_state.pop("pdf_export_job", None)
+            return False
+        st.info(f"⏳ Report {job['status']}...")
+        return True
+    except requests.RequestException as e:
+        st.error(f"❌ Export error: {str(e)}")
+        st.session_state.pop("pdf_export_job", None)
+        return False
+
+def lookup_transactions(query=""):
+    """Top matches for a picker query (id, category or description prefix) from the backend"""
+    try:
+        return conditional_get(f"{API_BASE}/transactions/lookup",
+                               lambda res: res.json().get("data", []) if res.status_code == 200 else [],
+                               params={"q": query, "limit": LOOKUP_LIMIT})
+    except requests.RequestException as e:
+        st.error(f"❌ Connection error: {str(e)}")
+        return []
+
+def transaction_picker(label, key, empty_message):
+    """Searchable transaction selectbox; returns the chosen transaction as a dict, or None"""
+    query = st.text_input("🔎 Find by ID, category or description", key=f"{key}_query").strip()
+    matches = lookup_transactions(query)
+    if not matches:
+        st.info(f"No transactions match '{query}'." if query else empty_message)
+        return None
+    by_id = {row["id"]: row for row in matches}
+    transaction_id = st.selectbox(
+        label,
+        options=list(by_id),
+        key=key,
+        format_func=lambda x: f"ID: {x} - {by_id[x]['category']} - ₹{by_id[x]['amount']:.2f}"
+    )
+    return by_id.get(transaction_id)
+
+def _parse_search(res):
+    if res.status_code == 200 and res.json()["success"]:
+        body = res.json()
+        return pd.DataFrame(body["data"]), body["total"], body.get("next_offset")
+    st.error(f"❌ Search failed: {res.json().get('error', 'Unknown error')}")
+    return pd.DataFrame(), 0, None
+
+def search_transactions(query="", transaction_type=None, category=None, offset=0):
+    """One page of ranked full-text search hits, with the total number of hits
+
+    Returns:
+        tuple: (DataFrame of hits, total hits, offset of the next page or None)
+    """
+    params = {"q": query, "limit": SEARCH_PAGE_SIZE, "offset": offset}
+    if transaction_type:
+        params["transaction_type"] = transaction_type
+    if category:
+        params["category"] = category
+    try:
+        return conditional_get(f"{API_BASE}/transactions/search", _parse_search, params=params)
+    except requests.RequestException as e:
+        st.error(f"❌ Connection error: {str(e)}")
+        return pd.DataFrame(), 0, None
 
 @st.cache_data(ttl=300)
 def get_summary():
     """Fetch financial summary with caching"""
     try:
-        res = requests.get(f"{API_BASE}/transactions/summary", timeout=10)
-        if res.status_code == 200:
-            return res.json().get("data", {})
-        return {}
+        return conditional_get(f"{API_BASE}/transactions/summary",
+                               lambda res: res.json().get("data", {}) if res.status_code == 200 else {})
     except requests.RequestException:
         return {}
 
-def generate_ai_insights(user_query, summary_data):
-    """Generate AI insights using Gemini"""
+@st.cache_data(ttl=300)
+def get_timeseries(bucket="month", group_by="transaction_type"):
+    """Fetch per-bucket totals (columnar: periods plus one amount list per group) with caching"""
     try:
-        model = genai.GenerativeModel("gemini-2.0-flash-exp")
-        prompt = f"""
+        return conditional_get(f"{API_BASE}/analytics/timeseries",
+                               lambda res: res.json().get("data", {}) if res.status_code == 200 else {},
+                               params={"bucket": bucket, "group_by": group_by})
+    except requests.RequestException:
+        return {}
+
+AI_MODEL = "gemini-2.0-flash-exp"
+AI_PROMPT_TEMPLATE = """
         You are FinanceAI, an expert AI financial advisor with deep knowledge of Indian financial markets and practices. 
         You're integrated into a modern fintech application called FinanceAI-Advisor.
         
@@ -135,9 +315,26 @@ def generate_ai_insights(user_query, summary_data):
         
         Provide your financial analysis and recommendations:
         """
-        
-        response = model.generate_content(prompt)
-        return response.text
+
+@st.cache_resource
+def get_ai_model():
+    """Gemini model client, created once per process"""
+    return genai.GenerativeModel(AI_MODEL)
+
+@st.cache_resource
+def get_ai_cache():
+    """On-disk cache of AI answers keyed by question, summary and model (see frontend/ai_cache.py)"""
+    return AIResponseCache()
+
+def generate_ai_insights(user_query, summary_data):
+    """Generate AI insights using Gemini, reusing the cached answer for a repeated question"""
+    try:
+        prompt = AI_PROMPT_TEMPLATE.format(summary_data=summary_data, user_query=user_query)
+        answer, cached = get_ai_cache().get_or_generate(user_query, summary_data, get_ai_model(), prompt,
+                                                        AI_MODEL, AI_PROMPT_TEMPLATE)
+        if cached:
+            st.caption("⚡ Answer reused from an earlier identical question about the same data")
+        return answer
     except Exception as e:
         return f"❌ AI service temporarily unavailable: {str(e)}"
 
@@ -204,12 +401,14 @@ with st.sidebar:
 
 # --- Main Content Based on Navigation ---
 
+export_pending = False  # Set by the Data Export page while a PDF job is running
+
 if page == "🏠 AI Dashboard":
     # === AI DASHBOARD PAGE ===
     
     # Real-time data loading
     with st.spinner('🔄 Loading your financial data...'):
-        df = get_transactions()
+        df = get_transactions(max_rows=10)  # Only the recent list needs rows
         summary = get_summary()
     
     if df.empty:
@@ -279,10 +478,11 @@ if page == "🏠 AI Dashboard":
                 )
             
             with metric_col4:
+                total_transactions = summary.get('total_transactions', len(df))
                 st.metric(
                     "📈 Transactions", 
-                    f"{len(df)}",
-                    delta="+12" if len(df) > 20 else "+5",
+                    f"{total_transactions}",
+                    delta="+12" if total_transactions > 20 else "+5",
                     delta_color="normal"
                 )
         
@@ -316,10 +516,11 @@ if page == "🏠 AI Dashboard":
         
         with chart_col2:
             st.markdown("### 📊 Transaction Types")
-            if not df.empty:
-                type_summary = df.groupby('transaction_type')['amount'].agg(['sum', 'count']).reset_index()
-                type_summary.columns = ['Type', 'Total Amount', 'Count']
-                type_summary['Type'] = type_summary['Type'].str.title()
+            if summary.get("transaction_types"):
+                type_summary = pd.DataFrame([
+                    {"Type": t_type.title(), "Total Amount": data["total_amount"], "Count": data["transaction_count"]}
+                    for t_type, data in summary["transaction_types"].items()
+                ])
                 
                 fig_bar = px.bar(
                     type_summary,
@@ -399,154 +600,145 @@ elif page == "💰 Transaction Manager":
     
     with tab2:
         st.markdown("### ✏️ Update Transaction")
-        df = get_transactions()
-        if not df.empty:
-            transaction_id = st.selectbox(
-                "Select Transaction to Update",
-                options=df['id'].tolist(),
-                format_func=lambda x: f"ID: {x} - {df[df['id']==x]['category'].iloc[0]} - ₹{df[df['id']==x]['amount'].iloc[0]:.2f}"
-            )
-            
-            if transaction_id:
-                transaction = df[df['id'] == transaction_id].iloc[0]
-                
-                with st.form("update_form"):
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        new_amount = st.number_input("Amount", value=float(transaction['amount']), step=0.01)
-                        new_category = st.text_input("Category", value=transaction['category'])
-                        new_type = st.selectbox(
-                            "Type", 
-                            ["income", "expense", "investment", "transfer"],
-                            index=["income", "expense", "investment", "transfer"].index(transaction['transaction_type'])
-                        )
-                    
-                    with col2:
-                        new_description = st.text_area("Description", value=transaction['description'])
-                        new_tags = st.text_input("Tags", value=", ".join(transaction.get('tags', [])))
-                    
-                    if st.form_submit_button("🔄 Update Transaction", type="primary"):
-                        payload = {
-                            "amount": new_amount,
-                            "category": new_category,
-                            "description": new_description,
-                            "transaction_type": new_type,
-                            "tags": [t.strip() for t in new_tags.split(",")] if new_tags else []
-                        }
-                        
-                        try:
-                            res = requests.put(f"{API_BASE}/transactions/{transaction_id}", json=payload)
-                            if res.status_code == 200:
-                                st.success("✅ Transaction updated successfully!")
-                                st.cache_data.clear()
-                            else:
-                                st.error(f"❌ Update failed: {res.json().get('error')}")
-                        except requests.RequestException as e:
-                            st.error(f"❌ Connection error: {str(e)}")
-        else:
-            st.info("📝 No transactions available to update.")
-    
-    with tab3:
-        st.markdown("### 🗑️ Delete Transaction")
-        df = get_transactions()
-        if not df.empty:
-            transaction_id = st.selectbox(
-                "⚠️ Select Transaction to Delete",
-                options=df['id'].tolist(),
-                format_func=lambda x: f"ID: {x} - {df[df['id']==x]['category'].iloc[0]} - ₹{df[df['id']==x]['amount'].iloc[0]:.2f}"
-            )
-            
-            if transaction_id:
-                transaction = df[df['id'] == transaction_id].iloc[0]
+        transaction = transaction_picker("Select Transaction to Update", "update_picker",
+                                         "📝 No transactions available to update.")
+        if transaction:
+            transaction_id = transaction['id']
+
+            with st.form("update_form"):
+                col1, col2 = st.columns(2)
+                with col1:
+                    new_amount = st.number_input("Amount", value=float(transaction['amount']), step=0.01)
+                    new_category = st.text_input("Category", value=transaction['category'])
+                    new_type = st.selectbox(
+                        "Type", 
+                        ["income", "expense", "investment", "transfer"],
+                        index=["income", "expense", "investment", "transfer"].index(transaction['transaction_type'])
+                    )
                 
-                st.warning("⚠️ You are about to delete this transaction:")
-                st.dataframe({
-                    "Field": ["ID", "Amount", "Type", "Category", "Description", "Date"],
-                    "Value": [
-                        transaction['id'],
-                        f"₹{transaction['amount']:.2f}",
-                        transaction['transaction_type'],
-                        transaction['category'],
-                        transaction['description'],
-                        transaction['date']
-                    ]
-                })
+                with col2:
+                    new_description = st.text_area("Description", value=transaction['description'])
+                    new_tags = st.text_input("Tags", value=", ".join(transaction.get('tags', [])))
                 
-                if st.button("🗑️ Confirm Delete", type="secondary"):
+                if st.form_submit_button("🔄 Update Transaction", type="primary"):
+                    payload = {
+                        "amount": new_amount,
+                        "category": new_category,
+                        "description": new_description,
+                        "transaction_type": new_type,
+                        "tags": [t.strip() for t in new_tags.split(",")] if new_tags else []
+                    }
+                    
                     try:
-                        res = requests.delete(f"{API_BASE}/transactions/{transaction_id}")
+                        res = requests.put(f"{API_BASE}/transactions/{transaction_id}", json=payload)
                         if res.status_code == 200:
-                            st.success("✅ Transaction deleted successfully!")
+                            st.success("✅ Transaction updated successfully!")
                             st.cache_data.clear()
                         else:
-                            st.error(f"❌ Delete failed: {res.json().get('error')}")
+                            st.error(f"❌ Update failed: {res.json().get('error')}")
                     except requests.RequestException as e:
                         st.error(f"❌ Connection error: {str(e)}")
-        else:
-            st.info("📝 No transactions available to delete.")
     
-    with tab4:
-        st.markdown("### 🔍 Search & Filter Transactions")
-        df = get_transactions()
-        
-        if not df.empty:
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                search_term = st.text_input("🔍 Search", placeholder="Search description, category...")
-            with col2:
-                filter_type = st.multiselect("📊 Filter by Type", df['transaction_type'].unique())
-            with col3:
-                filter_category = st.multiselect("🏷️ Filter by Category", df['category'].unique())
-            
-            # Apply filters
-            filtered_df = df.copy()
-            
-            if search_term:
-                filtered_df = filtered_df[
-                    filtered_df['category'].str.contains(search_term, case=False, na=False) |
-                    filtered_df['description'].str.contains(search_term, case=False, na=False)
+    with tab3:
+        st.markdown("### 🗑️ Delete Transaction")
+        transaction = transaction_picker("⚠️ Select Transaction to Delete", "delete_picker",
+                                         "📝 No transactions available to delete.")
+        if transaction:
+            transaction_id = transaction['id']
+
+            st.warning("⚠️ You are about to delete this transaction:")
+            st.dataframe({
+                "Field": ["ID", "Amount", "Type", "Category", "Description", "Date"],
+                "Value": [
+                    transaction['id'],
+                    f"₹{transaction['amount']:.2f}",
+                    transaction['transaction_type'],
+                    transaction['category'],
+                    transaction['description'],
+                    transaction['date']
                 ]
+            })
             
-            if filter_type:
-                filtered_df = filtered_df[filtered_df['transaction_type'].isin(filter_type)]
-            
-            if filter_category:
-                filtered_df = filtered_df[filtered_df['category'].isin(filter_category)]
-            
-            st.markdown(f"### 📊 Results ({len(filtered_df)} transactions)")
-            
-            if not filtered_df.empty:
-                # Sort options
-                sort_col1, sort_col2 = st.columns(2)
-                with sort_col1:
-                    sort_by = st.selectbox("Sort by", ["date", "amount", "category", "transaction_type"])
-                with sort_col2:
-                    sort_order = st.selectbox("Order", ["Descending", "Ascending"])
-                
-                ascending = sort_order == "Ascending"
-                filtered_df = filtered_df.sort_values(by=sort_by, ascending=ascending)
-                
-                # Format for display
-                display_df = filtered_df.copy()
-                display_df['amount'] = display_df['amount'].apply(lambda x: f"₹{x:,.2f}")
-                
-                st.dataframe(
-                    display_df[['date', 'transaction_type', 'category', 'amount', 'description']],
-                    use_container_width=True,
-                    hide_index=True
-                )
-            else:
-                st.info("🔍 No transactions match your search criteria.")
+            if st.button("🗑️ Confirm Delete", type="secondary"):
+                try:
+                    res = requests.delete(f"{API_BASE}/transactions/{transaction_id}")
+                    if res.status_code == 200:
+                        st.success("✅ Transaction deleted successfully!")
+                        st.cache_data.clear()
+                    else:
+                        st.error(f"❌ Delete failed: {res.json().get('error')}")
+                except requests.RequestException as e:
+                    st.error(f"❌ Connection error: {str(e)}")
+    
+    with tab4:
+        st.markdown("### 🔍 Search & Filter Transactions")
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            search_term = st.text_input("🔍 Search", placeholder="Search description, category...")
+        with col2:
+            filter_type = st.selectbox("📊 Filter by Type", ["All"] + TRANSACTION_TYPES)
+        with col3:
+            categories = sorted(get_summary().get("categories", {}))
+            filter_category = st.selectbox("🏷️ Filter by Category", ["All"] + categories)
+
+        # Matching and ranking run on the backend's full-text index; only one page is fetched
+        criteria = (search_term, filter_type, filter_category)
+        if st.session_state.get("search_criteria") != criteria:
+            st.session_state["search_criteria"] = criteria
+            st.session_state["search_offset"] = 0
+        offset = st.session_state["search_offset"]
+        results_df, total, next_offset = search_transactions(
+            search_term.strip(),
+            transaction_type=None if filter_type == "All" else filter_type,
+            category=None if filter_category == "All" else filter_category,
+            offset=offset,
+        )
+
+        st.markdown(f"### 📊 Results ({total} transactions)")
+
+        if not results_df.empty:
+            # Sort options (within the page)
+            sort_col1, sort_col2 = st.columns(2)
+            with sort_col1:
+                sort_by = st.selectbox("Sort by", ["relevance", "date", "amount", "category", "transaction_type"])
+            with sort_col2:
+                sort_order = st.selectbox("Order", ["Descending", "Ascending"])
+
+            if sort_by != "relevance":
+                results_df = results_df.sort_values(by=sort_by, ascending=sort_order == "Ascending")
+
+            # Format for display
+            display_df = results_df.copy()
+            display_df['amount'] = display_df['amount'].apply(lambda x: f"₹{x:,.2f}")
+
+            st.dataframe(
+                display_df[['date', 'transaction_type', 'category', 'amount', 'description']],
+                use_container_width=True,
+                hide_index=True
+            )
+
+            prev_col, info_col, next_col = st.columns([1, 2, 1])
+            with prev_col:
+                if st.button("⬅️ Previous", disabled=offset == 0):
+                    st.session_state["search_offset"] = max(0, offset - SEARCH_PAGE_SIZE)
+                    st.rerun()
+            with info_col:
+                st.caption(f"Showing {offset + 1}–{offset + len(results_df)} of {total}")
+            with next_col:
+                if st.button("Next ➡️", disabled=next_offset is None):
+                    st.session_state["search_offset"] = next_offset
+                    st.rerun()
+        else:
+            st.info("🔍 No transactions match your search criteria.")
 
 elif page == "📈 Analytics & Insights":
     # === ANALYTICS PAGE ===
     st.markdown("## 📈 Advanced Analytics & Insights")
     
-    df = get_transactions()
     summary = get_summary()
     
-    if df.empty:
+    if not summary.get("total_transactions"):
         st.warning("📊 No data available for analysis. Please add some transactions first.")
     else:
         # AI-Powered Insights Section
@@ -580,17 +772,17 @@ elif page == "📈 Analytics & Insights":
         # Time-based analysis
         st.markdown("### 📅 Time-based Analysis")
         
-        df['date'] = pd.to_datetime(df['date'])
-        df['month_year'] = df['date'].dt.to_period('M').astype(str)
-        
-        monthly_data = df.groupby(['month_year', 'transaction_type'])['amount'].sum().unstack(fill_value=0)
+        bucket = st.radio("Group by", list(TIMESERIES_BUCKETS), horizontal=True,
+                          format_func=lambda b: TIMESERIES_BUCKETS[b][0])
+        # Bucketed and summed by the backend (from its daily rollups when possible)
+        timeseries = get_timeseries(bucket)
         
         fig_timeline = go.Figure()
         
-        for transaction_type in monthly_data.columns:
+        for transaction_type, values in timeseries.get("series", {}).items():
             fig_timeline.add_trace(go.Scatter(
-                x=monthly_data.index,
-                y=monthly_data[transaction_type],
+                x=timeseries["periods"],
+                y=values["amount"],
                 mode='lines+markers',
                 name=transaction_type.title(),
                 line=dict(width=3),
@@ -598,8 +790,8 @@ elif page == "📈 Analytics & Insights":
             ))
         
         fig_timeline.update_layout(
-            title="💹 Monthly Transaction Trends",
-            xaxis_title="Month",
+            title=f"💹 {TIMESERIES_BUCKETS[bucket][1]} Transaction Trends",
+            xaxis_title=TIMESERIES_BUCKETS[bucket][0],
             yaxis_title="Amount (₹)",
             height=500,
             hovermode='x unified'
@@ -648,7 +840,7 @@ elif page == "📤 Data Export":
     # === DATA EXPORT PAGE ===
     st.markdown("## 📤 Export Your Financial Data")
     
-    df = get_transactions()
+    df = get_transactions(max_rows=10)  # Preview only; exports are generated server-side
     
     if df.empty:
         st.warning("📝 No data available to export.")
@@ -683,26 +875,34 @@ elif page == "📤 Data Export":
             
             if st.button("📄 Generate PDF", type="primary", use_container_width=True):
                 try:
-                    res = requests.get(f"{API_BASE}/transactions/export?format=pdf", timeout=30)
-                    if res.ok:
-                        st.download_button(
-                            label="💾 Save PDF Report",
-                            data=res.content,
-                            file_name=f"financeai_report_{datetime.now().strftime('%Y%m%d')}.pdf",
-                            mime="application/pdf",
-                            use_container_width=True
-                        )
-                        st.success("✅ PDF report ready for download!")
+                    res = requests.post(f"{API_BASE}/exports", json={"format": "pdf"}, timeout=10)
+                    if res.status_code == 202:
+                        st.session_state["pdf_export_job"] = res.json()["data"]["id"]
+                        st.session_state["pdf_export_started"] = time.time()
+                        st.session_state.pop("pdf_export_bytes", None)
                     else:
-                        st.error("❌ Failed to generate PDF report")
+                        st.error("❌ Failed to start PDF report generation")
                 except requests.RequestException as e:
                     st.error(f"❌ Export error: {str(e)}")
+            
+            # One status check per script run; the page reruns itself while the job is pending
+            export_pending = poll_pdf_export()
+            
+            if st.session_state.get("pdf_export_bytes"):
+                st.download_button(
+                    label="💾 Save PDF Report",
+                    data=st.session_state["pdf_export_bytes"],
+                    file_name=f"financeai_report_{datetime.now().strftime('%Y%m%d')}.pdf",
+                    mime="application/pdf",
+                    use_container_width=True
+                )
+                st.success("✅ PDF report ready for download!")
         
         # Data preview
         st.markdown("### 👀 Data Preview")
         st.dataframe(df.head(10), use_container_width=True, hide_index=True)
         
-        st.markdown(f"**📊 Total Records:** {len(df)} transactions")
+        st.markdown(f"**📊 Total Records:** {get_summary().get('total_transactions', len(df))} transactions")
 
 # --- Footer ---
 st.markdown("---")
@@ -710,4 +910,9 @@ st.markdown("""
 <div style="text-align: center; color: #6C757D; padding: 1rem;">
     <p> <strong>MoneyMind AI</strong> | Powered by Google Gemini AI & Modern Python Stack</p>
 </div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+""", unsafe_allow_html=True)
+
+# Poll a pending PDF export again once the whole page has rendered
+if export_pending:
+    time.sleep(EXPORT_POLL_INTERVAL)
+    st.rerun()
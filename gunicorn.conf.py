@@ -0,0 +1,58 @@
+"""
+Gunicorn configuration for serving FinanceAI-Advisor in production
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Every setting is read from the environment so deployments can tune it
+without editing this file:
+
+    GUNICORN_BIND              Listen address (default FLASK_HOST:FLASK_PORT, 127.0.0.1:5000)
+    WEB_CONCURRENCY            Worker processes (default 2 x CPUs + 1)
+    GUNICORN_THREADS           Threads per worker (default 4; >1 uses the gthread worker)
+    GUNICORN_WORKER_CLASS      Worker class (default gthread, or sync with 1 thread)
+    GUNICORN_KEEPALIVE         Seconds to hold idle keep-alive connections (default 5)
+    GUNICORN_TIMEOUT           Seconds before a silent worker is killed and restarted (default 60)
+    GUNICORN_GRACEFUL_TIMEOUT  Seconds workers get to finish requests on reload/stop (default 30)
+    GUNICORN_PRELOAD           Import create_app() once in the master before forking (default True)
+    GUNICORN_MAX_REQUESTS      Recycle a worker after this many requests, 0 = never (default 0)
+    GUNICORN_MAX_REQUESTS_JITTER  Random spread added to max_requests (default 0)
+
+Graceful reload: `kill -HUP <master pid>` starts fresh workers and lets the
+old ones finish in-flight requests within GUNICORN_GRACEFUL_TIMEOUT. With
+preload enabled, code changes need a full restart (or USR2 binary upgrade),
+since HUP re-forks from the already imported application.
+"""
+
+import multiprocessing
+import os
+
+
+def _env_bool(name, default):
+    return os.getenv(name, str(default)).lower() == 'true'
+
+
+bind = os.getenv('GUNICORN_BIND', f"{os.getenv('FLASK_HOST', '127.0.0.1')}:{os.getenv('FLASK_PORT', 5000)}")
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread' if threads > 1 else 'sync')
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', 5))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 60))
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', 30))
+preload_app = _env_bool('GUNICORN_PRELOAD', True)
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', 0))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', 0))
+
+accesslog = os.getenv('GUNICORN_ACCESS_LOG')  # e.g. '-' for stdout; off by default
+errorlog = '-'
+
+
+def post_fork(server, worker):
+    """Drop database connections inherited from the preloaded master"""
+    if not preload_app:
+        return
+    from app.extensions import db
+    from wsgi import app
+
+    with app.app_context():
+        # close=False leaves the parent's sockets alone; the child opens its own
+        db.engine.dispose(close=False)
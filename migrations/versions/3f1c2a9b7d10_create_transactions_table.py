@@ -0,0 +1,36 @@
+"""create transactions table
+
+Revision ID: 3f1c2a9b7d10
+Revises: 
+Create Date: 2026-10-16 09:12:41.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2a9b7d10'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Baseline schema; databases created before migrations were tracked can
+    # `flask db stamp 3f1c2a9b7d10` instead of running this revision.
+    op.create_table('transactions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('amount', sa.Float(), nullable=False),
+    sa.Column('category', sa.String(length=64), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('transaction_type', sa.String(length=32), nullable=False),
+    sa.Column('date', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('tags', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('transactions')
@@ -0,0 +1,49 @@
+"""add daily transaction rollups
+
+Revision ID: 5b9e7c1d2f64
+Revises: c27e5f0a9d43
+Create Date: 2026-10-16 13:22:10.471558
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b9e7c1d2f64'
+down_revision = 'c27e5f0a9d43'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('transaction_rollups',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('category', sa.String(length=64), nullable=False),
+    sa.Column('transaction_type', sa.String(length=32), nullable=False),
+    sa.Column('category_key', sa.String(length=64), nullable=False),
+    sa.Column('total_amount', sa.Float(), nullable=False),
+    sa.Column('total_abs_amount', sa.Float(), nullable=False),
+    sa.Column('transaction_count', sa.Integer(), nullable=False),
+    sa.Column('first_date', sa.DateTime(), nullable=False),
+    sa.Column('last_date', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'category', 'transaction_type')
+    )
+    with op.batch_alter_table('transaction_rollups', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_transaction_rollups_category_key'), ['category_key'], unique=False)
+
+    # Backfill from the existing ledger (same as `flask rebuild-rollups`)
+    op.execute(
+        "INSERT INTO transaction_rollups (day, category, transaction_type, category_key, "
+        "total_amount, total_abs_amount, transaction_count, first_date, last_date) "
+        "SELECT date(date), category, transaction_type, min(category_key), "
+        "sum(amount), sum(abs(amount)), count(*), min(date), max(date) "
+        "FROM transactions GROUP BY date(date), category, transaction_type"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('transaction_rollups', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_transaction_rollups_category_key'))
+
+    op.drop_table('transaction_rollups')
@@ -0,0 +1,66 @@
+"""add case-folded category and transaction filter indexes
+
+Revision ID: 8a41d0c6e2b5
+Revises: 3f1c2a9b7d10
+Create Date: 2026-10-16 09:40:03.562917
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8a41d0c6e2b5'
+down_revision = '3f1c2a9b7d10'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 5000
+
+
+def upgrade():
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('category_key', sa.String(length=64), nullable=True))
+
+    # Backfill in batches; casefold() runs in Python because SQL lower() is
+    # ASCII-only on SQLite and must agree with the model's validator.
+    conn = op.get_bind()
+    transactions = sa.table(
+        'transactions',
+        sa.column('id', sa.Integer),
+        sa.column('category', sa.String),
+        sa.column('category_key', sa.String),
+        sa.column('transaction_type', sa.String),
+    )
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(transactions.c.id, transactions.c.category, transactions.c.transaction_type)
+            .where(transactions.c.id > last_id)
+            .order_by(transactions.c.id)
+            .limit(BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+        conn.execute(
+            transactions.update()
+            .where(transactions.c.id == sa.bindparam('b_id'))
+            .values(category_key=sa.bindparam('b_key'), transaction_type=sa.bindparam('b_type')),
+            [
+                {'b_id': row.id, 'b_key': row.category.casefold(), 'b_type': row.transaction_type.lower()}
+                for row in rows
+            ]
+        )
+        last_id = rows[-1].id
+
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.alter_column('category_key', existing_type=sa.String(length=64), nullable=False)
+        batch_op.create_index('ix_transactions_type_date', ['transaction_type', 'date'], unique=False)
+        batch_op.create_index('ix_transactions_category_key_date', ['category_key', 'date'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.drop_index('ix_transactions_category_key_date')
+        batch_op.drop_index('ix_transactions_type_date')
+        batch_op.drop_column('category_key')
@@ -0,0 +1,42 @@
+"""add change versions and tombstones for the transaction change feed
+
+Revision ID: a9d2e6f4c317
+Revises: f5c8d3a1b096
+Create Date: 2026-10-16 20:12:48.306154
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a9d2e6f4c317'
+down_revision = 'f5c8d3a1b096'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing rows keep version 0 and are delivered by a full sync
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('change_version', sa.BigInteger(), nullable=False, server_default='0'))
+        batch_op.create_index('ix_transactions_change_version_id', ['change_version', 'id'], unique=False)
+
+    op.create_table('transaction_tombstones',
+    sa.Column('transaction_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('change_version', sa.BigInteger(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('transaction_id')
+    )
+    with op.batch_alter_table('transaction_tombstones', schema=None) as batch_op:
+        batch_op.create_index('ix_transaction_tombstones_change_version', ['change_version'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('transaction_tombstones', schema=None) as batch_op:
+        batch_op.drop_index('ix_transaction_tombstones_change_version')
+    op.drop_table('transaction_tombstones')
+
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.drop_index('ix_transactions_change_version_id')
+        batch_op.drop_column('change_version')
@@ -0,0 +1,26 @@
+"""add lower(description) index for the transaction lookup
+
+Revision ID: b7c1f3e9a420
+Revises: a9d2e6f4c317
+Create Date: 2026-10-16 23:48:05.117392
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7c1f3e9a420'
+down_revision = 'a9d2e6f4c317'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.create_index('ix_transactions_description_lower', [sa.text('lower(description)')], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.drop_index('ix_transactions_description_lower')
@@ -0,0 +1,26 @@
+"""add (date, id) index for keyset pagination
+
+Revision ID: c27e5f0a9d43
+Revises: 8a41d0c6e2b5
+Create Date: 2026-10-16 11:05:27.904716
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c27e5f0a9d43'
+down_revision = '8a41d0c6e2b5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.create_index('ix_transactions_date_id', ['date', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.drop_index('ix_transactions_date_id')
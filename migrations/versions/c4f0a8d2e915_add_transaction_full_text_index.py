@@ -0,0 +1,49 @@
+"""add full-text index over transaction category and description
+
+Revision ID: c4f0a8d2e915
+Revises: b7c1f3e9a420
+Create Date: 2026-10-17 09:21:36.540218
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4f0a8d2e915'
+down_revision = 'b7c1f3e9a420'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        op.execute("CREATE VIRTUAL TABLE transactions_fts USING fts5(category, description, content='transactions', "
+                   "content_rowid='id', tokenize='unicode61 remove_diacritics 2')")
+        op.execute("CREATE TRIGGER transactions_fts_insert AFTER INSERT ON transactions BEGIN "
+                   "INSERT INTO transactions_fts(rowid, category, description) "
+                   "VALUES (new.id, new.category, new.description); END")
+        op.execute("CREATE TRIGGER transactions_fts_delete AFTER DELETE ON transactions BEGIN "
+                   "INSERT INTO transactions_fts(transactions_fts, rowid, category, description) "
+                   "VALUES ('delete', old.id, old.category, old.description); END")
+        op.execute("CREATE TRIGGER transactions_fts_update AFTER UPDATE OF category, description ON transactions BEGIN "
+                   "INSERT INTO transactions_fts(transactions_fts, rowid, category, description) "
+                   "VALUES ('delete', old.id, old.category, old.description); "
+                   "INSERT INTO transactions_fts(rowid, category, description) "
+                   "VALUES (new.id, new.category, new.description); END")
+        # Index the rows that already exist
+        op.execute("INSERT INTO transactions_fts(transactions_fts) VALUES ('rebuild')")
+    elif dialect == 'postgresql':
+        op.execute("CREATE INDEX ix_transactions_fts ON transactions USING gin "
+                   "(to_tsvector('simple', coalesce(category, '') || ' ' || coalesce(description, '')))")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        for trigger in ('insert', 'delete', 'update'):
+            op.execute(f"DROP TRIGGER IF EXISTS transactions_fts_{trigger}")
+        op.execute("DROP TABLE IF EXISTS transactions_fts")
+    elif dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_transactions_fts")
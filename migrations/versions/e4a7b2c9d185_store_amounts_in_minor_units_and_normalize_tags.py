@@ -0,0 +1,153 @@
+"""store amounts in minor units and move tags to transaction_tags
+
+Revision ID: e4a7b2c9d185
+Revises: 5b9e7c1d2f64
+Create Date: 2026-10-16 15:41:08.236514
+
+"""
+from decimal import Decimal, ROUND_HALF_UP
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4a7b2c9d185'
+down_revision = '5b9e7c1d2f64'
+branch_labels = None
+depends_on = None
+
+# Rows converted per round trip while backfilling
+BATCH_SIZE = 1000
+
+transactions = sa.table(
+    'transactions',
+    sa.column('id', sa.Integer),
+    sa.column('amount', sa.Float),
+    sa.column('amount_minor', sa.BigInteger),
+    sa.column('tags', sa.Text),
+)
+transaction_tags = sa.table(
+    'transaction_tags',
+    sa.column('transaction_id', sa.Integer),
+    sa.column('position', sa.Integer),
+    sa.column('tag', sa.String),
+)
+
+
+def _to_minor(amount):
+    # Same rounding as app.utils.money.to_minor (kept local: migrations must not drift with app code)
+    return int((Decimal(str(amount)) * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def _batches(conn, *columns):
+    """Yield transactions rows in id order, BATCH_SIZE at a time"""
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(transactions.c.id, *columns)
+            .where(transactions.c.id > last_id)
+            .order_by(transactions.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][0]
+
+
+def _rebuild_rollups(amount_expression, columns):
+    op.execute("DELETE FROM transaction_rollups")
+    op.execute(
+        "INSERT INTO transaction_rollups (day, category, transaction_type, category_key, "
+        f"{columns}, transaction_count, first_date, last_date) "
+        "SELECT date(date), category, transaction_type, min(category_key), "
+        f"sum({amount_expression}), sum(abs({amount_expression})), count(*), min(date), max(date) "
+        "FROM transactions GROUP BY date(date), category, transaction_type"
+    )
+
+
+def upgrade():
+    op.create_table('transaction_tags',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('transaction_id', sa.Integer(), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('tag', sa.String(length=64), nullable=False),
+    sa.ForeignKeyConstraint(['transaction_id'], ['transactions.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('transaction_tags', schema=None) as batch_op:
+        batch_op.create_index('ix_transaction_tags_tag_transaction', ['tag', 'transaction_id'], unique=False)
+        batch_op.create_index('ix_transaction_tags_transaction_position', ['transaction_id', 'position'], unique=False)
+
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('amount_minor', sa.BigInteger(), nullable=True))
+
+    # Backfill amounts and tags in id-ordered batches
+    conn = op.get_bind()
+    for rows in _batches(conn, transactions.c.amount, transactions.c.tags):
+        conn.execute(
+            transactions.update()
+            .where(transactions.c.id == sa.bindparam('b_id'))
+            .values(amount_minor=sa.bindparam('b_amount_minor')),
+            [{'b_id': row.id, 'b_amount_minor': _to_minor(row.amount)} for row in rows],
+        )
+        tag_rows = [
+            {'transaction_id': row.id, 'position': position, 'tag': tag}
+            for row in rows if row.tags
+            for position, tag in enumerate(row.tags.split(','))
+        ]
+        if tag_rows:
+            conn.execute(transaction_tags.insert(), tag_rows)
+
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.alter_column('amount_minor', existing_type=sa.BigInteger(), nullable=False)
+        batch_op.drop_column('tags')
+        batch_op.drop_column('amount')
+
+    with op.batch_alter_table('transaction_rollups', schema=None) as batch_op:
+        batch_op.drop_column('total_abs_amount')
+        batch_op.drop_column('total_amount')
+        batch_op.add_column(sa.Column('total_amount_minor', sa.BigInteger(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('total_abs_amount_minor', sa.BigInteger(), nullable=False, server_default='0'))
+    _rebuild_rollups('amount_minor', 'total_amount_minor, total_abs_amount_minor')
+
+
+def downgrade():
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('amount', sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column('tags', sa.Text(), nullable=True))
+
+    conn = op.get_bind()
+    for rows in _batches(conn, transactions.c.amount_minor):
+        ids = [row.id for row in rows]
+        tags = {}
+        for transaction_id, tag in conn.execute(
+            sa.select(transaction_tags.c.transaction_id, transaction_tags.c.tag)
+            .where(transaction_tags.c.transaction_id.in_(ids))
+            .order_by(transaction_tags.c.transaction_id, transaction_tags.c.position)
+        ):
+            tags.setdefault(transaction_id, []).append(tag)
+        conn.execute(
+            transactions.update()
+            .where(transactions.c.id == sa.bindparam('b_id'))
+            .values(amount=sa.bindparam('b_amount'), tags=sa.bindparam('b_tags')),
+            [{'b_id': row.id, 'b_amount': row.amount_minor / 100,
+              'b_tags': ','.join(tags[row.id]) if row.id in tags else None} for row in rows],
+        )
+
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.alter_column('amount', existing_type=sa.Float(), nullable=False)
+        batch_op.drop_column('amount_minor')
+
+    with op.batch_alter_table('transaction_rollups', schema=None) as batch_op:
+        batch_op.drop_column('total_abs_amount_minor')
+        batch_op.drop_column('total_amount_minor')
+        batch_op.add_column(sa.Column('total_amount', sa.Float(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('total_abs_amount', sa.Float(), nullable=False, server_default='0'))
+    _rebuild_rollups('amount', 'total_amount, total_abs_amount')
+
+    with op.batch_alter_table('transaction_tags', schema=None) as batch_op:
+        batch_op.drop_index('ix_transaction_tags_transaction_position')
+        batch_op.drop_index('ix_transaction_tags_tag_transaction')
+
+    op.drop_table('transaction_tags')
@@ -0,0 +1,35 @@
+"""add ledger version counter
+
+Revision ID: f5c8d3a1b096
+Revises: e4a7b2c9d185
+Create Date: 2026-10-16 18:04:27.530912
+
+"""
+import uuid
+from datetime import datetime
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f5c8d3a1b096'
+down_revision = 'e4a7b2c9d185'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    ledger_state = op.create_table('ledger_state',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('epoch', sa.String(length=32), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.bulk_insert(ledger_state, [
+        {'id': 1, 'epoch': uuid.uuid4().hex, 'version': 1, 'updated_at': datetime.utcnow()},
+    ])
+
+
+def downgrade():
+    op.drop_table('ledger_state')
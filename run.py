@@ -3,6 +3,7 @@ FinanceAI-Advisor Application Entry Point
 
 This is the main entry point for running the FinanceAI-Advisor Flask application.
 It creates the Flask app instance and runs the development server.
+For production, serve wsgi:app with gunicorn (see gunicorn.conf.py).
 """
 
 from app import create_app
@@ -6,20 +6,46 @@ This module contains unit tests for the Flask API endpoints.
 
 import pytest
 import json
+import time
+import io
+from functools import partial
 from app import create_app
-from datetime import datetime
+from app.extensions import db, limiter
+from datetime import datetime, timedelta
+from werkzeug.http import http_date, parse_date
 
 
 @pytest.fixture
-def client():
-    """Create test client"""
+def client(monkeypatch):
+    """Create test client backed by a fresh in-memory database"""
+    monkeypatch.setenv('DATABASE_URL', 'sqlite://')
     app = create_app()
     app.config['TESTING'] = True
-    
+
+    with app.app_context():
+        db.create_all()
+        limiter.reset()
+
     with app.test_client() as client:
         yield client
 
 
+def create(client, **overrides):
+    """Helper to create a transaction through the API"""
+    payload = {
+        'amount': 100.0,
+        'category': 'food',
+        'description': 'Test transaction',
+        'transaction_type': 'expense',
+    }
+    payload.update(overrides)
+    response = client.post('/api/v1/transactions',
+                           data=json.dumps(payload),
+                           content_type='application/json')
+    assert response.status_code == 201
+    return json.loads(response.data)['data']
+
+
 def test_health_check(client):
     """Test health check endpoint"""
     response = client.get('/health')
@@ -78,3 +104,853 @@ def test_create_invalid_transaction(client):
     data = json.loads(response.data)
     assert data['success'] is False
     assert 'errors' in data
+
+
+def test_get_transactions_filters(client):
+    """Test category/type/date filters are applied and results are newest first"""
+    create(client, category='Food', date='2024-01-05T10:00:00')
+    create(client, category='food', date='2024-02-05T10:00:00')
+    create(client, category='rent', date='2024-02-01T10:00:00')
+    create(client, category='salary', transaction_type='Income', date='2024-02-10T10:00:00')
+
+    response = client.get('/api/v1/transactions?category=FOOD')
+    data = json.loads(response.data)['data']
+    assert [t['date'] for t in data] == ['2024-02-05T10:00:00', '2024-01-05T10:00:00']
+
+    response = client.get('/api/v1/transactions?transaction_type=income')
+    data = json.loads(response.data)['data']
+    assert [t['category'] for t in data] == ['salary']
+
+    response = client.get('/api/v1/transactions?start_date=2024-02-01&end_date=2024-02-06')
+    data = json.loads(response.data)['data']
+    assert [t['category'] for t in data] == ['food', 'rent']
+
+
+def test_get_transactions_tag_filter(client):
+    """Test tags round-trip in order and the ?tag= filter uses the tag table"""
+    first = create(client, tags=['monthly', 'essential'])
+    create(client, tags=['essential'])
+    create(client)
+
+    assert first['tags'] == ['monthly', 'essential']
+    data = json.loads(client.get('/api/v1/transactions?tag=essential').data)['data']
+    assert len(data) == 2
+    data = json.loads(client.get('/api/v1/transactions?tag=monthly').data)['data']
+    assert [t['id'] for t in data] == [first['id']]
+
+    response = client.put(f"/api/v1/transactions/{first['id']}", json={
+        'amount': 100.0, 'category': 'food', 'description': 'Test transaction',
+        'transaction_type': 'expense', 'tags': ['yearly'],
+    })
+    assert json.loads(response.data)['data']['tags'] == ['yearly']
+    assert json.loads(client.get('/api/v1/transactions?tag=monthly').data)['count'] == 0
+    summary = json.loads(client.get('/api/v1/transactions/summary?tag=yearly').data)['data']
+    assert summary['total_transactions'] == 1
+
+
+def test_amounts_are_exact_in_minor_units(client):
+    """Test amounts are stored as paise so sums do not drift"""
+    for _ in range(3):
+        create(client, amount=0.1, transaction_type='income')
+    created = create(client, amount=19.999)
+
+    assert 0.1 + 0.1 + 0.1 != 0.3
+    assert created['amount'] == 20.0
+    summary = json.loads(client.get('/api/v1/transactions/summary').data)['data']
+    assert summary['total_income'] == 0.3
+    assert summary['net_balance'] == -19.7
+
+
+def test_get_transactions_invalid_date(client):
+    """Test malformed date filters are rejected"""
+    response = client.get('/api/v1/transactions?start_date=yesterday')
+    assert response.status_code == 400
+
+
+def test_get_transactions_cursor_pagination(client):
+    """Test walking the listing with limit/cursor visits every row once, newest first"""
+    for day in range(1, 6):
+        create(client, date=f'2024-03-0{day}T09:00:00')
+    create(client, date='2024-03-03T09:00:00')  # tie on date, ordered by id
+
+    seen, cursor = [], None
+    while True:
+        url = '/api/v1/transactions?limit=2' + (f'&cursor={cursor}' if cursor else '')
+        body = json.loads(client.get(url).data)
+        assert body['count'] == len(body['data']) <= 2
+        seen.extend((t['date'], t['id']) for t in body['data'])
+        cursor = body['next_cursor']
+        if cursor is None:
+            break
+
+    assert len(seen) == 6
+    assert seen == sorted(seen, reverse=True)
+
+
+def test_get_transactions_invalid_cursor(client):
+    """Test malformed cursors are rejected"""
+    response = client.get('/api/v1/transactions?cursor=not-a-cursor')
+    assert response.status_code == 400
+
+
+def test_export_csv_streams_rows_and_totals(client):
+    """Test the streamed CSV export contains filtered rows and the totals footer"""
+    create(client, amount=5000.0, category='salary', transaction_type='income', tags=['work'])
+    create(client, amount=1200.5, category='rent')
+    create(client, amount=300.0, category='food')
+
+    response = client.get('/api/v1/transactions/export?format=csv')
+    assert response.status_code == 200
+    assert response.is_streamed
+    lines = response.get_data(as_text=True).splitlines()
+
+    assert lines[0] == 'ID,Amount,Category,Description,Transaction Type,Date,Tags'
+    assert len(lines) == 1 + 3 + 1 + 3
+    assert lines[-3].endswith('Total Income,5000.0')
+    assert lines[-2].endswith('Total Expenses,1500.5')
+    assert lines[-1].endswith('Net Balance,3499.5')
+
+    response = client.get('/api/v1/transactions/export?format=csv&category=rent')
+    lines = response.get_data(as_text=True).splitlines()
+    assert len(lines) == 1 + 1 + 1 + 3
+
+
+@pytest.fixture
+def file_client(monkeypatch, tmp_path):
+    """Create test client backed by a SQLite file, so pool workers can read it"""
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'test.db'}")
+    app = create_app()
+    app.config['TESTING'] = True
+    app.config['EXPORT_DIR'] = str(tmp_path / 'exports')
+
+    with app.app_context():
+        db.create_all()
+        limiter.reset()
+
+    with app.test_client() as client:
+        yield client
+
+
+def test_export_job_renders_pdf_in_background(file_client):
+    """Test queuing a PDF export, polling its status and downloading the report"""
+    create(file_client, amount=5000.0, category='salary', transaction_type='income')
+    create(file_client, amount=250.0, category='food')
+
+    response = file_client.post('/api/v1/exports', json={'format': 'pdf', 'category': 'food'})
+    assert response.status_code == 202
+    job = json.loads(response.data)['data']
+    assert job['status'] == 'queued'
+    status_url = job['status_url']
+
+    deadline = time.time() + 60
+    while job['status'] in ('queued', 'running') and time.time() < deadline:
+        time.sleep(0.2)
+        job = json.loads(file_client.get(status_url).data)['data']
+
+    assert job['status'] == 'completed'
+    assert job['total_transactions'] == 1
+
+    response = file_client.get(f"{status_url}?download=1")
+    assert response.status_code == 200
+    assert response.mimetype == 'application/pdf'
+    assert response.data.startswith(b'%PDF')
+
+
+def test_export_job_marked_failed_when_worker_dies(file_client):
+    """Test a job whose worker raised outside the renderer is reported as failed"""
+    from concurrent.futures import Future
+    from app.services.export_jobs import _on_job_done, _write_json_atomic, export_jobs
+
+    job_id = 'b' * 32
+    with file_client.application.app_context():
+        meta_path = export_jobs._meta_path(job_id)
+    _write_json_atomic(meta_path, {'id': job_id, 'format': 'pdf', 'status': 'running'})
+
+    future = Future()
+    future.add_done_callback(partial(_on_job_done, meta_path))
+    future.set_exception(RuntimeError('worker process terminated abruptly'))
+
+    job = json.loads(file_client.get(f'/api/v1/exports/{job_id}').data)['data']
+    assert job['status'] == 'failed'
+    assert job['error'] == 'worker process terminated abruptly'
+
+
+def test_export_job_unknown_id(file_client):
+    """Test unknown or malformed job ids return 404"""
+    assert file_client.get('/api/v1/exports/' + 'a' * 32).status_code == 404
+    assert file_client.get('/api/v1/exports/..%2Fsecret').status_code == 404
+
+
+def test_transactions_summary(client):
+    """Test the aggregated summary totals, breakdowns and filters"""
+    create(client, amount=5000.0, category='salary', transaction_type='income', date='2024-01-01T09:00:00')
+    create(client, amount=-1200.0, category='rent', date='2024-01-02T09:00:00')
+    create(client, amount=300.0, category='food', date='2024-02-01T09:00:00')
+    create(client, amount=200.0, category='food', date='2024-03-01T09:00:00')
+
+    summary = json.loads(client.get('/api/v1/transactions/summary').data)['data']
+    assert summary['total_transactions'] == 4
+    assert summary['total_income'] == 5000.0
+    assert summary['total_expenses'] == 1700.0
+    assert summary['net_balance'] == 3300.0
+    assert summary['categories']['food'] == {'total_amount': 500.0, 'transaction_count': 2}
+    assert summary['categories']['rent'] == {'total_amount': -1200.0, 'transaction_count': 1}
+    assert summary['transaction_types']['expense'] == {'total_amount': 1700.0, 'transaction_count': 3}
+    assert summary['earliest_transaction_date'] == '2024-01-01T09:00:00'
+    assert summary['latest_transaction_date'] == '2024-03-01T09:00:00'
+
+    summary = json.loads(client.get('/api/v1/transactions/summary?category=food&end_date=2024-02-15').data)['data']
+    assert summary['total_transactions'] == 1
+    assert summary['total_expenses'] == 300.0
+
+
+def test_transactions_summary_empty(client):
+    """Test the summary of an empty ledger"""
+    body = json.loads(client.get('/api/v1/transactions/summary').data)
+    assert body['message'] == 'No transactions found'
+    assert body['data']['total_transactions'] == 0
+
+
+def test_rollups_follow_mutations(client):
+    """Test create/update/delete keep the rollups consistent with the ledger"""
+    from app.services import rollups
+
+    salary = create(client, amount=5000.0, category='salary', transaction_type='income', date='2024-01-01T09:00:00')
+    rent = create(client, amount=1200.0, category='rent', date='2024-01-01T10:00:00')
+    create(client, amount=300.0, category='food', date='2024-01-01T11:00:00')
+    create(client, amount=200.0, category='food', date='2024-01-01T12:00:00')
+
+    client.put(f"/api/v1/transactions/{rent['id']}", json={
+        'amount': 1500.0, 'category': 'food', 'description': 'Moved', 'transaction_type': 'expense',
+        'date': '2024-01-02T08:00:00',
+    })
+    client.delete(f"/api/v1/transactions/{salary['id']}")
+
+    with client.application.app_context():
+        assert rollups.check() == []
+
+    summary = json.loads(client.get('/api/v1/transactions/summary').data)['data']
+    assert summary['total_transactions'] == 3
+    assert summary['categories'] == {'food': {'total_amount': 2000.0, 'transaction_count': 3}}
+    assert summary['earliest_transaction_date'] == '2024-01-01T11:00:00'
+    assert summary['latest_transaction_date'] == '2024-01-02T08:00:00'
+
+
+@pytest.mark.parametrize('upsert', [True, False])
+def test_rollups_merge_into_existing_bucket(client, monkeypatch, upsert):
+    """Test adding to an existing bucket sums the totals and widens its first/last dates, with and without upserts"""
+    from app.models.rollup import TransactionRollup
+    from app.services import rollups
+
+    if not upsert:
+        monkeypatch.setattr(rollups, '_UPSERTS', {})
+    for time_of_day in ('12:00', '09:00', '18:00'):
+        create(client, amount=10.0, date=f'2024-01-01T{time_of_day}:00')
+
+    with client.application.app_context():
+        bucket = db.session.execute(db.select(TransactionRollup)).scalar_one()
+        assert (bucket.transaction_count, bucket.total_amount_minor) == (3, 3000)
+        assert (bucket.first_date, bucket.last_date) == (datetime(2024, 1, 1, 9), datetime(2024, 1, 1, 18))
+        assert rollups.check() == []
+
+
+def test_rollup_cli_commands(client):
+    """Test check-rollups detects drift and rebuild-rollups repairs it"""
+    from app.models.rollup import TransactionRollup
+
+    create(client, amount=300.0, category='food')
+    app = client.application
+    with app.app_context():
+        TransactionRollup.query.delete()
+        db.session.commit()
+
+    runner = app.test_cli_runner()
+    assert runner.invoke(args=['check-rollups']).exit_code != 0
+    assert 'Rebuilt 1 rollup rows' in runner.invoke(args=['rebuild-rollups']).output
+    assert runner.invoke(args=['check-rollups']).exit_code == 0
+
+
+def test_bulk_create_transactions(client):
+    """Test bulk insert of a JSON array updates the listing and the rollups"""
+    rows = [
+        {'amount': 100.0 + i, 'category': 'Food', 'description': f'Row {i}',
+         'transaction_type': 'expense', 'date': '2024-01-01T09:00:00', 'tags': ['bulk']}
+        for i in range(25)
+    ]
+    response = client.post('/api/v1/transactions/bulk?chunk_size=10', json=rows)
+    assert response.status_code == 201
+    stats = json.loads(response.data)['data']
+    assert stats['inserted'] == 25 and stats['failed'] == 0
+
+    body = json.loads(client.get('/api/v1/transactions?category=food').data)
+    assert body['count'] == 25
+    assert body['data'][0]['tags'] == ['bulk']
+
+    summary = json.loads(client.get('/api/v1/transactions/summary').data)['data']
+    assert summary['total_expenses'] == sum(100.0 + i for i in range(25))
+
+
+def test_bulk_create_ndjson_reports_row_errors(client):
+    """Test NDJSON input, per-row errors, and partial inserts"""
+    good = json.dumps({'amount': 10, 'category': 'food', 'description': 'ok', 'transaction_type': 'expense'})
+    bad = json.dumps({'amount': 0, 'category': 'food', 'description': 'zero', 'transaction_type': 'expense'})
+    body = '\n'.join([good, bad, '{not json', good]) + '\n'
+
+    response = client.post('/api/v1/transactions/bulk', data=body, content_type='application/x-ndjson')
+    assert response.status_code == 400
+    details = json.loads(response.data)['details']
+    assert [d['row'] for d in details] == [1, 2]
+    assert json.loads(client.get('/api/v1/transactions').data)['count'] == 0
+
+    response = client.post('/api/v1/transactions/bulk?partial=true', data=body, content_type='application/x-ndjson')
+    assert response.status_code == 201
+    stats = json.loads(response.data)['data']
+    assert (stats['inserted'], stats['failed']) == (2, 2)
+
+
+def test_import_csv_statement(client):
+    """Test importing a CSV statement with debit/credit columns and a bad row"""
+    statement = (
+        'Txn Date,Narration,Withdrawal Amt.,Deposit Amt.\n'
+        '01/04/2024,SALARY APRIL,,"85,000.00"\n'
+        '02/04/2024,GROCERY MART,"1,250.50",\n'
+        'not a date,BROKEN ROW,10.00,\n'
+    )
+    response = client.post('/api/v1/imports',
+                           data={'file': (io.BytesIO(statement.encode()), 'statement.csv')},
+                           content_type='multipart/form-data')
+    assert response.status_code == 201
+    stats = json.loads(response.data)['data']
+    assert (stats['rows_read'], stats['rows_inserted'], stats['rows_failed']) == (3, 2, 1)
+    assert stats['errors'][0]['row'] == 4
+
+    summary = json.loads(client.get('/api/v1/transactions/summary').data)['data']
+    assert summary['total_income'] == 85000.0
+    assert summary['total_expenses'] == 1250.5
+    assert summary['earliest_transaction_date'] == '2024-04-01T00:00:00'
+
+
+def test_import_ofx_statement(client):
+    """Test importing an SGML OFX statement sent as the raw request body"""
+    statement = (
+        'OFXHEADER:100\nDATA:OFXSGML\n\n<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>\n'
+        '<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20240105120000<TRNAMT>-42.10<NAME>Coffee &amp; Co</STMTTRN>\n'
+        '<STMTTRN>\n<TRNTYPE>CREDIT\n<DTPOSTED>20240106\n<TRNAMT>500.00\n<NAME>Refund\n<MEMO>Order 7\n</STMTTRN>\n'
+        '</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>\n'
+    )
+    response = client.post('/api/v1/imports?format=ofx', data=statement.encode(),
+                           content_type='application/x-ofx')
+    assert response.status_code == 201
+    assert json.loads(response.data)['data']['rows_inserted'] == 2
+
+    data = json.loads(client.get('/api/v1/transactions').data)['data']
+    assert [(t['description'], t['transaction_type'], t['amount']) for t in data] == [
+        ('Refund Order 7', 'income', 500.0),
+        ('Coffee & Co', 'expense', 42.1),
+    ]
+
+
+def test_import_statement_cli(client, tmp_path):
+    """Test the import-statement CLI command"""
+    path = tmp_path / 'statement.csv'
+    path.write_text('date,description,amount,category\n2024-01-01,Rent,-15000,rent\n')
+
+    result = client.application.test_cli_runner().invoke(args=['import-statement', str(path)])
+    assert result.exit_code == 0, result.output
+    assert '1 inserted' in result.output.replace(',', '')
+
+
+def test_validate_transactions_batch_matches_single_row():
+    """Test batch validation reports the same per-row errors as the single-row validator"""
+    from app.utils.validators import transaction_errors, validate_transactions_batch
+
+    good = {'amount': 10, 'category': 'food', 'description': 'ok', 'transaction_type': 'expense',
+            'date': '2024-01-01T09:00:00', 'tags': ['a']}
+    rows = [dict(good) for _ in range(600)]
+    rows[3]['amount'] = 0
+    rows[300]['transaction_type'] = 'EXPENSE'
+    rows[301].update(category='  ', date='01/02/2024')
+    rows[599]['tags'] = ['a', 1]
+    del rows[450]['description']
+    rows.append('not an object')
+
+    errors = validate_transactions_batch(rows)
+    assert errors[:-1] == [tuple(transaction_errors(row)) for row in rows[:-1]]
+    assert errors[-1] == ('Row must be a JSON object',)
+    assert [i for i, e in enumerate(errors) if e] == [3, 301, 450, 599, 600]
+
+    # Values the column checks flag or pass differently from the row rules
+    edge_cases = [
+        {'amount': '12.5'}, {'amount': ' 0 '}, {'amount': False}, {'amount': True}, {'amount': 10 ** 400},
+        {'amount': float('nan')}, {'amount': None}, {'amount': []},
+        {'category': 5}, {'category': '\t'}, {'category': None}, {'description': ''},
+        {'transaction_type': 'Income'}, {'transaction_type': 'other'}, {'transaction_type': ['income']},
+        {'date': None}, {'date': '2024-13-01'}, {'date': 20240101},
+        {'tags': None}, {'tags': []}, {'tags': 'a,b'}, {'tags': ('a',)}, {'tags': ['a', None]},
+    ]
+    rows = [{**good, **case} for case in edge_cases]
+    rows += [{k: v for k, v in good.items() if k != field} for field in good]
+    assert validate_transactions_batch(rows) == [tuple(transaction_errors(row)) for row in rows]
+
+
+def test_json_provider_matches_stdlib(client):
+    """Test the orjson and stdlib paths of the JSON provider encode the same document"""
+    from app.utils.json_provider import FastJSONProvider
+
+    app = client.application
+    doc = {'b': [1, 2.5, None], 'a': datetime(2024, 1, 2, 3, 4, 5, 6), 'c': 'naïve'}
+    fast = FastJSONProvider(app)
+    slow = FastJSONProvider(app)
+    slow.use_orjson = False
+
+    assert json.loads(fast.dumps(doc)) == json.loads(slow.dumps(doc)) == {
+        'a': '2024-01-02T03:04:05.000006', 'b': [1, 2.5, None], 'c': 'naïve'
+    }
+    assert fast.dumps(doc).index('"a"') < fast.dumps(doc).index('"b"')
+
+
+def test_columnar_listing_and_export(client):
+    """Test Arrow and Parquet responses carry the same rows as the JSON listing"""
+    pa = pytest.importorskip('pyarrow')
+    import pyarrow.parquet as pq
+
+    create(client, amount=10.5, tags=['monthly'])
+    create(client, amount=20.0, category='rent', date='2024-01-01T00:00:00')
+    expected = client.get('/api/v1/transactions').get_json()['data']
+
+    response = client.get('/api/v1/transactions',
+                          headers={'Accept': 'application/vnd.apache.arrow.stream'})
+    assert response.mimetype == 'application/vnd.apache.arrow.stream'
+    rows = pa.ipc.open_stream(response.data).read_all().to_pylist()
+    assert [(r['id'], r['amount'], r['tags']) for r in rows] == \
+        [(r['id'], r['amount'], r['tags']) for r in expected]
+
+    response = client.get('/api/v1/transactions?format=arrow&limit=1')
+    assert pa.ipc.open_stream(response.data).read_all().num_rows == 1
+    assert response.headers['X-Next-Cursor']
+
+    response = client.get('/api/v1/transactions/export?format=parquet&category=rent')
+    table = pq.read_table(io.BytesIO(response.data))
+    assert table.column('amount').to_pylist() == [20.0]
+    assert table.column('date').to_pylist() == [datetime(2024, 1, 1)]
+
+
+def test_async_api_matches_flask(monkeypatch, tmp_path):
+    """Test the async views return the same bodies as the Flask views and fall back to Flask"""
+    pytest.importorskip('starlette')
+    pytest.importorskip('aiosqlite')
+    from starlette.testclient import TestClient
+    from app.asgi import create_asgi_app
+
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'async.db'}")
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        limiter.reset()
+    flask_client = app.test_client()
+    create(flask_client, amount=12.5, tags=['monthly'])
+    create(flask_client, amount=3000, transaction_type='income', category='salary')
+
+    with TestClient(create_asgi_app(app)) as async_client:
+        for url in ('/api/v1/transactions', '/api/v1/transactions?limit=1',
+                    '/api/v1/transactions/summary', '/api/v1/transactions/export?format=csv',
+                    '/api/v1/transactions?start_date=not-a-date'):
+            assert async_client.get(url).content == flask_client.get(url).data, url
+
+        response = async_client.get('/api/v1/transactions/export?format=pdf')
+        assert response.status_code == 200 and response.content.startswith(b'%PDF')
+
+        response = async_client.post('/api/v1/transactions', json={
+            'amount': 1, 'category': 'food', 'description': 'Bridged', 'transaction_type': 'expense'})
+        assert response.status_code == 201
+        assert async_client.get('/api/v1/transactions/summary').json()['data']['total_transactions'] == 3
+
+
+def test_rate_limits_from_config_with_shared_sqlite_storage(monkeypatch, tmp_path):
+    """Test per-endpoint limits come from the environment and SQLite counters are shared"""
+    from limits import parse
+    from app.utils.rate_limits import SQLiteStorage
+
+    uri = f"sqlite:///{tmp_path / 'ratelimits.db'}"
+    monkeypatch.setenv('DATABASE_URL', 'sqlite://')
+    monkeypatch.setenv('RATELIMIT_STORAGE_URI', uri)
+    monkeypatch.setenv('RATELIMIT_SUMMARY', '2 per minute')
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        limiter.reset()
+
+    client = app.test_client()
+    assert [client.get('/api/v1/transactions/summary').status_code for _ in range(3)] == [200, 200, 429]
+    assert client.get('/api/v1/transactions').status_code == 200
+
+    # Two workers opening the same file draw from one sliding-window budget
+    strategy = type(limiter.limiter)
+    workers = [strategy(SQLiteStorage(uri)), strategy(SQLiteStorage(uri))]
+    item = parse('3 per minute')
+    assert [workers[i % 2].hit(item, 'shared', 'client') for i in range(5)] == [True, True, True, False, False]
+
+
+def test_rate_limits_with_redis_protocol_storage():
+    """Test the configured strategy against a Redis-protocol stand-in"""
+    fakeredis = pytest.importorskip('fakeredis')
+    import redis
+    from limits import parse
+    from limits.storage import storage_from_string
+    from limits.strategies import STRATEGIES
+
+    pool = redis.ConnectionPool(connection_class=fakeredis.FakeConnection, server=fakeredis.FakeServer())
+    storage = storage_from_string('redis://localhost:6379', connection_pool=pool)
+    for name in ('fixed-window', 'sliding-window-counter'):
+        strategy = STRATEGIES[name](storage)
+        assert [strategy.hit(parse('2 per minute'), name) for _ in range(3)] == [True, True, False]
+
+
+def test_request_log_records_are_structured_and_sampled(client, caplog):
+    """Test each request logs one structured record and successful requests can be sampled"""
+    import logging
+    from app.utils.logger import JSONFormatter
+
+    caplog.set_level(logging.INFO)
+    response = client.get('/health', headers={'X-Request-ID': 'req-42'})
+    assert response.headers['X-Request-ID'] == 'req-42'
+    [record] = [r for r in caplog.records if getattr(r, 'request_id', None) == 'req-42']
+    entry = json.loads(JSONFormatter().format(record))
+    assert entry['route'] == '/health' and entry['status'] == 200 and entry['message'].startswith('GET /health 200')
+
+    client.application.config['LOG_SAMPLE_RATE'] = 0
+    caplog.clear()
+    client.get('/health')
+    client.get('/api/v1/transactions/999999')
+    assert [r.status for r in caplog.records if hasattr(r, 'status')] == [404]
+
+
+def test_metrics_endpoint_reports_requests_queries_and_exports(client):
+    """Test /metrics exposes per-route latency, query counts and export sizes"""
+    from app.utils import metrics
+
+    metrics.registry.clear()
+    create(client)
+    client.get('/api/v1/transactions/1')
+    export = client.get('/api/v1/transactions/export?format=csv')
+    assert export.status_code == 200
+    export_size = len(export.data)
+
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert response.content_type.startswith('text/plain; version=0.0.4')
+    lines = response.get_data(as_text=True).splitlines()
+    assert ('http_request_duration_seconds_count{method="GET",route="/api/v1/transactions/<transaction_id>",'
+            'status="200"} 1') in lines
+    assert 'http_requests_in_flight{route="/api/v1/transactions/<transaction_id>"} 0' in lines
+    # The /metrics request itself is in flight while rendering
+    assert 'http_requests_in_flight{route="/metrics"} 1' in lines
+    assert 'db_queries_per_request_bucket{route="/api/v1/transactions/<transaction_id>",le="0.0"} 0' in lines
+    assert f'export_size_bytes_sum{{format="csv",mode="request"}} {float(export_size)}' in lines
+    assert 'export_duration_seconds_count{format="csv",mode="request"} 1' in lines
+
+
+def test_profiling_by_token_and_route_with_slow_query_log(monkeypatch, tmp_path, caplog):
+    """Test requests are profiled on a valid token or a listed route, and slow queries are logged"""
+    import logging
+    import pstats
+
+    monkeypatch.setenv('DATABASE_URL', 'sqlite://')
+    monkeypatch.setenv('PROFILE_TOKEN', 'secret')
+    monkeypatch.setenv('PROFILE_ROUTES', '/api/v1/transactions/export')
+    monkeypatch.setenv('PROFILE_DIR', str(tmp_path))
+    monkeypatch.setenv('SLOW_QUERY_MS', '0.000001')
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        limiter.reset()
+    client = app.test_client()
+    create(client, tags=['work'])
+
+    assert 'X-Profile-Id' not in client.get('/api/v1/transactions/summary', headers={'X-Profile': 'wrong'}).headers
+    response = client.get('/api/v1/transactions/summary', headers={'X-Profile': 'secret'})
+    assert response.status_code == 200
+    collapsed = (tmp_path / f"{response.headers['X-Profile-Id']}.collapsed").read_text()
+    assert all(line.rsplit(' ', 1)[1].isdigit() for line in collapsed.splitlines())
+
+    response = client.get('/api/v1/transactions/summary?category=food',
+                          headers={'X-Profile': 'secret', 'X-Profile-Mode': 'cprofile'})
+    stats = pstats.Stats(str(tmp_path / f"{response.headers['X-Profile-Id']}.pstats"))
+    assert any(name == 'get_transactions_summary' for _, _, name in stats.stats)
+
+    # Streamed exports are profiled until the body has been sent
+    caplog.set_level(logging.INFO)
+    response = client.get('/api/v1/transactions/export?format=csv&category=food')
+    response.get_data()
+    response.close()
+    assert (tmp_path / f"{response.headers['X-Profile-Id']}.collapsed").exists()
+
+    # Every query exceeds the threshold; the export's filter shows up as a bound parameter
+    assert any("'food'" in r.parameters for r in caplog.records if getattr(r, 'statement', None))
+
+
+def test_conditional_get_follows_ledger_version(client):
+    """Test read endpoints send ledger ETags, answer 304 until a mutation, and vary by Accept"""
+    created = create(client)
+
+    first = client.get('/api/v1/transactions/summary')
+    etag = first.headers['ETag']
+    assert first.status_code == 200 and not etag.startswith('W/') and first.headers['Last-Modified']
+
+    cached = client.get('/api/v1/transactions/summary', headers={'If-None-Match': etag})
+    assert cached.status_code == 304 and cached.data == b'' and cached.headers['ETag'] == etag
+    later = http_date(parse_date(first.headers['Last-Modified']) + timedelta(seconds=2))
+    assert client.get('/api/v1/transactions/summary', headers={'If-Modified-Since': later}).status_code == 304
+
+    listing = client.get('/api/v1/transactions')
+    assert client.get('/api/v1/transactions', headers={'If-None-Match': listing.headers['ETag']}).status_code == 304
+    arrow_etag = client.get('/api/v1/transactions', headers={'Accept': 'application/vnd.apache.arrow.stream'}).headers['ETag']
+    assert arrow_etag != listing.headers['ETag']
+
+    # Every mutation bumps the version, invalidating all validators
+    response = client.put(f"/api/v1/transactions/{created['id']}", json={
+        'amount': 5.0, 'category': 'food', 'description': 'Test transaction', 'transaction_type': 'expense',
+    })
+    assert response.status_code == 200
+    updated = client.get('/api/v1/transactions/summary', headers={'If-None-Match': etag})
+    assert updated.status_code == 200 and updated.headers['ETag'] != etag
+    assert client.get(f"/api/v1/transactions/{created['id']}",
+                      headers={'If-None-Match': updated.headers['ETag']}).status_code == 304
+
+
+def test_if_modified_since_misses_write_in_same_second(client):
+    """Test a write within the second of Last-Modified is not answered 304"""
+    create(client)
+    first = client.get('/api/v1/transactions')
+    assert client.get('/api/v1/transactions',
+                      headers={'If-Modified-Since': first.headers['Last-Modified']}).status_code == 200
+
+    create(client, description='Same second')
+    response = client.get('/api/v1/transactions', headers={'If-Modified-Since': first.headers['Last-Modified']})
+    assert response.status_code == 200
+    assert 'Same second' in [t['description'] for t in response.get_json()['data']]
+
+
+def test_response_cache_hits_invalidation_and_byte_budget(client):
+    """Test summary/listing responses are cached per normalized query, invalidated by mutations and size-bounded"""
+    from app.services.response_cache import CACHE_REQUESTS, LRUCache, RedisTier, response_cache
+
+    def lookups(result):
+        return CACHE_REQUESTS._series.get(('summary', result), 0)
+
+    create(client, category='Food', tags=['work'])
+    hits, misses = lookups('hit'), lookups('miss')
+    first = client.get('/api/v1/transactions/summary?category=Food&tag=work')
+    second = client.get('/api/v1/transactions/summary?tag=work&category=food&_=123')
+    assert second.data == first.data and (lookups('hit'), lookups('miss')) == (hits + 1, misses + 1)
+
+    page = client.get('/api/v1/transactions?limit=1')
+    assert client.get('/api/v1/transactions?limit=1').data == page.data
+
+    # A mutation drops local entries and moves the key to the new ledger version
+    create(client, category='food', amount=50.0)
+    assert len(response_cache.local) == 0
+    summary = json.loads(client.get('/api/v1/transactions/summary?category=food').data)['data']
+    assert summary['total_transactions'] == 2
+
+    # Memory is bounded by bytes: the least recently used entry goes first
+    lru = LRUCache(max_bytes=4000, ttl=60)  # three 900-byte entries plus bookkeeping
+    for key in 'abc':
+        lru.set(key, key, 900)
+    lru.get('a')
+    lru.set('d', 'd', 900)
+    assert lru.get('b') is None and lru.get('a') == 'a' and lru.size <= 4000
+    assert not lru.set('huge', 'x', 5000)
+
+    # A shared tier lets another worker reuse the rendered body
+    fakeredis = pytest.importorskip('fakeredis')
+    response_cache.shared = RedisTier(None, 60, client=fakeredis.FakeRedis())
+    try:
+        body = client.get('/api/v1/transactions/summary?transaction_type=expense').data
+        response_cache.local.clear()
+        hits = lookups('shared_hit')
+        assert client.get('/api/v1/transactions/summary?transaction_type=EXPENSE').data == body
+        assert lookups('shared_hit') == hits + 1
+    finally:
+        response_cache.shared = None
+
+
+def test_transaction_changes_feed(client):
+    """Test the change feed returns rows upserted and deleted since a version, paged and epoch-checked"""
+    first, second, third = create(client, amount=1.0), create(client, amount=2.0), create(client, amount=3.0)
+
+    snapshot = json.loads(client.get('/api/v1/transactions/changes?limit=2').data)
+    assert [row['id'] for row in snapshot['data']['upserted']] == [first['id'], second['id']]
+    assert snapshot['data']['deleted'] == [] and snapshot['next_cursor']
+    rest = json.loads(client.get(f"/api/v1/transactions/changes?limit=2&cursor={snapshot['next_cursor']}").data)
+    assert [row['id'] for row in rest['data']['upserted']] == [third['id']] and rest['next_cursor'] is None
+    version, epoch = snapshot['version'], snapshot['epoch']
+
+    # Nothing changed: an empty delta
+    unchanged = json.loads(client.get(f'/api/v1/transactions/changes?since={version}&epoch={epoch}').data)
+    assert unchanged['data'] == {'upserted': [], 'deleted': []} and unchanged['version'] == version
+
+    client.put(f"/api/v1/transactions/{first['id']}", json={
+        'amount': 10.0, 'category': 'food', 'description': 'Test transaction', 'transaction_type': 'expense',
+    })
+    client.delete(f"/api/v1/transactions/{second['id']}")
+    client.post('/api/v1/transactions/bulk', json=[{
+        'amount': 4.0, 'category': 'rent', 'description': 'Bulk', 'transaction_type': 'expense',
+    }])
+    delta = json.loads(client.get(f'/api/v1/transactions/changes?since={version}&epoch={epoch}').data)
+    assert [(row['id'], row['amount']) for row in delta['data']['upserted']][0] == (first['id'], 10.0)
+    assert [row['category'] for row in delta['data']['upserted']][1:] == ['rent']
+    assert delta['data']['deleted'] == [second['id']] and delta['version'] == version + 3
+
+    # A different epoch means the client's copy belongs to another database
+    assert client.get(f'/api/v1/transactions/changes?since={version}&epoch=other').status_code == 410
+    assert client.get('/api/v1/transactions/changes?since=abc').status_code == 400
+
+
+def test_transaction_lookup_typeahead(client):
+    """Test the picker lookup matches id, category and description prefixes, best first and bounded"""
+    groceries = create(client, category='Food', description='Groceries at market', date='2024-01-01T10:00:00')
+    dinner = create(client, category='food', description='Dinner out', date='2024-02-01T10:00:00')
+    rent = create(client, category='rent', description='Flat rent', transaction_type='expense')
+
+    def lookup(query, **params):
+        response = client.get('/api/v1/transactions/lookup', query_string=dict(params, q=query))
+        return [row['id'] for row in json.loads(response.data)['data']]
+
+    assert lookup('FO') == [dinner['id'], groceries['id']]
+    assert lookup('groc') == [groceries['id']]
+    assert lookup('fla') == [rent['id']]
+    # An id ranks ahead of prefix matches
+    assert lookup(str(rent['id']))[0] == rent['id']
+    assert lookup('', limit=2) == [rent['id'], dinner['id']]
+    assert lookup('zzz') == []
+
+    assert client.get('/api/v1/transactions/lookup?limit=500').status_code == 400
+    assert client.get('/api/v1/transactions/lookup', query_string={'q': 'x' * 101}).status_code == 400
+
+
+def test_full_text_search_ranked_paginated_and_synced(client):
+    """Test search matches word prefixes, ranks category hits first, pages, filters and follows mutations"""
+    groceries = create(client, category='food', description='Groceries at the market')
+    market = create(client, category='market', description='Stall fees', transaction_type='investment')
+    cafe = create(client, category='Café', description='Crème brûlée')
+
+    def search(**params):
+        return json.loads(client.get('/api/v1/transactions/search', query_string=params).data)
+
+    result = search(q='market')
+    assert [row['id'] for row in result['data']] == [market['id'], groceries['id']] and result['total'] == 2
+    assert [row['id'] for row in search(q='groc mark')['data']] == [groceries['id']]
+    assert [row['id'] for row in search(q='cafe creme')['data']] == [cafe['id']]
+    assert [row['id'] for row in search(q='market', transaction_type='expense')['data']] == [groceries['id']]
+    # Query syntax is not passed through
+    assert search(q='"market" OR')['total'] == 0
+
+    first = search(q='market', limit=1)
+    second = search(q='market', limit=1, offset=first['next_offset'])
+    assert [row['id'] for row in first['data'] + second['data']] == [market['id'], groceries['id']]
+    assert second['next_offset'] is None
+
+    # The index follows updates and deletes
+    client.put(f"/api/v1/transactions/{groceries['id']}", json={
+        'amount': 5.0, 'category': 'food', 'description': 'Supermarket run', 'transaction_type': 'expense',
+    })
+    client.delete(f"/api/v1/transactions/{market['id']}")
+    assert search(q='market')['total'] == 0
+    assert [row['id'] for row in search(q='supermarket')['data']] == [groceries['id']]
+    assert search()['total'] == 2
+
+
+def test_search_falls_back_to_like_without_full_text(client, monkeypatch):
+    """Test search on a database without full-text support matches case-folded substrings, newest first"""
+    from app.services import search
+
+    ranked_statement = search._ranked_statement
+    monkeypatch.setattr(search, '_ranked_statement', lambda words, dialect: ranked_statement(words, 'mysql'))
+    groceries = create(client, category='food', description='Groceries at the MARKET')
+    market = create(client, category='Market', description='Stall fees')
+    underscored = create(client, category='food', description='grocery_xmarket')
+
+    def search_ids(q):
+        return [row['id'] for row in json.loads(client.get('/api/v1/transactions/search', query_string={'q': q}).data)['data']]
+
+    assert search_ids('market') == [underscored['id'], market['id'], groceries['id']]
+    assert search_ids('groc mark') == [underscored['id'], groceries['id']]
+    assert search_ids('stall MARKET') == [market['id']]
+    # LIKE wildcards in the words are matched literally
+    assert search_ids('ries_at') == []
+
+
+def test_analytics_timeseries_buckets_and_groups(client):
+    """Test the time series sums per bucket and group, from rollups or the ledger alike"""
+    create(client, amount=5000.0, transaction_type='income', category='salary', date='2024-01-31T09:00:00')
+    create(client, amount=-100.0, category='food', date='2024-01-01T12:00:00')
+    create(client, amount=-50.5, category='rent', date='2024-03-03T12:00:00')
+
+    def timeseries(**params):
+        response = client.get('/api/v1/analytics/timeseries', query_string=params)
+        return response.status_code, json.loads(response.data).get('data')
+
+    status, monthly = timeseries()
+    assert status == 200 and monthly['periods'] == ['2024-01-01', '2024-03-01']
+    assert monthly['series'] == {
+        'expense': {'amount': [-100.0, -50.5], 'count': [1, 1]},
+        'income': {'amount': [5000.0, 0], 'count': [1, 0]},
+    }
+
+    # 2024-01-01 is a Monday; 2024-03-03 a Sunday
+    _, weekly = timeseries(bucket='week', group_by='category')
+    assert weekly['periods'] == ['2024-01-01', '2024-01-29', '2024-02-26']
+    assert weekly['series']['rent']['amount'] == [0, 0, -50.5]
+
+    # An end date is not served from rollups; the ledger query agrees
+    _, daily = timeseries(bucket='day', transaction_type='expense')
+    _, daily_ledger = timeseries(bucket='day', transaction_type='expense', end_date='2030-01-01T00:00:00')
+    assert daily == daily_ledger and daily['periods'] == ['2024-01-01', '2024-03-03']
+
+    assert timeseries(bucket='year')[0] == 400
+    assert timeseries(group_by='description')[0] == 400
+
+
+def test_ai_response_cache_with_stub_model(tmp_path):
+    """Test AI answers are reused per (query, summary, model), persisted, expired by TTL and LRU-bounded"""
+    from frontend.ai_cache import AIResponseCache, cache_key
+
+    class StubModel:
+        calls = 0
+
+        def generate_content(self, prompt):
+            StubModel.calls += 1
+            return type('Response', (), {'text': f"answer {StubModel.calls}"})()
+
+    now = [1000.0]
+    path = str(tmp_path / 'ai.db')
+    cache = AIResponseCache(path, ttl=60, max_entries=2, clock=lambda: now[0])
+    model, summary = StubModel(), {'net_balance': 1200.0, 'categories': {'food': {'total_amount': 80.0}}}
+
+    assert cache.get_or_generate('Tips please', summary, model, 'prompt', 'gemini') == ('answer 1', False)
+    # Case, whitespace, key order and sub-paise noise do not matter
+    same = {'categories': {'food': {'total_amount': 80.0000001}}, 'net_balance': 1200.0}
+    assert cache.get_or_generate('  tips   PLEASE ', same, model, 'prompt', 'gemini') == ('answer 1', True)
+    assert StubModel.calls == 1
+    # A different summary or model is a different question
+    assert cache_key('tips please', dict(summary, net_balance=1300.0), 'gemini') != cache_key('tips please', summary, 'gemini')
+    assert cache_key('tips please', summary, 'other-model') != cache_key('tips please', summary, 'gemini')
+
+    # Survives a restart
+    assert AIResponseCache(path, ttl=60, max_entries=2, clock=lambda: now[0]).get(
+        cache_key('tips please', summary, 'gemini')) == 'answer 1'
+
+    # Expires after the TTL
+    now[0] += 61
+    assert cache.get_or_generate('Tips please', summary, model, 'prompt', 'gemini') == ('answer 2', False)
+
+    # The least recently used entry is evicted beyond max_entries
+    for query in ('a', 'b'):
+        now[0] += 1
+        cache.set(query, query)
+    now[0] += 1
+    cache.get('a')
+    now[0] += 1
+    cache.set('c', 'c')
+    assert len(cache) == 2 and cache.get('b') is None and cache.get('a') == 'a'
@@ -0,0 +1,13 @@
+"""
+FinanceAI-Advisor WSGI Entry Point
+
+Production servers load the application from here instead of run.py, which
+starts the single-process development server:
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+from app import create_app
+
+# Create Flask application instance
+app = create_app()